@@ -0,0 +1,155 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	import sqlite3
+	import tempfile
+	import time
+	from pathlib import Path
+	from sqlite3 import Connection
+
+	project_path = str(Path(__file__).parent.parent.parent)
+	if project_path not in sys.path:
+		sys.path.append(project_path)
+
+	from common.db_connect import apply_pragmas, db_absolute, set_connection
+	from common.db_queries.driver_tables import add_drivers
+	from common.db_queries.entity_table import get_entity_type_id
+	from common.models.driver import Driver
+	from common.schema.migrations import upgrade_schema
+
+# Id of Wikipedia version whose links are added
+wiki_id: int = 1
+
+
+# Copies the database into a file in given directory, so imports are timed with real commits but don't change it
+def copy_database(directory: str, name: str) -> Connection:
+	source: Connection = sqlite3.connect(f'file:{db_absolute}?mode=ro', uri=True)
+	db: Connection = sqlite3.connect(Path(directory, name))
+
+	try:
+		source.backup(db)
+	finally:
+		source.close()
+
+	apply_pragmas(db)
+	upgrade_schema(db)
+
+	return db
+
+
+# Creates drivers which aren't in the database yet
+def create_drivers(drivers_number: int) -> list[Driver]:
+	return [
+		Driver(
+			codename=f'benchmark driver {x}',
+			nationality='FRA',
+			short_link=f'[[Benchmark Driver {x}]]',
+			long_link=''
+		)
+		for x in range(drivers_number)
+	]
+
+
+# Adds drivers the way it was done before, with a transaction and a search for the newest entity's id for each driver
+def add_drivers_per_transaction(db: Connection, drivers: list[Driver], type_id: int) -> None:
+	for driver in drivers:
+		with db:
+			db.execute('BEGIN')
+
+			driver_id_db: tuple | None = db.execute(
+				'SELECT id FROM driver WHERE codename = :codename;', {'codename': driver.codename}
+			).fetchone()
+
+			if driver_id_db is None:
+				db.execute('INSERT INTO entity (type_id) VALUES (:type_id)', {'type_id': type_id})
+
+				driver_id: int = int(db.execute(
+					'SELECT MAX(id) FROM entity WHERE type_id = :type_id', {'type_id': type_id}
+				).fetchone()[0])
+
+				db.execute(
+					'INSERT INTO driver (id, codename, flag) VALUES (:id, :codename, :nationality)',
+					{'id': driver_id, 'codename': driver.codename, 'nationality': driver.nationality}
+				)
+			else:
+				driver_id: int = driver_id_db[0]
+
+				result = db.execute(
+					'SELECT short_link, long_link FROM driver_wikipedia WHERE driver_id = ? AND wikipedia_id = ?;',
+					(driver_id, wiki_id)
+				).fetchone()
+
+				if result is not None:
+					db.execute('ROLLBACK')
+					continue
+
+			db.execute(
+				'''
+					INSERT INTO driver_wikipedia (wikipedia_id, driver_id, short_link, long_link)
+					VALUES (:wikipedia_id, :driver_id, :short_link, :long_link);
+				''',
+				{
+					'wikipedia_id': wiki_id,
+					'driver_id': driver_id,
+					'short_link': driver.short_link,
+					'long_link': driver.long_link
+				}
+			)
+
+			db.execute('COMMIT')
+
+
+# Gets added drivers with their links
+def get_added_drivers(db: Connection) -> list[tuple]:
+	query = '''
+		SELECT d.id, d.codename, d.flag, dw.short_link, dw.long_link
+		FROM driver d
+		JOIN driver_wikipedia dw
+		ON dw.driver_id = d.id
+		WHERE d.codename LIKE 'benchmark driver %'
+		AND dw.wikipedia_id = :wiki
+		ORDER BY d.id;
+	'''
+
+	return db.execute(query, {'wiki': wiki_id}).fetchall()
+
+
+# Compares time of adding new drivers one by one and in one transaction
+def run_benchmark() -> None:
+	for drivers_number in [50, 500]:
+		drivers: list[Driver] = create_drivers(drivers_number)
+
+		with tempfile.TemporaryDirectory() as directory:
+			old_db: Connection = copy_database(directory, 'previous.db')
+			new_db: Connection = copy_database(directory, 'current.db')
+
+			set_connection(new_db)
+
+			type_id: int = get_entity_type_id('driver')
+
+			start: float = time.perf_counter()
+			add_drivers_per_transaction(old_db, drivers, type_id)
+			old_time: float = time.perf_counter() - start
+
+			start = time.perf_counter()
+			add_drivers(drivers, wiki_id, type_id)
+			new_time: float = time.perf_counter() - start
+
+			if get_added_drivers(old_db) != get_added_drivers(new_db):
+				print(f'Drivers: {drivers_number} - implementations saved different data')
+
+			set_connection(None)
+			old_db.close()
+			new_db.close()
+
+		print(
+			f'Drivers: {drivers_number} - previous: {old_time * 1000:.1f} ms, '
+			f'current: {new_time * 1000:.1f} ms, speedup: {old_time / new_time:.1f}x'
+		)
+
+
+if __name__ == '__main__':
+	run_benchmark()
@@ -0,0 +1,100 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	import re
+	import timeit
+	from pathlib import Path
+
+	project_path = str(Path(__file__).parent.parent.parent)
+	if project_path not in sys.path:
+		sys.path.append(project_path)
+
+	from common.db_connect import use_snapshot
+	from common.db_queries.manufacturer_table import get_manufacturers
+	from common.models.manufacturer import Manufacturer, ManufacturerMatcher
+
+# Vehicles as they're written in results files, repeated to get a size of a few full-grid sessions
+vehicles: list[str] = [
+	'Porsche 963', 'Toyota GR010 - Hybrid', 'Ferrari 499P', 'Alpine A424', 'BMW M Hybrid V8',
+	'Lamborghini SC63', 'Peugeot 9X8', 'Isotta Fraschini Tipo6-C', 'Cadillac V-Series.R',
+	'Aston Martin Vantage AMR LMGT3', 'Porsche 911 GT3 R LMGT3', 'Ferrari 296 LMGT3',
+	'BMW M4 LMGT3', 'Lexus RC F LMGT3', 'McLaren 720S LMGT3 Evo', 'Ford Mustang LMGT3'
+] * 50
+
+
+# Manufacturers whose codenames overlap in vehicles' names, with the one which should be found
+overlapping_codenames: list[tuple[list[str], str, str]] = [
+	(['Aston', 'Martin Vantage'], 'Aston Martin Vantage AMR LMGT3', 'Martin Vantage'),
+	(['Ford', 'Ford Mustang'], 'Ford Mustang LMGT3', 'Ford Mustang'),
+	(['Mc', 'McLaren'], 'McLaren 720S LMGT3 Evo', 'McLaren'),
+	(['Alpine', 'Pine A424'], 'Alpine A424', 'Pine A424')
+]
+
+
+# Checks that matcher finds the longest codename, also when it overlaps with a shorter one found earlier
+def check_overlapping_codenames() -> bool:
+	global overlapping_codenames
+
+	correct: bool = True
+
+	for codenames, vehicle, expected in overlapping_codenames:
+		matcher = ManufacturerMatcher([Manufacturer(i, c, '') for i, c in enumerate(codenames)])
+		found: Manufacturer | None = matcher.find(vehicle)
+
+		if found is None or found.codename != expected:
+			print(f'Matcher found {found.codename if found is not None else None} instead of {expected} in {vehicle}')
+			correct = False
+
+	return correct
+
+
+# Finds manufacturer the way results files were read before, by searching every codename in every row
+def find_by_loop(manufacturers: list[Manufacturer], vehicle: str) -> Manufacturer | None:
+	for m in manufacturers:
+		if re.search(m.codename, vehicle, re.IGNORECASE):
+			return m
+
+	return None
+
+
+# Compares time of matching manufacturers in all vehicles with loop and with matcher
+def run_benchmark(repeats: int = 20) -> None:
+	# Manufacturers are read from an in-memory copy, so the benchmark doesn't open database.db for writing
+	if not use_snapshot():
+		return
+
+	manufacturers: list[Manufacturer] | None = get_manufacturers()
+
+	if manufacturers is None:
+		return
+
+	if not check_overlapping_codenames():
+		return
+
+	matcher = ManufacturerMatcher(manufacturers)
+
+	different: list[str] = [
+		v for v in vehicles if find_by_loop(manufacturers, v) is not matcher.find(v)
+	]
+
+	if len(different) > 0:
+		print(f'Loop and matcher found different manufacturers for: {", ".join(sorted(set(different)))}')
+
+	loop_time: float = timeit.timeit(
+		lambda: [find_by_loop(manufacturers, v) for v in vehicles], number=repeats
+	)
+	matcher_time: float = timeit.timeit(
+		lambda: [matcher.find(v) for v in vehicles], number=repeats
+	)
+
+	print(f'Manufacturers: {len(manufacturers)}, rows: {len(vehicles)}, repeats: {repeats}')
+	print(f'Loop: {loop_time * 1000:.1f} ms')
+	print(f'Matcher: {matcher_time * 1000:.1f} ms')
+	print(f'Speedup: {loop_time / matcher_time:.1f}x')
+
+
+if __name__ == '__main__':
+	run_benchmark()
@@ -0,0 +1,303 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	import time
+	from pathlib import Path
+
+	project_path = str(Path(__file__).parent.parent.parent)
+	if project_path not in sys.path:
+		sys.path.append(project_path)
+
+	from common.models.classifications import Classification, ClassificationScoring, EligibleClassifications
+	from common.models.manufacturer import Manufacturer, ManufacturerScoringCars
+	from common.models.points import AwardedPoints
+	from common.models.results import ResultRow
+	from common.models.scoring import SessionScoring
+	from common.models.styles import Style, StyledPosition, StyledStatus
+	from common.models.teams import Team
+
+# Fixture resembling a race of World Endurance Championship, cars of each category get its classifications
+categories: list[str] = ['HYPERCAR', 'LMGT3']
+statuses: list[str] = ['Classified'] * 8 + ['Not classified', 'Retired', 'Disqualified']
+
+classifications: list[Classification] = [
+	Classification(db_id=1, name='HYPERCAR Drivers', championship_id=1, cl_type='DRIVERS'),
+	Classification(db_id=2, name='HYPERCAR Teams', championship_id=1, cl_type='TEAMS'),
+	Classification(db_id=3, name='HYPERCAR Manufacturers', championship_id=1, cl_type='MANUFACTURERS'),
+	Classification(db_id=4, name='LMGT3 Drivers', championship_id=1, cl_type='DRIVERS'),
+	Classification(db_id=5, name='LMGT3 Teams', championship_id=1, cl_type='TEAMS')
+]
+
+oem_classifications_scoring: list[ClassificationScoring] = [ClassificationScoring('HYPERCAR Manufacturers', 2)]
+
+manufacturers: list[Manufacturer] = [
+	Manufacturer(db_id=x, codename=f'Manufacturer {x}', flag='FRA') for x in range(1, 11)
+]
+
+scoring_styles: list[StyledPosition] = [
+	StyledPosition(db_id=x, position=x, points=float(max(25 - 3 * (x - 1), 1)), style=Style('#DFDFDF', False, None, x))
+	for x in range(1, 11)
+]
+
+nonscoring_styles: list[StyledStatus] = [
+	StyledStatus(status=status, style=Style('#CFCFFF', False, None, 20 + x))
+	for x, status in enumerate(['Classified, nonscoring', 'Not classified', 'Retired', 'Disqualified'])
+]
+
+
+# Creates rows of session's results, row's classifications are already found
+def create_rows(rows_number: int) -> list[ResultRow]:
+	rows: list[ResultRow] = list()
+
+	for x in range(rows_number):
+		category: str = categories[x % len(categories)]
+		category_cls = [cl for cl in classifications if cl.name.startswith(category)]
+		manufacturer_cl = next((cl for cl in category_cls if cl.cl_type == 'MANUFACTURERS'), None)
+
+		rows.append(ResultRow(
+			drivers=[],
+			status=statuses[x % len(statuses)] if x > rows_number // 2 else 'Classified',
+			team=Team(codename=f'#{x} Team', db_id=x),
+			manufacturer=manufacturers[x % len(manufacturers)] if manufacturer_cl is not None else None,
+			eligible_classifications=EligibleClassifications(
+				driver_cl=next(cl for cl in category_cls if cl.cl_type == 'DRIVERS'),
+				team_cl=next(cl for cl in category_cls if cl.cl_type == 'TEAMS'),
+				manufacturer_cl=manufacturer_cl
+			)
+		))
+
+	return rows
+
+
+# Finds style and points of result the way it was done before, by scanning lists of styles
+def find_result_style_by_scans(
+	status: str, position: int, scoring_styles: list[StyledPosition],
+	nonscoring_styles: list[StyledStatus], session: str
+) -> tuple[int | None, float] | None:
+	match status:
+		case 'Classified':
+			style_id: int = next(
+				(v.style.db_id for v in scoring_styles if v.position == position),
+				None
+			)
+			points: float = next(
+				(v.points for v in scoring_styles if v.position == position),
+				None
+			)
+
+			if style_id is None:
+				# Nonscoring positions in qualifying sessions won't get any style
+				if session.upper() != 'QUALIFYING':
+					style_id = next(
+						(v.style.db_id for v in nonscoring_styles if v.status == "Classified, nonscoring")
+					)
+				points = 0.0
+
+			return style_id, points
+		case 'Not classified':
+			style_id: int = next(
+				(v.style.db_id for v in nonscoring_styles if v.status == "Not classified")
+			)
+
+			return style_id, 0.0
+		case 'Retired':
+			style_id = next(
+				(v.style.db_id for v in nonscoring_styles if v.status == "Retired")
+			)
+
+			return style_id, 0.0
+		case 'Disqualified':
+			style_id: int | None = None
+
+			# Entries disqualified from qualifying sessions will be ignored
+			if session.upper() != 'QUALIFYING':
+				style_id: int = next(
+					(v.style.db_id for v in nonscoring_styles if v.status == "Disqualified")
+				)
+
+			return style_id, 0.0
+		case _:
+			return None
+
+
+# Calculates positions the way it was done before, with lists of manufacturers' scoring cars and scans of styles
+def calculate_positions_by_scans(
+	rows: list[ResultRow], classifications: list[Classification],
+	scoring_styles: list[StyledPosition], nonscoring_styles: list[StyledStatus],
+	session: str, oem_classifications_scoring: list[ClassificationScoring],
+	awarded_points: AwardedPoints, manufacturers: list[Manufacturer]
+) -> list[ResultRow]:
+	positions: dict[str, int] = dict()
+	nonscoring_statuses: list[str] = [x.status for x in nonscoring_styles]
+
+	manufacturers_scoring_cars: list[ManufacturerScoringCars] = list()
+
+	if len(oem_classifications_scoring) > 0:
+		for oem in manufacturers:  # type: Manufacturer
+			manufacturers_scoring_cars.append(ManufacturerScoringCars(
+				manufacturer=oem,
+				classifications=oem_classifications_scoring
+			))
+
+	for cl in classifications:
+		positions.update({f'{cl.name}': 1})
+
+	for row in rows:  # type: ResultRow
+		if row.eligible_classifications.team_cl is not None:
+			team_position = positions.get(row.eligible_classifications.team_cl.name)
+
+			# Finding styles and points
+			found: tuple[int | None, float] | None = find_result_style_by_scans(
+				status=row.status,
+				position=team_position,
+				scoring_styles=scoring_styles,
+				nonscoring_styles=nonscoring_styles,
+				session=session
+			)
+
+			if found is not None:
+				if found[0] is not None:
+					row.eligible_classifications.team_style_id = found[0]
+					row.eligible_classifications.team_points = found[1] * awarded_points.multiplier
+
+					if row.status not in nonscoring_statuses:
+						row.eligible_classifications.team_position = team_position
+						positions[f'{row.eligible_classifications.team_cl.name}'] += 1
+					else:
+						row.eligible_classifications.team_position = row.status
+		if row.eligible_classifications.manufacturer_cl is not None:
+			oem_position = positions.get(row.eligible_classifications.manufacturer_cl.name)
+
+			oem_scoring: ManufacturerScoringCars = next(
+				(x for x in manufacturers_scoring_cars if x.manufacturer.db_id == row.manufacturer.db_id)
+			)
+
+			scoring_found: ClassificationScoring = next(
+				(x for x in oem_scoring.classifications if x.name == row.eligible_classifications.manufacturer_cl.name)
+			)
+
+			# If manufacturer's car(s) can still score
+			if scoring_found.scoring_entities > 0:
+				manufacturers_scoring_cars.pop(
+					manufacturers_scoring_cars.index(oem_scoring)
+				)
+
+				oem_scoring.classifications.pop(
+					oem_scoring.classifications.index(scoring_found)
+				)
+
+				scoring_found.scoring_entities -= 1
+
+				oem_scoring.classifications.append(scoring_found)
+
+				manufacturers_scoring_cars.append(oem_scoring)
+
+				# Finding styles and points
+				found: tuple[int | None, float] | None = find_result_style_by_scans(
+					status=row.status,
+					position=oem_position,
+					scoring_styles=scoring_styles,
+					nonscoring_styles=nonscoring_styles,
+					session=session
+				)
+
+				if found is not None:
+					if found[0] is not None:
+						row.eligible_classifications.manufacturer_style_id = found[0]
+						row.eligible_classifications.manufacturer_points = found[1] * awarded_points.multiplier
+
+						if row.status not in nonscoring_statuses:
+							row.eligible_classifications.manufacturer_position = oem_position
+						else:
+							row.eligible_classifications.manufacturer_position = row.status
+			positions[f'{row.eligible_classifications.manufacturer_cl.name}'] += 1
+		if row.eligible_classifications.driver_cl is not None:
+			driver_position = positions.get(row.eligible_classifications.driver_cl.name)
+
+			# Finding styles and points
+			found: tuple[int | None, float] | None = find_result_style_by_scans(
+				status=row.status,
+				position=driver_position,
+				scoring_styles=scoring_styles,
+				nonscoring_styles=nonscoring_styles,
+				session=session
+			)
+
+			if found is not None:
+				if found[0] is not None:
+					row.eligible_classifications.driver_style_id = found[0]
+					row.eligible_classifications.driver_points = found[1] * awarded_points.multiplier
+
+					if row.status not in nonscoring_statuses:
+						row.eligible_classifications.driver_position = driver_position
+						positions[f'{row.eligible_classifications.driver_cl.name}'] += 1
+					else:
+						row.eligible_classifications.driver_position = row.status
+	return rows
+
+
+# Calculates positions with scoring engine
+def calculate_positions(rows: list[ResultRow], session: str) -> list[ResultRow]:
+	scoring = SessionScoring(
+		classifications=classifications,
+		scoring_styles=scoring_styles,
+		nonscoring_styles=nonscoring_styles,
+		session=session,
+		oem_classifications_scoring=oem_classifications_scoring,
+		awarded_points=AwardedPoints.FULL
+	)
+
+	for row in rows:  # type: ResultRow
+		scoring.score_row(row)
+
+	return rows
+
+
+# Returns calculated positions, styles and points of all rows
+def get_results(rows: list[ResultRow]) -> list[tuple]:
+	return [
+		(
+			row.eligible_classifications.driver_position, row.eligible_classifications.driver_style_id,
+			row.eligible_classifications.driver_points, row.eligible_classifications.team_position,
+			row.eligible_classifications.team_style_id, row.eligible_classifications.team_points,
+			row.eligible_classifications.manufacturer_position, row.eligible_classifications.manufacturer_style_id,
+			row.eligible_classifications.manufacturer_points
+		)
+		for row in rows
+	]
+
+
+# Compares time of calculating positions in sessions of different sizes with previous and current implementation
+def run_benchmark(repeats: int = 5) -> None:
+	for rows_number in [60, 600, 6000]:
+		for session in ['RACE', 'QUALIFYING']:
+			old_rows: list[list[ResultRow]] = [create_rows(rows_number) for _ in range(repeats)]
+			new_rows: list[list[ResultRow]] = [create_rows(rows_number) for _ in range(repeats)]
+
+			start: float = time.perf_counter()
+			for rows in old_rows:
+				calculate_positions_by_scans(
+					rows, classifications, scoring_styles, nonscoring_styles, session,
+					oem_classifications_scoring, AwardedPoints.FULL, manufacturers
+				)
+			old_time: float = time.perf_counter() - start
+
+			start = time.perf_counter()
+			for rows in new_rows:
+				calculate_positions(rows, session)
+			new_time: float = time.perf_counter() - start
+
+			if get_results(old_rows[0]) != get_results(new_rows[0]):
+				print(f'{session}, {rows_number} rows: implementations calculated different results')
+
+			print(
+				f'{session}, rows: {rows_number}, repeats: {repeats} - previous: {old_time * 1000:.1f} ms, '
+				f'current: {new_time * 1000:.1f} ms, speedup: {old_time / new_time:.1f}x'
+			)
+
+
+if __name__ == '__main__':
+	run_benchmark()
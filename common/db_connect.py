@@ -1,3 +1,4 @@
+import atexit
 import sqlite3
 import sys
 from sqlite3 import Connection
@@ -12,13 +13,134 @@ project_dir = next(p for p in current_dir.parents if p.name == "wikipedia-tools"
 common_dir = Path.joinpath(project_dir, 'common')
 db_absolute = Path.joinpath(common_dir, 'database.db')
 
+# Settings applied once when the shared connection is opened.
+# The database is a single-user file versioned in git, so rollback journal is used instead of WAL.
+# WAL mode would be saved in the file itself and recent writes could stay in database.db-wal until a checkpoint,
+# while with deleted journal every committed transaction is already in database.db.
+connection_pragmas: dict[str, str | int] = {
+	'journal_mode': 'DELETE',
+	'synchronous': 'NORMAL',
+	'cache_size': -16000,
+	'mmap_size': 268435456,
+	'temp_store': 'MEMORY'
+}
 
-# Returns the connection to the database
-def db_connection() -> Connection | None:
+# Connection shared by all queries executed within the process
+shared_db: Connection | None = None
+
+# Whether the shared connection is an in-memory copy of the database
+snapshot_mode: bool = False
+
+
+# Applies tuned settings to given connection
+def apply_pragmas(db: Connection) -> None:
+	global connection_pragmas
+
+	for pragma, value in connection_pragmas.items():
+		db.execute(f'PRAGMA {pragma} = {value};')
+
+
+# Opens a new connection to the database, returns None if it can't be opened or its schema is out of date
+def open_connection() -> Connection | None:
+	from common.schema.migrations import check_schema_version
 	global db_absolute
 
+	db: Connection | None = None
+
 	try:
-		db: Connection = sqlite3.connect(f'file:{db_absolute}?mode=rw', uri=True)
-	except sqlite3.Error as err:
-		return None
-	return db
+		db = sqlite3.connect(f'file:{db_absolute}?mode=rw', uri=True)
+		apply_pragmas(db)
+
+		if check_schema_version(db):
+			return db
+	except sqlite3.Error as e:
+		print(f'An error occurred while opening the database - {e.__str__()}')
+
+	if db is not None:
+		db.close()
+
+	return None
+
+
+# Opens an in-memory copy of the database made with backup API.
+# Queries are served from RAM and don't wait for locks held by other processes, changes aren't saved to the file.
+def open_snapshot() -> Connection | None:
+	from common.schema.migrations import check_schema_version
+	global db_absolute
+
+	db: Connection | None = None
+
+	try:
+		source: Connection = sqlite3.connect(f'file:{db_absolute}?mode=ro', uri=True)
+		db = sqlite3.connect(':memory:')
+
+		try:
+			source.backup(db)
+		finally:
+			source.close()
+
+		if check_schema_version(db):
+			return db
+	except sqlite3.Error as e:
+		print(f'An error occurred while copying the database - {e.__str__()}')
+
+	if db is not None:
+		db.close()
+
+	return None
+
+
+# Replaces the shared connection with an in-memory copy of the database, used by scripts which only read data
+def use_snapshot() -> bool:
+	global shared_db, snapshot_mode
+
+	db: Connection | None = open_snapshot()
+
+	if db is None:
+		return False
+
+	close_connection()
+
+	shared_db = db
+	snapshot_mode = True
+
+	return True
+
+
+# Checks whether the shared connection is an in-memory copy of the database
+def is_snapshot() -> bool:
+	global snapshot_mode
+
+	return snapshot_mode
+
+
+# Returns the connection to the database, it's opened once and then reused by every query
+def db_connection() -> Connection | None:
+	global shared_db
+
+	if shared_db is None:
+		shared_db = open_connection()
+
+	return shared_db
+
+
+# Replaces the shared connection, e.g. with an in-memory database in tests and benchmarks
+def set_connection(db: Connection | None) -> None:
+	global shared_db, snapshot_mode
+
+	shared_db = db
+	snapshot_mode = False
+
+
+# Closes the shared connection
+def close_connection() -> None:
+	global shared_db, snapshot_mode
+
+	if shared_db is not None:
+		shared_db.close()
+		shared_db = None
+
+	snapshot_mode = False
+
+
+atexit.register(close_connection)
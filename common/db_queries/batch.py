@@ -0,0 +1,23 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	from collections.abc import Iterable, Iterator
+
+# Maximum number of values bound to a single "IN (...)" list, keeps queries below SQLite's variables limit
+max_bound_values: int = 500
+
+
+# Splits values into unique-valued chunks small enough to be bound to a single query
+def chunks(values: Iterable, size: int = max_bound_values) -> Iterator[list]:
+	unique_values: list = list(dict.fromkeys(values))
+
+	for x in range(0, len(unique_values), size):
+		yield unique_values[x:x + size]
+
+
+# Returns placeholders for an "IN (...)" list of given length
+def placeholders(length: int) -> str:
+	return ', '.join('?' * length)
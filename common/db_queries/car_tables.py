@@ -5,9 +5,14 @@ sys.dont_write_bytecode = True
 
 if True:  # noqa: E402
 	import sqlite3
+	from collections.abc import Iterable
 	from sqlite3 import Connection
 	from common.db_connect import db_connection
+	from common.db_queries.batch import chunks, placeholders
+	from common.db_queries.touch_buffer import touch
 	from common.models.car import Car
+	from common.models.entity_import import ImportReport
+	from common.schema.migrations import analyze_tables
 
 
 # Checks whether car's data exists in database
@@ -36,7 +41,37 @@ def check_car_exists(codename: str, wikipedia_id: int) -> bool | None:
 		return False if result[0] is None else bool(result[0])
 
 
-# Gets car's link from the database and refreshes car's timestamp
+# Gets codenames of given cars which have links in Wikipedia version, looked up with one query per chunk of codenames
+def get_linked_car_codenames(codenames: Iterable[str], wiki_id: int) -> set[str] | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	linked: set[str] = set()
+
+	with db:
+		for chunk in chunks(codenames):  # type: list[str]
+			query = f'''
+				SELECT DISTINCT c.codename
+				FROM car c
+				JOIN car_wikipedia cw
+				ON c.id = cw.car_id
+				WHERE cw.wikipedia_id = ?
+				AND c.codename IN ({placeholders(len(chunk))});
+			'''
+
+			try:
+				linked.update(r[0] for r in db.execute(query, [wiki_id, *chunk]))
+			except sqlite3.Error as e:
+				print(f'An error occurred while looking for cars in the database - {e.__str__()}')
+				return None
+
+	return linked
+
+
+# Gets car's link from the database and marks car as used
 def get_car_link(codename: str, wiki_id: int) -> str | None:
 	db: Connection | None = db_connection()
 
@@ -63,104 +98,104 @@ def get_car_link(codename: str, wiki_id: int) -> str | None:
 		if result is None:
 			return ''
 		else:
-			query = '''
-				UPDATE car
-				SET last_used = CURRENT_TIMESTAMP
-				WHERE id = :car_id;
-			'''
-
-			db.execute(query, {'car_id': result[1]})
+			touch('car', [int(result[1])])
 
 			return result[0]
 
 
-# Adds cars data to the database
-def add_cars(cars: list[Car], wiki_id: int) -> None:
+# Adds cars data to the database in one transaction, either all of them are saved or none.
+# Cars are loaded into a temporary table, so the number of queries doesn't depend on the number of cars.
+def add_cars(cars: list[Car], wiki_id: int) -> ImportReport | None:
 	db: Connection | None = db_connection()
 
 	if db is None:
 		print("Couldn't connect to the database.")
 		return None
 
+	report = ImportReport()
+
+	# Car repeated in imported data is saved once
+	unique_cars: dict[str, Car] = dict()
+
 	for car in cars:
+		if car.codename in unique_cars:
+			report.skipped.append(car.codename)
+		else:
+			unique_cars[car.codename] = car
+
+	create_query = '''
+		CREATE TEMP TABLE car_import (
+			position INTEGER NOT NULL PRIMARY KEY,
+			codename VARCHAR(255) NOT NULL,
+			link VARCHAR(255) NOT NULL
+		);
+	'''
+	load_query = 'INSERT INTO temp.car_import (codename, link) VALUES (:codename, :link);'
+	# Cars saved before and their first link in given Wikipedia
+	saved_query = '''
+		SELECT ci.codename, c.id, (
+			SELECT cw.link
+			FROM car_wikipedia cw
+			WHERE cw.car_id = c.id
+			AND cw.wikipedia_id = :wiki_id
+			ORDER BY cw.rowid
+			LIMIT 1
+		)
+		FROM temp.car_import ci
+		JOIN car c
+		ON c.codename = ci.codename;
+	'''
+	car_query = '''
+		INSERT INTO car (codename)
+		SELECT codename
+		FROM temp.car_import
+		WHERE TRUE
+		ORDER BY position
+		ON CONFLICT (codename) DO NOTHING;
+	'''
+	link_query = '''
+		INSERT INTO car_wikipedia (wikipedia_id, car_id, link)
+		SELECT :wiki_id, c.id, ci.link
+		FROM temp.car_import ci
+		JOIN car c
+		ON c.codename = ci.codename
+		WHERE NOT EXISTS (
+			SELECT 1
+			FROM car_wikipedia cw
+			WHERE cw.car_id = c.id
+			AND cw.wikipedia_id = :wiki_id
+		)
+		ORDER BY ci.position;
+	'''
+
+	try:
 		with db:
-			exists: bool = False
-
-			db.execute('BEGIN')
-
-			# Checking whether car's data is in 'car' table
-			query = 'SELECT id FROM car WHERE codename = :codename;'
-			params = {'codename': car.codename}
-
-			car_id_db: tuple | None = db.execute(query, params).fetchone()
-
-			if car_id_db is None:
-				# Adding car's data to 'car' table
-				query = 'INSERT INTO car (codename) VALUES (:codename);'
-				params = {'codename': car.codename}
-
-				try:
-					db.execute(query, params)
-				except sqlite3.OperationalError as e:
-					db.execute('ROLLBACK')
-					print('An error occurred while adding {car}: {error}'.format(
-						car=car.codename,
-						error=e
-					))
-					continue
-
-				# Checking car's id in the database
-				query = 'SELECT id FROM car WHERE codename = :codename'
-				params = {'codename': car.codename}
-
-				result = db.execute(query, params).fetchone()
-				car_id = result[0]
-			else:
-				exists = True
-				car_id: int = car_id_db[0]
-				# Checking whether 'car_wikipedia' table has links to the article about the car
-				query = '''
-					SELECT link
-					FROM car_wikipedia
-					WHERE car_id = :car_id
-					AND wikipedia_id = :wikipedia_id;
-				'''
-				params = {'car_id': car_id, 'wikipedia_id': wiki_id}
-
-				result = db.execute(query, params).fetchone()
-
-				if result is not None:
-					db.execute('ROLLBACK')
-					print('{car} already has a link in database: {link}'.format(
-						car=car.codename,
-						link=result[0]
-					))
-					continue
-
-			# Adding link into 'car_wikipedia' table
-			query = '''
-				INSERT INTO car_wikipedia (wikipedia_id, car_id, link)
-				VALUES (:wikipedia_id, :car_id, :link);
-			'''
-			params = {
-				'wikipedia_id': wiki_id,
-				'car_id': car_id,
-				'link': car.link
+			# Write lock is taken before cars are looked up, so another import can't add them in the meantime
+			db.execute('BEGIN IMMEDIATE')
+
+			db.execute(create_query)
+			db.executemany(load_query, [{'codename': c.codename, 'link': c.link} for c in unique_cars.values()])
+
+			saved_cars: dict[str, str | None] = {
+				r[0]: r[2] for r in db.execute(saved_query, {'wiki_id': wiki_id})
 			}
 
-			try:
-				db.execute(query, params)
-			except sqlite3.OperationalError as e:
-				db.execute('ROLLBACK')
-				print('An error occurred while adding {car}: {error}'.format(
-					car=car.codename,
-					error=e
-				))
-				continue
-
-			db.execute('COMMIT')
-
-			if exists:
-				print(f'{car.codename} - successfully added link: "{car.link}"')
-			else:
-				print(f'{car.codename} - successfully added to the database')
+			db.execute(car_query)
+			db.execute(link_query, {'wiki_id': wiki_id})
+			db.execute('DROP TABLE temp.car_import;')
+	except sqlite3.Error as e:
+		print(f'An error occurred while adding cars to the database - {e.__str__()}')
+		return None
+
+	for codename in unique_cars:  # type: str
+		if codename not in saved_cars:
+			report.inserted.append(codename)
+		elif saved_cars[codename] is None:
+			report.linked.append(codename)
+		else:
+			report.skipped.append(codename)
+			report.existing_links[codename] = [saved_cars[codename]]
+
+	analyze_tables(db, ['car', 'car_wikipedia'])
+
+	return report
@@ -7,8 +7,11 @@ if True:  # noqa: E402
 	import sqlite3
 	from sqlite3 import Connection
 	from common.db_connect import db_connection
+	from common.db_queries.batch import chunks, placeholders
+	from common.db_queries.standing_table import refresh_standings
+	from common.schema.migrations import analyze_tables
 	from common.models.classifications import Classification
-	from common.models.results import EntityResults, RoundResult
+	from common.models.results import EntityResults, RoundResult, Score
 	from common.models.styles import Style
 
 
@@ -120,7 +123,86 @@ def get_champ_classifications_by_season(championship_id: int, season: str) -> li
 		return classifications
 
 
-# Gets classification's results
+# Query returning standings of a classification, one row per entity's round result.
+# Qualifying result is merged into following result of the same round, passing its bold style on.
+# Points come from 'standing' table and positions are worked out with window functions, a position is shared
+# by consecutive entities with equal points and results, just like in printed tables.
+standings_query: str = '''
+	WITH ordered_score AS (
+		SELECT sc.rowid AS score_id, sc.entity_id, sc.round_number, ses.name AS session_name, sc.place,
+			rs.background_hex, rs.text_colour_hex, COALESCE(rs.bold, 0) != 0 AS bold,
+			ses.name = 'QUALIFYING' AS qualifying,
+			ROW_NUMBER() OVER entity_round - 1 AS round_index,
+			COUNT(*) OVER whole_round AS round_size,
+			SUM(ses.name = 'QUALIFYING') OVER whole_round AS round_qualifying,
+			FIRST_VALUE(COALESCE(rs.bold, 0) != 0) OVER entity_round AS round_first_bold,
+			MIN(sc.rowid) OVER whole_entity AS first_score
+		FROM score sc
+		JOIN "session" ses
+		ON ses.id = sc.session_id
+		JOIN result_styling rs
+		ON rs.id = sc.style_id
+		WHERE sc.classification_id = :cl_id
+		WINDOW entity_round AS (PARTITION BY sc.entity_id, sc.round_number ORDER BY ses.name != 'QUALIFYING', sc.rowid),
+			whole_round AS (PARTITION BY sc.entity_id, sc.round_number),
+			whole_entity AS (PARTITION BY sc.entity_id)
+	),
+	round_result AS (
+		SELECT score_id, entity_id, round_number, session_name, place, background_hex, text_colour_hex,
+			CASE WHEN round_index BETWEEN 1 AND round_qualifying THEN round_first_bold ELSE bold END AS bold,
+			qualifying, first_score
+		FROM ordered_score
+		WHERE NOT qualifying
+		OR round_index = round_size - 1
+	),
+	entity_key AS (
+		SELECT DISTINCT rr.entity_id, st.total_points, rr.first_score,
+			GROUP_CONCAT(
+				quote(rr.round_number) || ',' || quote(rr.session_name) || ',' || quote(rr.place) || ','
+				|| quote(rr.background_hex) || ',' || quote(rr.text_colour_hex) || ',' || rr.bold, '|'
+			) OVER (
+				PARTITION BY rr.entity_id ORDER BY rr.round_number, NOT rr.qualifying, rr.score_id
+				ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+			) AS results_key
+		FROM round_result rr
+		JOIN standing st
+		ON st.classification_id = :cl_id
+		AND st.entity_id = rr.entity_id
+	),
+	entity_standing AS (
+		SELECT ek.entity_id, {entity_table}.flag, {wikipedia_table}.{link_column} AS link {car_no},
+			ek.total_points, ek.first_score,
+			ek.total_points IS NOT LAG(ek.total_points) OVER standing_order
+			OR ek.results_key IS NOT LAG(ek.results_key) OVER standing_order AS new_position
+		FROM entity_key ek
+		JOIN {entity_table}
+		ON {entity_table}.id = ek.entity_id
+		JOIN {wikipedia_table}
+		ON {entity_table}.id = {wikipedia_table}.{entity_id}
+		WHERE {wikipedia_table}.wikipedia_id = :wiki
+		WINDOW standing_order AS (
+			ORDER BY ek.total_points DESC, ek.first_score, ek.entity_id, {wikipedia_table}.{link_column}
+		)
+	),
+	ranked_standing AS (
+		SELECT *,
+			SUM(new_position) OVER (
+				ORDER BY total_points DESC, first_score, entity_id, link
+				ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+			) AS position
+		FROM entity_standing
+	)
+	SELECT st.position, st.entity_id, st.flag, st.link, st.car_number, st.total_points,
+		rr.round_number, rr.session_name, rr.place, rr.background_hex, rr.text_colour_hex, rr.bold
+	FROM ranked_standing st
+	JOIN round_result rr
+	ON rr.entity_id = st.entity_id
+	ORDER BY st.total_points DESC, st.first_score, st.entity_id, st.link,
+		rr.round_number, NOT rr.qualifying, rr.score_id;
+'''
+
+
+# Gets classification's results ordered by standings, with positions and points calculated by the database
 def get_classification_results(classification: Classification, wiki_id: int) -> list[EntityResults] | None:
 	db: Connection | None = db_connection()
 
@@ -131,16 +213,7 @@ def get_classification_results(classification: Classification, wiki_id: int) ->
 	entities: list[EntityResults] = list()
 
 	with db:
-		query = '''
-			SELECT DISTINCT entity_id, {entity_table}.flag, {wikipedia_table}.{link_column} {car_no}
-			FROM score
-			JOIN {entity_table}
-			ON {entity_table}.id = score.entity_id
-			JOIN {wikipedia_table}
-			ON {entity_table}.id = {wikipedia_table}.{entity_id}
-			WHERE score.classification_id = :cl_id
-			AND {wikipedia_table}.wikipedia_id = :wiki;
-		'''
+		query: str = standings_query
 		params = {
 			'cl_id': classification.db_id,
 			'wiki': wiki_id
@@ -152,7 +225,7 @@ def get_classification_results(classification: Classification, wiki_id: int) ->
 					wikipedia_table='driver_wikipedia',
 					link_column='short_link',
 					entity_id='driver_id',
-					car_no=''
+					car_no=', NULL AS car_number'
 				)
 			case 'TEAMS':
 				query = query.format(
@@ -168,77 +241,39 @@ def get_classification_results(classification: Classification, wiki_id: int) ->
 					wikipedia_table='manufacturer_wikipedia',
 					link_column='link',
 					entity_id='manufacturer_id',
-					car_no=''
+					car_no=', NULL AS car_number'
 				)
 			case _:
 				return None
 
-		result = db.execute(query, params).fetchall()
-
-		for entity_data in result:
-			car_number: int | None = None
-
-			try:
-				car_number = int(entity_data[3])
-			except IndexError:
-				car_number = None
-
-			new_entity = EntityResults(
-						db_id=int(entity_data[0]),
-						flag=entity_data[1],
-						link=entity_data[2],
-						car_no=car_number,
-						points=0
+		entity: EntityResults | None = None
+
+		for res in db.execute(query, params):
+			# Rows of next entity begin
+			if entity is None or entity.db_id != int(res[1]) or entity.link != res[3]:
+				entity = EntityResults(
+					db_id=int(res[1]),
+					flag=res[2],
+					link=res[3],
+					car_no=None if res[4] is None else int(res[4]),
+					points=float(res[5]),
+					results=list(),
+					position=int(res[0])
+				)
+				entities.append(entity)
+
+			entity.results.append(
+				RoundResult(
+					number=int(res[6]),
+					session=res[7],
+					place=res[8],
+					style=Style(
+						background=res[9],
+						text=res[10],
+						bold=bool(res[11])
 					)
-
-			query = '''
-				SELECT round_number, ses.name, place, points, rs.background_hex, rs.text_colour_hex, rs.bold 
-				FROM score sc
-				JOIN "session" ses
-				ON ses.id = sc.session_id
-				JOIN result_styling rs
-				ON rs.id = sc.style_id
-				WHERE classification_id = :cl_id
-				AND sc.entity_id = :e_id;
-			'''
-			params = {
-				'cl_id': classification.db_id,
-				'e_id': new_entity.db_id
-			}
-
-			round_results = db.execute(query, params).fetchall()
-
-			scores: list[RoundResult] = list()
-
-			prev_score: RoundResult | None = None
-
-			for res in round_results:
-				new_entity.points += float(res[3])
-
-				score: RoundResult = RoundResult(
-										number=int(res[0]),
-										session=res[1],
-										place=res[2],
-										style=Style(
-											background=res[4],
-											text=res[5],
-											bold=bool(res[6])
-										)
 				)
-
-				if prev_score is not None:
-					if prev_score.number == score.number and prev_score.session == 'QUALIFYING':
-						score.style.bold = prev_score.style.bold
-						scores.remove(prev_score)
-
-				scores.append(score)
-				prev_score = score
-
-			new_entity.results = scores
-
-			entities.append(new_entity)
-
-		entities.sort(key=lambda x: x.points, reverse=True)
+			)
 
 		return entities
 
@@ -287,9 +322,9 @@ def get_races_number(classification_id: int) -> int | None:
 def get_all_scoring_entities_number(db: Connection, classification_id: int) -> int:
 	with db:
 		query: str = '''
-			SELECT COUNT (DISTINCT entity_id)
-			FROM score
-			WHERE score.classification_id = :cl_id;
+			SELECT COUNT(*)
+			FROM standing
+			WHERE classification_id = :cl_id;
 		'''
 
 		result: tuple[int] = db.execute(
@@ -371,6 +406,36 @@ def check_points_eligibility(classification_id: int, entity_id: int) -> bool | N
 		return False if result is None else bool(not result[0])
 
 
+# Gets ids of entities which cannot score in given classifications, grouped by classification's id
+def get_ineligible_entities(classification_ids: list[int]) -> dict[int, frozenset[int]] | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	ineligible: dict[int, set[int]] = {cl_id: set() for cl_id in classification_ids}
+
+	with db:
+		for chunk in chunks(classification_ids):  # type: list[int]
+			query = f'''
+				SELECT classification_id, entity_id
+				FROM classification_ineligible
+				WHERE classification_id IN ({placeholders(len(chunk))});
+			'''
+
+			try:
+				result = db.execute(query, chunk).fetchall()
+			except sqlite3.Error as e:
+				print(f'An error occurred while reading ineligible entities - {e.__str__()}')
+				return None
+
+			for r in result:
+				ineligible[int(r[0])].add(int(r[1]))
+
+	return {cl_id: frozenset(entities) for cl_id, entities in ineligible.items()}
+
+
 # Checks whether given round and session are in the database
 def check_round_session(classification_id: int, round_number: int, session_id: int) -> bool | None:
 	db: Connection | None = db_connection()
@@ -444,6 +509,7 @@ def add_score(
 		try:
 			db.execute('BEGIN')
 			db.execute(query, params)
+			refresh_standings(db, {classification_id: [entity_id]})
 		except sqlite3.OperationalError as e:
 			db.execute('ROLLBACK')
 			print(f'An error occurred while adding score to the database - {e.__str__()}')
@@ -453,6 +519,119 @@ def add_score(
 		print('Successfully added score to the database.')
 
 
+# Query inserting a score, its parameters are returned by score_params
+insert_score_query: str = '''
+	INSERT INTO score (classification_id, round_number, session_id, entity_id, place, points, style_id)
+	VALUES (:cl_id, :rnd_num, :s_id, :e_id, :place, :points, :style_id);
+'''
+
+
+# Adds many scores to the database in one transaction, either all of them are saved or none.
+# Returns numbers of added scores by classification's id.
+def add_scores(scores: list[Score]) -> dict[int, int] | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	try:
+		with db:
+			db.executemany(insert_score_query, [score_params(s) for s in scores])
+			refresh_standings(db, scored_entities(scores))
+	except sqlite3.Error as e:
+		print(f'An error occurred while adding scores to the database - {e.__str__()}')
+		return None
+
+	analyze_tables(db, ['score', 'standing'])
+
+	return count_scores(scores)
+
+
+# Replaces results of round's session in given classifications with new scores in one transaction.
+# If anything fails then previous results are kept. Returns numbers of added scores by classification's id.
+def replace_session_scores(
+	classifications: list[Classification], round_number: int, session_id: int, scores: list[Score]
+) -> dict[int, int] | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	delete_query = '''
+		DELETE FROM score
+		WHERE classification_id = :classification
+		AND round_number = :round
+		AND session_id = :session;
+	'''
+	delete_params: list[dict[str, int]] = [
+		{'classification': cl.db_id, 'round': round_number, 'session': session_id} for cl in classifications
+	]
+
+	# Entities which lose their scores need their standings recalculated as well
+	entities_query = '''
+		SELECT DISTINCT entity_id
+		FROM score
+		WHERE classification_id = :classification
+		AND round_number = :round
+		AND session_id = :session;
+	'''
+
+	try:
+		with db:
+			entities: dict[int, set[int]] = scored_entities(scores)
+
+			for params in delete_params:
+				removed = db.execute(entities_query, params).fetchall()
+
+				entities.setdefault(params['classification'], set()).update(r[0] for r in removed)
+
+			db.executemany(delete_query, delete_params)
+			db.executemany(insert_score_query, [score_params(s) for s in scores])
+			refresh_standings(db, entities)
+	except sqlite3.Error as e:
+		print(f'An error occurred while replacing scores in the database - {e.__str__()}')
+		return None
+
+	analyze_tables(db, ['score', 'standing'])
+
+	return count_scores(scores)
+
+
+# Returns score's values as query parameters
+def score_params(score: Score) -> dict[str, int | str | float]:
+	return {
+		'cl_id': score.classification_id,
+		'rnd_num': score.round_number,
+		's_id': score.session_id,
+		'e_id': score.entity_id,
+		'place': score.place,
+		'points': score.points,
+		'style_id': score.style_id
+	}
+
+
+# Counts scores by classification's id
+def count_scores(scores: list[Score]) -> dict[int, int]:
+	summary: dict[int, int] = dict()
+
+	for score in scores:
+		summary[score.classification_id] = summary.get(score.classification_id, 0) + 1
+
+	return summary
+
+
+# Groups ids of scores' entities by classification's id
+def scored_entities(scores: list[Score]) -> dict[int, set[int]]:
+	entities: dict[int, set[int]] = dict()
+
+	for score in scores:
+		entities.setdefault(score.classification_id, set()).add(score.entity_id)
+
+	return entities
+
+
 # Removes results of round's session
 def remove_session_scores(
 	classifications: list[Classification], round_number: int, session_id: int
@@ -468,7 +647,8 @@ def remove_session_scores(
 			DELETE FROM score
 			WHERE classification_id = :classification
 			AND round_number = :round
-			AND session_id = :session;
+			AND session_id = :session
+			RETURNING entity_id;
 		'''
 
 		results: list[bool] = list()
@@ -481,7 +661,8 @@ def remove_session_scores(
 			}
 
 			try:
-				db.execute(query, params)
+				removed = db.execute(query, params).fetchall()
+				refresh_standings(db, {cl.db_id: [r[0] for r in removed]})
 			except sqlite3.Error as e:
 				print(e.__str__())
 				results.append(False)
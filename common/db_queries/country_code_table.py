@@ -4,26 +4,21 @@ import sys
 sys.dont_write_bytecode = True
 
 if True:  # noqa: E402
-	from sqlite3 import Connection
-	from common.db_connect import db_connection
+	from collections.abc import Mapping
+	from common.db_queries.reference_data import get_reference_table
 
 
 # Gets country's ISO 3166-1 alpha-3 code.
 # Function's parameter is a number code used by ACO in its results files.
 def get_country_iso_alpha3(code: int) -> str | None:
-	db: Connection | None = db_connection()
+	countries: Mapping[int, str] | None = get_reference_table('country_code')
 
-	if db is None:
+	if countries is None:
 		return None
 
-	with db:
-		query = '''
-			SELECT country
-			FROM country_code
-			WHERE code = :code;
-		'''
-		params = {'code': code}
+	try:
+		country: str | None = countries.get(int(code))
+	except (TypeError, ValueError):
+		return '?'
 
-		result = db.execute(query, params).fetchone()
-
-		return '?' if result is None else '?' if result[0] is None else result[0]
+	return '?' if country is None else country
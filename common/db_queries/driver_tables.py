@@ -5,8 +5,15 @@ sys.dont_write_bytecode = True
 
 if True:  # noqa: E402
 	import sqlite3
+	from collections.abc import Iterable
+	from sqlite3 import Connection
 	from common.db_connect import db_connection
+	from common.db_queries.batch import chunks, placeholders
+	from common.db_queries.entity_table import add_entities
+	from common.db_queries.touch_buffer import touch
 	from common.models.driver import Driver
+	from common.models.entity_import import ImportReport
+	from common.schema.migrations import analyze_tables
 
 
 # Checks whether driver's data is in database
@@ -35,7 +42,37 @@ def check_driver_exists(codename: str, wikipedia_id: int) -> bool | None:
 		return False if result[0] is None else bool(result[0])
 
 
-# Gets driver's data and refreshes driver's last used timestamp
+# Gets codenames of given drivers which have links in Wikipedia version, looked up with one query per chunk of codenames
+def get_linked_driver_codenames(codenames: Iterable[str], wiki_id: int) -> set[str] | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	linked: set[str] = set()
+
+	with db:
+		for chunk in chunks(codenames):  # type: list[str]
+			query = f'''
+				SELECT DISTINCT d.codename
+				FROM driver d
+				JOIN driver_wikipedia dw
+				ON d.id = dw.driver_id
+				WHERE dw.wikipedia_id = ?
+				AND d.codename IN ({placeholders(len(chunk))});
+			'''
+
+			try:
+				linked.update(r[0] for r in db.execute(query, [wiki_id, *chunk]))
+			except sqlite3.Error as e:
+				print(f'An error occurred while looking for drivers in the database - {e.__str__()}')
+				return None
+
+	return linked
+
+
+# Gets driver's data and marks driver as used
 def get_driver_data_by_codename(codename: str, wiki_id: int) -> Driver | None:
 	db = db_connection()
 
@@ -65,9 +102,7 @@ def get_driver_data_by_codename(codename: str, wiki_id: int) -> Driver | None:
 		if result is None:
 			return Driver()
 		else:
-			query = 'UPDATE driver SET last_used = CURRENT_TIMESTAMP WHERE id = :driver_id;'
-
-			db.execute(query, {'driver_id': int(result[3])})
+			touch('driver', [int(result[3])])
 
 			return Driver(
 				codename=codename,
@@ -78,133 +113,157 @@ def get_driver_data_by_codename(codename: str, wiki_id: int) -> Driver | None:
 			)
 
 
-# Adds drivers data to the database
-def add_drivers(drivers: list[Driver], wiki_id: int, type_id: int) -> None:
+# Gets data of many drivers at once and marks them as used.
+# Returned dictionary is keyed by codename, drivers missing in database are left out.
+def get_drivers_by_codenames(codenames: Iterable[str], wiki_id: int) -> dict[str, Driver] | None:
 	db = db_connection()
 
 	if db is None:
 		print("Couldn't connect to the database.")
-		return
+		return None
+
+	drivers: dict[str, Driver] = dict()
+
+	with db:
+		for chunk in chunks(codenames):  # type: list[str]
+			query = f'''
+				SELECT d.codename, short_link, long_link, d.flag, driver_id
+				FROM driver_wikipedia dw
+				JOIN driver d
+				ON d.id = dw.driver_id
+				WHERE wikipedia_id = ?
+				AND d.codename IN ({placeholders(len(chunk))});
+			'''
+
+			try:
+				result = db.execute(query, [wiki_id, *chunk]).fetchall()
+			except sqlite3.Error:
+				continue
+
+			for r in result:
+				drivers[r[0]] = Driver(
+					codename=r[0],
+					nationality=r[3],
+					short_link=r[1],
+					long_link=r[2],
+					db_id=int(r[4])
+				)
+
+	touch('driver', [d.db_id for d in drivers.values()])
+
+	return drivers
+
+
+# Gets ids of drivers with given codenames, the first driver is used if codename repeats
+def get_driver_ids(db: Connection, codenames: Iterable[str]) -> dict[str, int]:
+	driver_ids: dict[str, int] = dict()
+
+	for chunk in chunks(codenames):  # type: list[str]
+		query = f'''
+			SELECT codename, id
+			FROM driver
+			WHERE codename IN ({placeholders(len(chunk))})
+			ORDER BY rowid;
+		'''
+
+		for r in db.execute(query, chunk):
+			driver_ids.setdefault(r[0], int(r[1]))
+
+	return driver_ids
+
+
+# Gets links of given drivers in Wikipedia version, keyed by driver's id
+def get_driver_links(db: Connection, driver_ids: Iterable[int], wiki_id: int) -> dict[int, list[str]]:
+	links: dict[int, list[str]] = dict()
+
+	for chunk in chunks(driver_ids):  # type: list[int]
+		query = f'''
+			SELECT driver_id, short_link, long_link
+			FROM driver_wikipedia
+			WHERE wikipedia_id = ?
+			AND driver_id IN ({placeholders(len(chunk))});
+		'''
+
+		for r in db.execute(query, [wiki_id, *chunk]):
+			links.setdefault(int(r[0]), [r[1], r[2]])
+
+	return links
+
+
+# Adds drivers data to the database in one transaction, either all of them are saved or none.
+# Drivers already in the database only get links, drivers which already have links in given Wikipedia are skipped.
+def add_drivers(drivers: list[Driver], wiki_id: int, type_id: int) -> ImportReport | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
 
-	exists = False
+	report = ImportReport()
+
+	# Driver repeated in imported data is saved once
+	unique_drivers: dict[str, Driver] = dict()
 
 	for driver in drivers:
+		if driver.codename in unique_drivers:
+			report.skipped.append(driver.codename)
+		else:
+			unique_drivers[driver.codename] = driver
+
+	driver_query = '''
+		INSERT INTO driver (id, codename, flag)
+		VALUES (:id, :codename, :nationality);
+	'''
+	link_query = '''
+		INSERT INTO driver_wikipedia (wikipedia_id, driver_id, short_link, long_link)
+		VALUES (:wikipedia_id, :driver_id, :short_link, :long_link);
+	'''
+
+	try:
 		with db:
-			db.execute('BEGIN')
+			# Write lock is taken before drivers are looked up, so another import can't add them in the meantime
+			db.execute('BEGIN IMMEDIATE')
 
-			# Checking whether driver's data is in 'driver' table
-			query = '''
-				SELECT id
-				FROM driver
-				WHERE codename = :codename;
-			'''
-			params = {'codename': driver.codename}
-
-			driver_id_db: tuple | None = db.execute(query, params).fetchone()
-
-			# If driver's data is not in the 'driver' table
-			if driver_id_db is None:
-				# Adding driver into 'entity' table
-				query = '''
-					INSERT INTO entity (type_id)
-					VALUES (:type_id)
-				'''
-
-				params = {'type_id': type_id}
-
-				try:
-					db.execute(query, params)
-				except sqlite3.OperationalError as e:
-					db.execute('ROLLBACK')
-					print('An error occurred while adding {driver}: {error}'.format(
-						driver=driver.codename,
-						error=e
-					))
-					continue
+			driver_ids: dict[str, int] = get_driver_ids(db, unique_drivers.keys())
+			links: dict[int, list[str]] = get_driver_links(db, driver_ids.values(), wiki_id)
 
-				# Checking driver's id in the database
-				query = '''
-					SELECT MAX(id)
-					FROM entity
-					WHERE type_id = :type_id
-				'''
-
-				params = {'type_id': type_id}
-
-				driver_id: int = int(db.execute(query, params).fetchone()[0])
-
-				# Adding driver's data to 'driver' table
-				query = '''
-					INSERT INTO driver (id, codename, flag)
-					VALUES (:id, :codename, :nationality)
-				'''
-				params = {
-					'id': driver_id,
-					'codename': driver.codename,
-					'nationality': driver.nationality
-				}
-
-				try:
-					db.execute(query, params)
-				except sqlite3.OperationalError as e:
-					db.execute('ROLLBACK')
-					print('An error occurred while adding {driver}: {error}'.format(
-						driver=driver.codename,
-						error=e
-					))
-					continue
-			else:
-				exists = True
-				# Checking whether 'driver_wikipedia' table has links to articles about driver
-				driver_id: int = driver_id_db[0]
-
-				query = '''
-					SELECT short_link, long_link
-					FROM driver_wikipedia
-					WHERE driver_id = :driver_id
-					AND wikipedia_id = :wikipedia_id;
-				'''
-				params = {
-					'driver_id': driver_id,
-					'wikipedia_id': wiki_id
-				}
-
-				result = db.execute(query, params).fetchone()
-
-				if result is not None:
-					db.execute('ROLLBACK')
-					print('{driver} already has links in database: "{short_link}", "{long_link}'.format(
-						driver=driver.codename,
-						short_link=result[0],
-						long_link=result[1]
-					))
+			new_drivers: list[Driver] = [d for d in unique_drivers.values() if d.codename not in driver_ids]
+			new_codenames: set[str] = {d.codename for d in new_drivers}
+
+			for driver, driver_id in zip(new_drivers, add_entities(db, type_id, len(new_drivers))):
+				driver_ids[driver.codename] = driver_id
+
+			links_params: list[dict[str, int | str]] = list()
+
+			for codename, driver in unique_drivers.items():  # type: str, Driver
+				driver_id: int = driver_ids[codename]
+
+				if driver_id in links:
+					report.skipped.append(codename)
+					report.existing_links[codename] = links[driver_id]
 					continue
 
-			# Adding links into 'driver_wikipedia' table
-			query = '''
-				INSERT INTO driver_wikipedia (wikipedia_id, driver_id, short_link, long_link)
-				VALUES (:wikipedia_id, :driver_id, :short_link, :long_link);
-			'''
-			params = {
-				'wikipedia_id': wiki_id,
-				'driver_id': driver_id,
-				'short_link': driver.short_link,
-				'long_link': driver.long_link
-			}
+				if codename in new_codenames:
+					report.inserted.append(codename)
+				else:
+					report.linked.append(codename)
 
-			try:
-				db.execute(query, params)
-			except sqlite3.OperationalError as e:
-				db.execute('ROLLBACK')
-				print('An error occurred while adding {driver}: {error}'.format(
-					driver=driver.codename,
-					error=e
-				))
-				continue
+				links_params.append({
+					'wikipedia_id': wiki_id,
+					'driver_id': driver_id,
+					'short_link': driver.short_link,
+					'long_link': driver.long_link
+				})
+
+			db.executemany(driver_query, [
+				{'id': driver_ids[d.codename], 'codename': d.codename, 'nationality': d.nationality}
+				for d in new_drivers
+			])
+			db.executemany(link_query, links_params)
+	except sqlite3.Error as e:
+		print(f'An error occurred while adding drivers to the database - {e.__str__()}')
+		return None
 
-			db.execute('COMMIT')
+	analyze_tables(db, ['entity', 'driver', 'driver_wikipedia'])
 
-			if exists:
-				print(f'{driver.codename} - successfully added links to database')
-			else:
-				print(f'{driver.codename} - successfully added data to database')
+	return report
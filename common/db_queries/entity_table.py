@@ -3,6 +3,7 @@ import sys
 # Prevents creating __pycache__ directory
 sys.dont_write_bytecode = True
 
+from sqlite3 import Connection  # noqa: E402
 from common.db_connect import db_connection  # noqa: E402
 
 
@@ -24,3 +25,16 @@ def get_entity_type_id(entity_name: str) -> int | None:
 		result = db.execute(query, params).fetchone()
 
 		return -1 if result is None else int(result[0])
+
+
+# Adds given number of entities of one type within caller's transaction, returns their ids.
+# Ids are returned by the inserting statements, so other imports adding entities at the same time don't affect them.
+def add_entities(db: Connection, type_id: int, number: int) -> list[int]:
+	query = '''
+		INSERT INTO entity (type_id)
+		VALUES (:type_id)
+		RETURNING id;
+	'''
+	params = {'type_id': type_id}
+
+	return [int(db.execute(query, params).fetchone()[0]) for _ in range(number)]
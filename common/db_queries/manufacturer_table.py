@@ -4,9 +4,11 @@ import sys
 sys.dont_write_bytecode = True
 
 if True:  # noqa: E402
+	import sqlite3
 	from sqlite3 import Connection
 	from common.models.manufacturer import Manufacturer
 	from common.db_connect import db_connection
+	from common.db_queries.touch_buffer import refresh_timestamps
 
 
 # Gets all manufacturers with their id's, codenames and flags
@@ -40,7 +42,7 @@ def get_manufacturers() -> list[Manufacturer] | None:
 		return manufacturers
 
 
-# Refreshes manufacturers timestamps
+# Refreshes timestamps of manufacturers under given ids, repeated ids are updated once
 def refresh_manufacturers_timestamps(ids: list[int]) -> None:
 	db: Connection | None = db_connection()
 
@@ -48,8 +50,8 @@ def refresh_manufacturers_timestamps(ids: list[int]) -> None:
 		print("Couldn't connect to the database.")
 		return None
 
-	for i in ids:  # type: int
+	try:
 		with db:
-			query = 'UPDATE manufacturer SET last_used = CURRENT_TIMESTAMP WHERE id = id;'
-
-			db.execute(query, {'id': i})
+			refresh_timestamps(db, 'manufacturer', ids)
+	except sqlite3.Error as e:
+		print(f'An error occurred while refreshing timestamps - {e.__str__()}')
@@ -4,8 +4,10 @@ import sys
 sys.dont_write_bytecode = True
 
 if True:  # noqa: E402
+	from collections.abc import Mapping
 	from sqlite3 import Connection
 	from common.db_connect import db_connection
+	from common.db_queries.reference_data import get_reference_table
 	from common.models.sessions import DbSession
 	from common.models.styles import Style, StyledStatus, StyledPosition, LocalisedAbbreviation
 
@@ -74,42 +76,32 @@ def get_scoring_sessions(championship_id: int, scale: float) -> list[DbSession]
 
 # Gets Wikipedia table-styled nonscoring statuses (retired, not classified, etc.)
 def get_styled_nonscoring_statuses() -> list[StyledStatus] | None:
-	db: Connection | None = db_connection()
+	styles: Mapping[int, tuple] | None = get_reference_table('result_styling')
 
-	if db is None:
-		print("Couldn't connect to the database.")
+	if styles is None:
 		return
 
-	with db:
-		styled_statuses: list[StyledStatus] = list()
+	scoring_statuses: tuple[str, ...] = ('Classified, scoring', 'P1', 'P2', 'P3', 'PP')
 
-		query = '''
-			SELECT status, background_hex, text_colour_hex, bold, id
-			FROM result_styling
-			WHERE status != "Classified, scoring"
-			AND status != "P1"
-			AND status != "P2"
-			AND status != "P3"
-			AND status != "PP";
-		'''
+	styled_statuses: list[StyledStatus] = list()
 
-		result = db.execute(query).fetchall()
+	for style_id, res in styles.items():
+		if res[0] in scoring_statuses:
+			continue
 
-		if len(result) > 0:
-			for res in result:
-				styled_statuses.append(
-					StyledStatus(
-						status=res[0],
-						style=Style(
-							db_id=int(res[4]),
-							background=res[1],
-							text=res[2],
-							bold=bool(res[3])
-						)
-					)
+		styled_statuses.append(
+			StyledStatus(
+				status=res[0],
+				style=Style(
+					db_id=style_id,
+					background=res[1],
+					text=res[2],
+					bold=bool(res[3])
 				)
+			)
+		)
 
-		return styled_statuses
+	return styled_statuses
 
 
 # Gets styled points system
@@ -161,38 +153,23 @@ def get_styled_points_system(championship_id: int, scale: float, session_id: int
 
 # Gets localised abbreviations of nonscoring statuses
 def get_nonscoring_abbreviations(wiki_id: int) -> list[LocalisedAbbreviation] | None:
-	db: Connection | None = db_connection()
+	localised_statuses: Mapping[tuple[int, str], str] | None = get_reference_table('localised_status')
 
-	if db is None:
-		print("Couldn't connect to the database.")
+	if localised_statuses is None:
 		return
 
-	with db:
-		query = '''
-			SELECT rs.status, ls.code 
-			FROM localised_status ls
-			JOIN result_styling rs
-			ON rs.id = ls.style_id
-			WHERE ls.wikipedia_id = :wiki;
-		'''
-		params = {
-			'wiki': wiki_id
-		}
+	abbreviations: list[LocalisedAbbreviation] = list()
 
-		result = db.execute(query, params).fetchall()
-
-		abbreviations: list[LocalisedAbbreviation] = list()
-
-		if len(result) > 0:
-			for res in result:
-				abbreviations.append(
-					LocalisedAbbreviation(
-						status=res[0],
-						abbr=res[1]
-					)
+	for (wikipedia_id, status), code in localised_statuses.items():
+		if wikipedia_id == wiki_id:
+			abbreviations.append(
+				LocalisedAbbreviation(
+					status=status,
+					abbr=code
 				)
+			)
 
-		return abbreviations
+	return abbreviations
 
 
 # Gets number of races held in given classification
@@ -205,8 +182,8 @@ def get_races_held(classification_id: int) -> int | None:
 
 	with db:
 		query = '''
-			SELECT MAX(round_number)
-			FROM score
+			SELECT MAX(last_round)
+			FROM standing
 			WHERE classification_id = :cl_id;
 		'''
 
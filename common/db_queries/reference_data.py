@@ -0,0 +1,98 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	from collections.abc import Callable, Mapping
+	from sqlite3 import Connection
+	from types import MappingProxyType
+	from common.db_connect import db_connection
+
+# Queries reading small tables which rarely change, with functions turning their rows into dictionary's items.
+# If a key repeats then its first row is kept, the same one a single-row query would return.
+reference_tables: dict[str, tuple[str, Callable[[tuple], tuple]]] = {
+	'tyre': (
+		'SELECT codename, manufacturer_name FROM tyre ORDER BY rowid;',
+		lambda r: (r[0], r[1])
+	),
+	'country_code': (
+		'SELECT code, country FROM country_code ORDER BY rowid;',
+		lambda r: (int(r[0]), r[1])
+	),
+	'result_styling': (
+		'SELECT id, status, background_hex, text_colour_hex, bold FROM result_styling ORDER BY rowid;',
+		lambda r: (int(r[0]), (r[1], r[2], r[3], r[4]))
+	),
+	'localised_status': (
+		'''
+			SELECT ls.wikipedia_id, rs.status, ls.code
+			FROM localised_status ls
+			JOIN result_styling rs
+			ON rs.id = ls.style_id
+			ORDER BY ls.rowid;
+		''',
+		lambda r: ((int(r[0]), r[1]), r[2])
+	)
+}
+
+# Loaded tables, they're read-only so callers can't modify cached data by accident
+cached_tables: dict[str, Mapping] = dict()
+
+# Connection and its state when the tables were loaded or checked last time
+cache_state: tuple[Connection, int, int] | None = None
+
+
+# Gets state of the connection, data_version changes after writes of other connections
+# and total_changes after writes of the connection itself
+def get_connection_state(db: Connection) -> tuple[Connection, int, int]:
+	return db, int(db.execute('PRAGMA data_version;').fetchone()[0]), db.total_changes
+
+
+# Empties cache if the database was changed since the tables were loaded.
+# It's called once before each import instead of checking the database on every lookup.
+def refresh_reference_tables() -> None:
+	global cached_tables, cache_state
+
+	if cache_state is None:
+		return
+
+	db: Connection | None = db_connection()
+
+	if db is None or get_connection_state(db) != cache_state:
+		cached_tables.clear()
+		cache_state = None
+
+
+# Gets contents of a small table as a read-only dictionary, it's read from the database only on first use.
+# Cache is emptied when the shared connection was replaced, changes of the database are checked only
+# by refresh_reference_tables.
+def get_reference_table(table: str) -> Mapping | None:
+	global reference_tables, cached_tables, cache_state
+
+	if table not in reference_tables:
+		raise ValueError(f"{table} table isn't a reference table")
+
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	if cache_state is None or cache_state[0] is not db:
+		cached_tables.clear()
+		cache_state = get_connection_state(db)
+
+	if table not in cached_tables:
+		query, to_item = reference_tables[table]
+
+		items: dict = dict()
+
+		with db:
+			for row in db.execute(query):
+				key, value = to_item(row)
+				items.setdefault(key, value)
+
+		cached_tables[table] = MappingProxyType(items)
+
+	return cached_tables[table]
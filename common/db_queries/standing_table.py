@@ -0,0 +1,68 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	import sqlite3
+	from collections.abc import Iterable
+	from sqlite3 import Connection
+	from common.db_connect import db_connection
+	from common.db_queries.batch import chunks, placeholders
+
+# Query saving summaries of scores matching given condition.
+# Rounds scored are rounds in which entity got any points, best place ignores qualifying and non-numeric places.
+insert_standing_query: str = '''
+	INSERT INTO standing (classification_id, entity_id, total_points, rounds_scored, best_place, last_round)
+	SELECT sc.classification_id, sc.entity_id, SUM(sc.points),
+		COUNT(DISTINCT CASE WHEN sc.points > 0 THEN sc.round_number END),
+		MIN(
+			CASE WHEN ses.name != 'QUALIFYING' AND sc.place != '' AND sc.place NOT GLOB '*[^0-9]*'
+			THEN CAST(sc.place AS INTEGER) END
+		),
+		MAX(sc.round_number)
+	FROM score sc
+	JOIN "session" ses
+	ON ses.id = sc.session_id
+	{condition}
+	GROUP BY sc.classification_id, sc.entity_id;
+'''
+
+
+# Recalculates summaries of given entities' scores, entity ids are grouped by classification's id
+def refresh_standings(db: Connection, entities: dict[int, Iterable[int]]) -> None:
+	for classification_id, entity_ids in entities.items():
+		for chunk in chunks(entity_ids):  # type: list[int]
+			query = f'''
+				DELETE FROM standing
+				WHERE classification_id = ?
+				AND entity_id IN ({placeholders(len(chunk))});
+			'''
+
+			db.execute(query, [classification_id, *chunk])
+
+			condition = f'WHERE sc.classification_id = ? AND sc.entity_id IN ({placeholders(len(chunk))})'
+
+			db.execute(insert_standing_query.format(condition=condition), [classification_id, *chunk])
+
+
+# Recalculates whole 'standing' table from scores, repairs summaries which went out of sync.
+# Returns number of saved summaries.
+def rebuild_standings() -> int | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	try:
+		with db:
+			db.execute('DELETE FROM standing;')
+			db.execute(insert_standing_query.format(condition=''))
+	except sqlite3.Error as e:
+		print(f'An error occurred while rebuilding standings - {e.__str__()}')
+		return None
+
+	result = db.execute('SELECT COUNT(*) FROM standing;').fetchone()
+
+	return int(result[0])
@@ -5,9 +5,15 @@ sys.dont_write_bytecode = True
 
 if True:  # noqa: E402
 	import sqlite3
+	from collections.abc import Iterable
 	from sqlite3 import Connection
 	from common.db_connect import db_connection
+	from common.db_queries.batch import chunks, placeholders
+	from common.db_queries.entity_table import add_entities
+	from common.db_queries.touch_buffer import touch
+	from common.models.entity_import import ImportReport
 	from common.models.teams import Team, TeamEligibility
+	from common.schema.migrations import analyze_tables
 
 
 # Checks whether a team is in database
@@ -47,7 +53,44 @@ def check_team_exists(
 		return bool(result[0])
 
 
-# Gets team's data from the database and refreshes team's timestamp
+# Gets keys (codename, flag, car number) of given teams of a championship which have links in Wikipedia version,
+# looked up with one query per chunk of codenames
+def get_linked_team_keys(
+	keys: Iterable[tuple[str, str, str]], championship_id: int, wiki_id: int
+) -> set[tuple[str, str, str]] | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	keys = set(keys)
+	linked: set[tuple[str, str, str]] = set()
+
+	with db:
+		for chunk in chunks(k[0] for k in keys):  # type: list[str]
+			query = f'''
+				SELECT DISTINCT t.codename, t.flag, t.car_number
+				FROM team t
+				JOIN team_wikipedia tw
+				ON t.id = tw.team_id
+				WHERE t.championship_id = ?
+				AND tw.wikipedia_id = ?
+				AND t.codename IN ({placeholders(len(chunk))});
+			'''
+
+			try:
+				result = db.execute(query, [championship_id, wiki_id, *chunk]).fetchall()
+			except sqlite3.Error as e:
+				print(f'An error occurred while looking for teams in the database - {e.__str__()}')
+				return None
+
+			linked.update(k for k in result if k in keys)
+
+	return linked
+
+
+# Gets team's data from the database and marks team as used
 def get_team_data(codename: str, championship_id: int, wiki_id) -> Team | None:
 	db = db_connection()
 
@@ -76,14 +119,7 @@ def get_team_data(codename: str, championship_id: int, wiki_id) -> Team | None:
 		if result is None:
 			return Team()
 		else:
-			query = '''
-				UPDATE team
-				SET last_used = CURRENT_TIMESTAMP
-				WHERE id = :team_id;
-			'''
-			params = {'team_id': int(result[4])}
-
-			db.execute(query, params)
+			touch('team', [int(result[4])])
 
 			return Team(
 				codename=codename,
@@ -116,13 +152,7 @@ def get_id_and_scoring(codename: str, championship_id: int) -> TeamEligibility |
 		if result is None:
 			return TeamEligibility()
 		else:
-			refresh_query = '''
-				UPDATE team
-				SET last_used = CURRENT_TIMESTAMP
-				WHERE id = :team_id;
-			'''
-
-			db.execute(refresh_query, {'team_id': int(result[0])})
+			touch('team', [int(result[0])])
 
 			return TeamEligibility(
 				team=Team(
@@ -133,145 +163,217 @@ def get_id_and_scoring(codename: str, championship_id: int) -> TeamEligibility |
 			)
 
 
-# Adds teams data to the database
-def add_teams(teams: list[Team], championship_id: int, wiki_id: int, type_id: int) -> None:
+# Gets data of many teams of a championship at once and marks them as used.
+# Returned dictionary is keyed by codename, teams missing in database are left out.
+def get_teams_data(codenames: Iterable[str], championship_id: int, wiki_id: int) -> dict[str, Team] | None:
 	db: Connection | None = db_connection()
 
 	if db is None:
 		print("Couldn't connect to the database.")
-		return
+		return None
 
-	team_id: int | None = None
-	exists: bool = False
+	teams: dict[str, Team] = dict()
 
-	for team in teams:
-		with db:
-			db.execute('BEGIN')
+	with db:
+		for chunk in chunks(codenames):  # type: list[str]
+			query = f'''
+				SELECT t.codename, short_link, long_link, t.flag, t.car_number, team_id
+				FROM team_wikipedia tw
+				JOIN team t
+				ON t.id = tw.team_id
+				WHERE t.championship_id = ?
+				AND wikipedia_id = ?
+				AND t.codename IN ({placeholders(len(chunk))});
+			'''
+
+			result = db.execute(query, [championship_id, wiki_id, *chunk]).fetchall()
+
+			for r in result:
+				teams[r[0]] = Team(
+					codename=r[0],
+					nationality=r[3],
+					car_number=r[4],
+					short_link=r[1],
+					long_link=r[2],
+					db_id=int(r[5])
+				)
 
-			# Checking whether team is in 'team' table
-			query = '''
-				SELECT id
+	touch('team', [t.db_id for t in teams.values()])
+
+	return teams
+
+
+# Gets ids and points eligibility of many teams of a championship at once and marks them as used.
+# Returned dictionary is keyed by codename, teams missing in database are left out.
+def get_teams_id_and_scoring(codenames: Iterable[str], championship_id: int) -> dict[str, TeamEligibility] | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	teams: dict[str, TeamEligibility] = dict()
+
+	with db:
+		for chunk in chunks(codenames):  # type: list[str]
+			query = f'''
+				SELECT codename, id, points_eligible
 				FROM team
-				WHERE codename = :codename
-				AND flag = :flag
-				AND car_number = :car_number
-				AND championship_id = :championship_id;
+				WHERE championship_id = ?
+				AND codename IN ({placeholders(len(chunk))});
 			'''
-			params = {
-				'codename': team.codename,
-				'flag': team.nationality,
-				'car_number': team.car_number,
-				'championship_id': championship_id
-			}
-
-			result = db.execute(query, params).fetchone()
-
-			if result is None:
-				# Adding team to 'entity' table
-				query = '''
-					INSERT INTO entity (type_id)
-					VALUES (:type_id)
-				'''
-
-				params = {'type_id': type_id}
-
-				try:
-					db.execute(query, params)
-				except sqlite3.OperationalError as e:
-					db.execute('ROLLBACK')
-					print('An error occurred while adding {team}: {error}'.format(
-						team=team.codename,
-						error=e
-					))
-					continue
 
-				# Checking id of added team
-				query = '''
-					SELECT MAX(id)
-					FROM entity
-					WHERE type_id = :type_id
-				'''
+			result = db.execute(query, [championship_id, *chunk]).fetchall()
 
-				params = {'type_id': type_id}
+			for r in result:
+				teams[r[0]] = TeamEligibility(
+					team=Team(
+						db_id=int(r[1]),
+						codename=r[0]
+					),
+					eligibility=bool(r[2])
+				)
 
-				team_id = int(db.execute(query, params).fetchone()[0])
+	touch('team', [t.team.db_id for t in teams.values()])
 
-				# Adding team's data to 'team' table
-				query = '''
-					INSERT INTO team (id, codename, flag, car_number, championship_id)
-					VALUES (:id, :codename, :flag, :car_number, :championship_id)
-				'''
-				params = {
-					'id': team_id,
-					'codename': team.codename,
-					'flag': team.nationality,
-					'car_number': team.car_number,
-					'championship_id': championship_id
-				}
+	return teams
 
-				try:
-					db.execute(query, params)
-				except sqlite3.OperationalError as e:
-					db.execute('ROLLBACK')
-					print('An error occurred while adding {team}: {error}'.format(
-						team=team.codename,
-						error=e
-					))
-					continue
-			else:
-				exists = True
-				# Checking whether team's data is in 'team_wikipedia' table
-				team_id = result[0]
-
-				query = '''
-					SELECT short_link, long_link
-					FROM team_wikipedia
-					WHERE team_id = :team_id
-					AND wikipedia_id = :wikipedia_id;
-				'''
-				params = {
-					'team_id': team_id,
-					'wikipedia_id': wiki_id
-				}
 
-				result = db.execute(query, params).fetchone()
+# Gets teams of a championship with given codenames, keyed by codename, flag and car number
+def get_team_ids(db: Connection, codenames: Iterable[str], championship_id: int) -> dict[tuple[str, str, str], int]:
+	team_ids: dict[tuple[str, str, str], int] = dict()
+
+	for chunk in chunks(codenames):  # type: list[str]
+		query = f'''
+			SELECT codename, flag, car_number, id
+			FROM team
+			WHERE championship_id = ?
+			AND codename IN ({placeholders(len(chunk))})
+			ORDER BY rowid;
+		'''
+
+		for r in db.execute(query, [championship_id, *chunk]):
+			team_ids.setdefault((r[0], r[1], r[2]), int(r[3]))
+
+	return team_ids
+
+
+# Gets links of given teams in Wikipedia version, keyed by team's id
+def get_team_links(db: Connection, team_ids: Iterable[int], wiki_id: int) -> dict[int, list[str]]:
+	links: dict[int, list[str]] = dict()
+
+	for chunk in chunks(team_ids):  # type: list[int]
+		query = f'''
+			SELECT team_id, short_link, long_link
+			FROM team_wikipedia
+			WHERE wikipedia_id = ?
+			AND team_id IN ({placeholders(len(chunk))});
+		'''
+
+		for r in db.execute(query, [wiki_id, *chunk]):
+			links.setdefault(int(r[0]), [r[1], r[2]])
+
+	return links
+
+
+# Adds teams data to the database in one transaction, either all of them are saved or none.
+# Teams are identified by codename, flag and car number within championship. Teams already in the database
+# only get links, teams which already have links in given Wikipedia are skipped.
+# A team saved before with another flag is added as a new team and its previous flags are reported.
+def add_teams(teams: list[Team], championship_id: int, wiki_id: int, type_id: int) -> ImportReport | None:
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	report = ImportReport()
+
+	# Team repeated in imported data is saved once
+	unique_teams: dict[tuple[str, str, str], Team] = dict()
+
+	for team in teams:
+		key: tuple[str, str, str] = (team.codename, team.nationality, team.car_number)
+
+		if key in unique_teams:
+			report.skipped.append(team.codename)
+		else:
+			unique_teams[key] = team
+
+	team_query = '''
+		INSERT INTO team (id, codename, flag, car_number, championship_id)
+		VALUES (:id, :codename, :flag, :car_number, :championship_id);
+	'''
+	link_query = '''
+		INSERT INTO team_wikipedia (wikipedia_id, team_id, short_link, long_link)
+		VALUES (:wikipedia_id, :team_id, :short_link, :long_link);
+	'''
+
+	try:
+		with db:
+			# Write lock is taken before teams are looked up, so another import can't add them in the meantime
+			db.execute('BEGIN IMMEDIATE')
+
+			team_ids: dict[tuple[str, str, str], int] = get_team_ids(
+				db, [t.codename for t in unique_teams.values()], championship_id
+			)
+			links: dict[int, list[str]] = get_team_links(db, team_ids.values(), wiki_id)
+
+			# Flags of teams already in the database, keyed by codename and car number
+			saved_flags: dict[tuple[str, str], list[str]] = dict()
+
+			for codename, flag, car_number in team_ids.keys():
+				saved_flags.setdefault((codename, car_number), []).append(flag)
+
+			new_keys: list[tuple[str, str, str]] = [k for k in unique_teams.keys() if k not in team_ids]
+			new_team_ids: dict[tuple[str, str, str], int] = dict(
+				zip(new_keys, add_entities(db, type_id, len(new_keys)))
+			)
+
+			team_ids.update(new_team_ids)
+
+			links_params: list[dict[str, int | str]] = list()
+
+			for key, team in unique_teams.items():  # type: tuple[str, str, str], Team
+				team_id: int = team_ids[key]
 
-				# If team's data is in 'team_wikipedia' table
-				if result is not None:
-					db.execute('ROLLBACK')
-					print('{team} already has links in database: "{short_link}", "{long_link}"'.format(
-						team=team.codename,
-						short_link=result[0],
-						long_link=result[1]
-					))
+				if team_id in links:
+					report.skipped.append(team.codename)
+					report.existing_links[team.codename] = links[team_id]
 					continue
 
-			# Adding links to 'team_wikipedia' table
-			query = '''
-				INSERT INTO team_wikipedia (wikipedia_id, team_id, short_link, long_link)
-				VALUES (:wikipedia_id, :team_id, :short_link, :long_link);
-			'''
+				if key in new_team_ids:
+					report.inserted.append(team.codename)
 
-			params = {
-				'wikipedia_id': wiki_id,
-				'team_id': team_id,
-				'short_link': team.short_link,
-				'long_link': team.long_link
-			}
+					other_flags: list[str] = saved_flags.get((team.codename, team.car_number), [])
 
-			try:
-				db.execute(query, params)
-			except sqlite3.OperationalError as e:
-				db.execute('ROLLBACK')
-				print('An error occurred while adding {team}: {error}'.format(
-					team=team.codename,
-					error=e
-				))
-				continue
-
-			db.execute('COMMIT')
-
-			if exists:
-				print(f'{team.codename} - successfully added links to database')
-			else:
-				print(f'{team.codename} - successfully added data to database')
+					if len(other_flags) > 0:
+						report.changed_flags[team.codename] = other_flags
+				else:
+					report.linked.append(team.codename)
+
+				links_params.append({
+					'wikipedia_id': wiki_id,
+					'team_id': team_id,
+					'short_link': team.short_link,
+					'long_link': team.long_link
+				})
+
+			db.executemany(team_query, [
+				{
+					'id': team_id,
+					'codename': unique_teams[key].codename,
+					'flag': unique_teams[key].nationality,
+					'car_number': unique_teams[key].car_number,
+					'championship_id': championship_id
+				}
+				for key, team_id in new_team_ids.items()
+			])
+			db.executemany(link_query, links_params)
+	except sqlite3.Error as e:
+		print(f'An error occurred while adding teams to the database - {e.__str__()}')
+		return None
+
+	analyze_tables(db, ['entity', 'team', 'team_wikipedia'])
+
+	return report
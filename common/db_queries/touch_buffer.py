@@ -0,0 +1,109 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	import atexit
+	import sqlite3
+	from collections.abc import Iterable
+	from sqlite3 import Connection
+	from common.db_connect import db_absolute, db_connection, is_snapshot
+	from common.db_queries.batch import chunks, placeholders
+
+# Tables whose rows have last used timestamps
+touchable_tables: tuple[str, ...] = ('driver', 'team', 'car', 'manufacturer')
+
+# Ids of entities used during the run grouped by table, their timestamps are refreshed on flush
+touched_ids: dict[str, set[int]] = {table: set() for table in touchable_tables}
+
+# Whether usage of entities is saved at all, read-only runs can turn it off
+touching_enabled: bool = True
+
+
+# Marks rows of given table as used
+def touch(table: str, ids: Iterable[int]) -> None:
+	global touching_enabled
+
+	if table not in touchable_tables:
+		raise ValueError(f"{table} table doesn't have last used timestamps")
+
+	if touching_enabled:
+		touched_ids[table].update(ids)
+
+
+# Turns saving usage of entities on or off, turning it off discards buffered ids
+def set_touching(enabled: bool) -> None:
+	global touching_enabled
+
+	touching_enabled = enabled
+
+	if not enabled:
+		for ids in touched_ids.values():
+			ids.clear()
+
+
+# Removes buffered ids and returns them, a process which only reads data can pass them to the one saving them
+def take_touched() -> dict[str, set[int]]:
+	taken: dict[str, set[int]] = {table: set(ids) for table, ids in touched_ids.items()}
+
+	for ids in touched_ids.values():
+		ids.clear()
+
+	return taken
+
+
+# Refreshes timestamps of given table's rows, one statement per chunk of ids
+def refresh_timestamps(db: Connection, table: str, ids: Iterable[int]) -> None:
+	if table not in touchable_tables:
+		raise ValueError(f"{table} table doesn't have last used timestamps")
+
+	for chunk in chunks(ids):  # type: list[int]
+		query = f'UPDATE {table} SET last_used = CURRENT_TIMESTAMP WHERE id IN ({placeholders(len(chunk))});'
+
+		db.execute(query, chunk)
+
+
+# Opens a plain connection to the file, used to save timestamps of a run working on an in-memory copy.
+# It doesn't change settings or schema of the database, only the timestamps are written.
+def open_touch_connection() -> Connection | None:
+	try:
+		return sqlite3.connect(f'file:{db_absolute}?mode=rw', uri=True)
+	except sqlite3.Error:
+		return None
+
+
+# Saves buffered timestamps into the database in one transaction.
+# Nothing is saved while another transaction is pending, so it won't be committed by accident.
+# In snapshot mode timestamps are saved to the file through a separate short-lived connection.
+def flush() -> None:
+	if all(len(ids) == 0 for ids in touched_ids.values()):
+		return
+
+	snapshot: bool = is_snapshot()
+
+	db: Connection | None = open_touch_connection() if snapshot else db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return
+
+	if db.in_transaction:
+		return
+
+	try:
+		with db:
+			for table, ids in touched_ids.items():
+				refresh_timestamps(db, table, ids)
+	except sqlite3.Error as e:
+		print(f'An error occurred while refreshing timestamps - {e.__str__()}')
+		return
+	finally:
+		if snapshot:
+			db.close()
+
+	for ids in touched_ids.values():
+		ids.clear()
+
+
+atexit.register(flush)
@@ -4,26 +4,15 @@ import sys
 sys.dont_write_bytecode = True
 
 if True:  # noqa: E402
-	import sqlite3
-	from sqlite3 import Connection
-	from common.db_connect import db_connection
+	from collections.abc import Mapping
+	from common.db_queries.reference_data import get_reference_table
 
 
-#
+# Gets name of tyres' manufacturer by its letter code used in results files
 def get_tyre_manufacturer_name(letter_code: str) -> str | None:
-	db: Connection | None = db_connection()
+	tyres: Mapping[str, str] | None = get_reference_table('tyre')
 
-	if db is None:
-		print("Couldn't connect to the database.")
+	if tyres is None:
 		return None
 
-	with db:
-		query: str = '''
-			SELECT manufacturer_name
-			FROM tyre
-			WHERE codename = :letter;
-		'''
-
-		result = db.execute(query, {'letter': letter_code}).fetchone()
-
-		return '' if result is None else result[0]
+	return tyres.get(letter_code, '')
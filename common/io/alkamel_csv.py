@@ -0,0 +1,135 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	import glob
+	import os
+	from collections.abc import Iterator
+	from csv import DictReader
+	from typing import TextIO
+	from common.models.alkamel import AlkamelDriver, AlkamelRow
+
+# Organisers use different headers for the same values, the first found header is used
+position_headers: tuple[str, ...] = ('POSITION', 'POS')
+tyres_headers: tuple[str, ...] = ('TYRES', 'TIRES')
+
+# Up to 4 driver per car at maximum
+max_drivers: int = 4
+
+
+# Reads headers of .csv file, only its first line is read
+def read_csv_headers(path: str, delimiter: str = ',') -> list[str]:
+	with open(path, mode='r', encoding='utf-8-sig') as csv_file:
+		return list(DictReader(csv_file, delimiter=delimiter).fieldnames or list())
+
+
+# Finds .csv files in given directory or matching given glob pattern, e.g. "2024/*/*.csv"
+def find_results_files(path: str) -> list[str]:
+	if os.path.isdir(path):
+		paths: list[str] = [os.path.join(path, f) for f in os.listdir(path)]
+	else:
+		paths: list[str] = glob.glob(path, recursive=True)
+
+	return sorted(p for p in paths if os.path.isfile(p) and p.lower().endswith('.csv'))
+
+
+class AlkamelCsvReader:
+	def __init__(self, path: str) -> None:
+		self.path = path
+		self.file: TextIO | None = None
+		self.reader: DictReader | None = None
+		self.headers: list[str] = list()
+		self.position_column: str | None = None
+		self.tyres_column: str | None = None
+		# Columns with first name (or full name), last name and country of every driver
+		self.driver_columns: list[tuple[str, str | None, str | None]] = list()
+		self.line_count: int = 0
+
+	def __enter__(self) -> 'AlkamelCsvReader':
+		self.file = open(self.path, mode='r', encoding='utf-8-sig')
+		self.reader = DictReader(self.file, delimiter=';')
+		self.sniff_headers(list(self.reader.fieldnames or list()))
+
+		return self
+
+	def __exit__(self, *args) -> None:
+		if self.file is not None:
+			self.file.close()
+
+	# Finds columns whose headers differ between files
+	def sniff_headers(self, headers: list[str]) -> None:
+		self.headers = headers
+
+		self.position_column = next((h for h in position_headers if h in headers), None)
+		self.tyres_column = next((h for h in tyres_headers if h in headers), None)
+
+		# Drivers' names are either in one column or in separate columns for first names and last names
+		if 'DRIVER_1' in headers:
+			self.driver_columns = [
+				(f'DRIVER_{x}', None, None) for x in range(1, max_drivers + 1) if f'DRIVER_{x}' in headers
+			]
+		elif 'DRIVER1_FIRSTNAME' in headers and 'DRIVER1_SECONDNAME' in headers:
+			self.driver_columns = [
+				(
+					f'DRIVER{x}_FIRSTNAME',
+					f'DRIVER{x}_SECONDNAME',
+					f'DRIVER{x}_COUNTRY' if f'DRIVER{x}_COUNTRY' in headers else None
+				)
+				for x in range(1, max_drivers + 1)
+				if f'DRIVER{x}_FIRSTNAME' in headers and f'DRIVER{x}_SECONDNAME' in headers
+			]
+		else:
+			self.driver_columns = list()
+
+	# Returns True if file has all given columns
+	def has_columns(self, *columns: str) -> bool:
+		return all(c in self.headers for c in columns)
+
+	# Returns True if file has columns with drivers' names
+	@property
+	def has_drivers(self) -> bool:
+		return len(self.driver_columns) > 0
+
+	# Gets drivers whose names are given in results row
+	def read_drivers(self, values: dict[str, str | None]) -> list[AlkamelDriver]:
+		drivers: list[AlkamelDriver] = list()
+
+		for firstname_column, lastname_column, country_column in self.driver_columns:
+			firstname: str | None = values.get(firstname_column)
+
+			# Shorter row
+			if firstname is None:
+				continue
+
+			lastname: str | None = None
+
+			if lastname_column is not None:
+				lastname = values.get(lastname_column) or ''
+
+			driver = AlkamelDriver(
+				firstname=firstname,
+				lastname=lastname,
+				country=values.get(country_column) if country_column is not None else None
+			)
+
+			if driver.codename != '':
+				drivers.append(driver)
+
+		return drivers
+
+	# Reads rows of the file one by one
+	def __iter__(self) -> Iterator[AlkamelRow]:
+		if self.reader is None:
+			raise RuntimeError(f'{self.path} file must be opened with "with" statement before reading it')
+
+		for values in self.reader:  # type: dict[str, str | None]
+			self.line_count += 1
+
+			yield AlkamelRow(
+				values=values,
+				position=values.get(self.position_column) if self.position_column is not None else None,
+				tyres=values.get(self.tyres_column) if self.tyres_column is not None else None,
+				drivers=self.read_drivers(values)
+			)
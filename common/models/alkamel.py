@@ -0,0 +1,49 @@
+class AlkamelDriver:
+	def __init__(self, firstname: str, lastname: str | None = None, country: str | None = None) -> None:
+		self.firstname = firstname
+		self.lastname = lastname
+		self.country = country
+
+	# Returns driver's name as it's written in the file, last name is None if whole name is in one column
+	@property
+	def codename(self) -> str:
+		if self.lastname is None:
+			return self.firstname.lstrip()
+
+		return f'{self.firstname} {self.lastname}'.lstrip()
+
+
+class AlkamelRow:
+	def __init__(
+		self, values: dict[str, str | None], position: str | None,
+		tyres: str | None, drivers: list[AlkamelDriver]
+	) -> None:
+		self.values = values
+		self.number = values.get('NUMBER')
+		self.team = values.get('TEAM')
+		self.category = values.get('CLASS')
+		self.status = values.get('STATUS')
+		self.vehicle = values.get('VEHICLE')
+		self.position = position
+		self.tyres = tyres
+		self.drivers = drivers
+
+	def __getitem__(self, column: str) -> str | None:
+		return self.values[column]
+
+	def __contains__(self, column: str) -> bool:
+		return column in self.values
+
+	# Returns value of given column or default value if file doesn't have such column
+	def get(self, column: str, default: str | None = None) -> str | None:
+		return self.values.get(column, default)
+
+	# Returns codename of car's team used in the database
+	@property
+	def team_codename(self) -> str:
+		return f'#{self.number} {self.team}'
+
+	# Returns codenames of car's drivers, names shorter than two characters are skipped
+	@property
+	def driver_codenames(self) -> list[str]:
+		return [d.codename for d in self.drivers if len(d.codename) > 1]
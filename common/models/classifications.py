@@ -1,3 +1,6 @@
+import re
+
+
 class Classification:
     def __init__(
             self, db_id: int, name: str, championship_id: int,
@@ -37,3 +40,34 @@ class ClassificationScoring:
     def __init__(self, name: str, scoring_entities: int):
         self.name = name
         self.scoring_entities = scoring_entities
+
+
+class EligibilityIndex:
+    def __init__(self, classifications: list[Classification], ineligible: dict[int, frozenset[int]]) -> None:
+        self.classifications = classifications
+        self.ineligible = ineligible
+        self.matching: dict[tuple[str, str], tuple[Classification, ...]] = dict()
+
+    # Classifications whose names contain both category and type (driver, team or manufacturer),
+    # names are searched once per category and type
+    def get_classifications(self, category: str, cl_type: str) -> tuple[Classification, ...]:
+        key = (category, cl_type)
+
+        if key not in self.matching:
+            self.matching[key] = tuple(
+                cl for cl in self.classifications
+                if re.search(category, cl.name, re.IGNORECASE) and re.search(cl_type, cl.name, re.IGNORECASE)
+            )
+
+        return self.matching[key]
+
+    def is_eligible(self, classification_id: int, entity_id: int) -> bool:
+        return entity_id not in self.ineligible.get(classification_id, frozenset())
+
+    # Last matching classification in which all entities can score
+    def find(self, category: str, cl_type: str, entity_ids: list[int]) -> Classification | None:
+        for cl in reversed(self.get_classifications(category, cl_type)):
+            if all(self.is_eligible(cl.db_id, e) for e in entity_ids):
+                return cl
+
+        return None
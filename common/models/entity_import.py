@@ -0,0 +1,13 @@
+class ImportReport:
+	def __init__(self) -> None:
+		# Codenames of entities added to the database together with their links
+		self.inserted: list[str] = list()
+		# Codenames of entities which were already in the database and got links
+		self.linked: list[str] = list()
+		# Codenames of entities which weren't saved, because they already had links or repeated in imported data
+		self.skipped: list[str] = list()
+		# Links which were already in the database, keyed by codename of skipped entity
+		self.existing_links: dict[str, list[str]] = dict()
+		# Other flags of added entities which were already in the database, keyed by codename
+		self.changed_flags: dict[str, list[str]] = dict()
+
@@ -1,3 +1,5 @@
+import re
+
 from common.models.classifications import ClassificationScoring
 
 
@@ -24,3 +26,44 @@ class ManufacturerScoringCars:
     def __eq__(self, other):
         if type(other) is type(self):
             return self.manufacturer == other.manufacturer
+
+
+class ManufacturerMatcher:
+    def __init__(self, manufacturers: list[Manufacturer]) -> None:
+        self.manufacturers: dict[str, Manufacturer] = dict()
+
+        for m in manufacturers:
+            self.manufacturers.setdefault(m.codename.lower(), m)
+
+        # Longer codenames go first, so at the same position the longest one is matched
+        codenames = sorted(self.manufacturers.keys(), key=len, reverse=True)
+
+        self.pattern: re.Pattern | None = None
+
+        if len(codenames) > 0:
+            self.pattern = re.compile('|'.join(re.escape(c) for c in codenames), re.IGNORECASE)
+
+    def find(self, vehicle: str) -> Manufacturer | None:
+        if self.pattern is None:
+            return None
+
+        # Matches can overlap, so the search is repeated from every position after the previous match's start,
+        # otherwise a shorter codename could hide a longer one starting inside it
+        longest: str = ''
+        position: int = 0
+
+        while True:
+            match: re.Match | None = self.pattern.search(vehicle, position)
+
+            if match is None:
+                break
+
+            if len(match.group()) > len(longest):
+                longest = match.group()
+
+            position = match.start() + 1
+
+        if longest == '':
+            return None
+
+        return self.manufacturers.get(longest.lower())
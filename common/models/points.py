@@ -1,5 +1,9 @@
 from enum import Enum
 
+from common.models.classifications import Classification, ClassificationScoring, EligibilityIndex
+from common.models.manufacturer import ManufacturerMatcher
+from common.models.styles import StyledStatus
+
 
 class AwardedPoints(Enum):
 	FULL = 1.00,
@@ -7,3 +11,29 @@ class AwardedPoints(Enum):
 
 	def __init__(self, multiplier: float):
 		self.multiplier = multiplier
+
+
+class PointsImport:
+	def __init__(
+		self, round_number: int, session: str, path: str,
+		scale: float | None = None, awarded_points: AwardedPoints = AwardedPoints.FULL
+	) -> None:
+		self.round_number = round_number
+		self.session = session
+		self.path = path
+		self.scale = scale
+		self.awarded_points = awarded_points
+
+
+class SeasonData:
+	def __init__(
+		self, wiki_id: int, classifications: list[Classification], oem_scoring_cars: list[ClassificationScoring],
+		nonscoring_statuses: list[StyledStatus], eligibility: EligibilityIndex,
+		manufacturer_matcher: ManufacturerMatcher | None
+	) -> None:
+		self.wiki_id = wiki_id
+		self.classifications = classifications
+		self.oem_scoring_cars = oem_scoring_cars
+		self.nonscoring_statuses = nonscoring_statuses
+		self.eligibility = eligibility
+		self.manufacturer_matcher = manufacturer_matcher
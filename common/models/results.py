@@ -41,7 +41,8 @@ class RoundResult:
 
 class EntityResults:
     def __init__(
-        self, db_id: int, link: str, flag: str, points: float, car_no: int | None, results: list[RoundResult] | None = None
+        self, db_id: int, link: str, flag: str, points: float, car_no: int | None,
+        results: list[RoundResult] | None = None, position: int | None = None
     ):
         self.db_id = db_id
         self.link = link
@@ -49,3 +50,18 @@ class EntityResults:
         self.points = points
         self.car_no = car_no
         self.results = results
+        self.position = position
+
+
+class Score:
+    def __init__(
+        self, classification_id: int, round_number: int, session_id: int,
+        entity_id: int, place: int | str, points: float, style_id: int
+    ) -> None:
+        self.classification_id = classification_id
+        self.round_number = round_number
+        self.session_id = session_id
+        self.entity_id = entity_id
+        self.place = place
+        self.points = points
+        self.style_id = style_id
@@ -0,0 +1,130 @@
+from common.models.classifications import Classification, ClassificationScoring
+from common.models.points import AwardedPoints
+from common.models.results import ResultRow
+from common.models.styles import StyledPosition, StyledStatus
+
+
+class SessionScoring:
+	def __init__(
+		self, classifications: list[Classification], scoring_styles: list[StyledPosition],
+		nonscoring_styles: list[StyledStatus], session: str,
+		oem_classifications_scoring: list[ClassificationScoring], awarded_points: AwardedPoints
+	) -> None:
+		self.qualifying: bool = session.upper() == 'QUALIFYING'
+		self.multiplier: float = awarded_points.multiplier
+
+		# Next position in every classification
+		self.positions: dict[int, int] = {cl.db_id: 1 for cl in classifications}
+
+		# Styles and points of scoring positions, styles of other results
+		self.position_styles: dict[int, tuple[int, float]] = dict()
+		self.status_styles: dict[str, int] = dict()
+
+		for styled_position in scoring_styles:
+			self.position_styles.setdefault(
+				styled_position.position,
+				(styled_position.style.db_id, styled_position.points)
+			)
+
+		for styled_status in nonscoring_styles:
+			self.status_styles.setdefault(styled_status.status, styled_status.style.db_id)
+
+		self.nonscoring_statuses: frozenset[str] = frozenset(self.status_styles.keys())
+
+		# Numbers of each manufacturer's cars which can score in manufacturers' classifications
+		cars_limits: dict[str, int] = {x.name: x.scoring_entities for x in oem_classifications_scoring}
+
+		self.scoring_cars_limits: dict[int, int] = {
+			cl.db_id: cars_limits[cl.name] for cl in classifications if cl.name in cars_limits
+		}
+
+		# Numbers of cars which can still score, keyed by manufacturer's and classification's ids
+		self.scoring_cars: dict[tuple[int, int], int] = dict()
+
+	# Finds style and points of result, returns None if result shouldn't be saved
+	def find_result_style(self, status: str, position: int) -> tuple[int | None, float] | None:
+		match status:
+			case 'Classified':
+				style_id, points = self.position_styles.get(position, (None, 0.0))
+
+				if style_id is None:
+					# Nonscoring positions in qualifying sessions won't get any style
+					if not self.qualifying:
+						style_id = self.status_styles.get('Classified, nonscoring')
+					points = 0.0
+
+				return style_id, points
+			case 'Not classified' | 'Retired':
+				return self.status_styles.get(status), 0.0
+			case 'Disqualified':
+				# Entries disqualified from qualifying sessions will be ignored
+				if self.qualifying:
+					return None, 0.0
+
+				return self.status_styles.get(status), 0.0
+			case _:
+				return None
+
+	# Finds style, points and place of result in classification, next position is taken only by scored results
+	def score_result(self, status: str, classification_id: int) -> tuple[int, float, int | str] | None:
+		position: int = self.positions[classification_id]
+
+		found: tuple[int | None, float] | None = self.find_result_style(status, position)
+
+		if found is None or found[0] is None:
+			return None
+
+		if status in self.nonscoring_statuses:
+			return found[0], found[1] * self.multiplier, status
+
+		self.positions[classification_id] += 1
+
+		return found[0], found[1] * self.multiplier, position
+
+	# Finds style, points and place of result in manufacturers' classification.
+	# Only limited number of each manufacturer's cars can score, but every car takes next position.
+	def score_manufacturer_result(
+		self, status: str, manufacturer_id: int, classification_id: int
+	) -> tuple[int, float, int | str] | None:
+		position: int = self.positions[classification_id]
+		self.positions[classification_id] += 1
+
+		key: tuple[int, int] = (manufacturer_id, classification_id)
+		cars_left: int = self.scoring_cars.get(key, self.scoring_cars_limits.get(classification_id, 0))
+
+		if cars_left <= 0:
+			return None
+
+		self.scoring_cars[key] = cars_left - 1
+
+		found: tuple[int | None, float] | None = self.find_result_style(status, position)
+
+		if found is None or found[0] is None:
+			return None
+
+		if status in self.nonscoring_statuses:
+			return found[0], found[1] * self.multiplier, status
+
+		return found[0], found[1] * self.multiplier, position
+
+	# Saves positions, styles and points of row's results in all its classifications
+	def score_row(self, row: ResultRow) -> None:
+		eligible = row.eligible_classifications
+
+		if eligible.team_cl is not None:
+			result = self.score_result(row.status, eligible.team_cl.db_id)
+
+			if result is not None:
+				eligible.team_style_id, eligible.team_points, eligible.team_position = result
+		if eligible.manufacturer_cl is not None:
+			result = self.score_manufacturer_result(
+				row.status, row.manufacturer.db_id, eligible.manufacturer_cl.db_id
+			)
+
+			if result is not None:
+				eligible.manufacturer_style_id, eligible.manufacturer_points, eligible.manufacturer_position = result
+		if eligible.driver_cl is not None:
+			result = self.score_result(row.status, eligible.driver_cl.db_id)
+
+			if result is not None:
+				eligible.driver_style_id, eligible.driver_points, eligible.driver_position = result
@@ -0,0 +1,395 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	import sqlite3
+	from collections.abc import Iterable
+	from pathlib import Path
+	from sqlite3 import Connection
+
+	project_path = str(Path(__file__).parent.parent.parent)
+	if project_path not in sys.path:
+		sys.path.append(project_path)
+
+# Tables created by the first version of the schema, databases made before migrations existed already have them
+base_tables: list[str] = [
+	'''
+	CREATE TABLE IF NOT EXISTS wikipedia (
+		id INTEGER NOT NULL PRIMARY KEY,
+		version VARCHAR(16) NOT NULL
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS organiser (
+		id INTEGER NOT NULL PRIMARY KEY,
+		name VARCHAR(20) NOT NULL
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS championship (
+		id INTEGER NOT NULL PRIMARY KEY,
+		name VARCHAR(100) NOT NULL,
+		organiser_id INTEGER NOT NULL,
+		FOREIGN KEY (organiser_id) REFERENCES organiser (id) ON DELETE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS classification_type (
+		id INTEGER NOT NULL PRIMARY KEY,
+		name TEXT NOT NULL
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS entity_type (
+		id INTEGER NOT NULL PRIMARY KEY,
+		name VARCHAR(32) NOT NULL
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS entity (
+		id INTEGER NOT NULL PRIMARY KEY,
+		type_id INTEGER NOT NULL,
+		FOREIGN KEY (type_id) REFERENCES entity_type (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS driver (
+		id INTEGER NOT NULL PRIMARY KEY,
+		codename VARCHAR(255) NOT NULL,
+		flag VARCHAR(3) NOT NULL DEFAULT '?',
+		last_used DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+		FOREIGN KEY (id) REFERENCES entity (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS team (
+		id INTEGER NOT NULL PRIMARY KEY,
+		codename VARCHAR(255) NOT NULL,
+		flag VARCHAR(3) NOT NULL DEFAULT '?',
+		car_number VARCHAR(5) NOT NULL,
+		championship_id INTEGER NOT NULL,
+		last_used DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+		points_eligible BOOLEAN NOT NULL DEFAULT 1,
+		FOREIGN KEY (championship_id) REFERENCES championship (id),
+		FOREIGN KEY (id) REFERENCES entity (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS car (
+		id INTEGER NOT NULL PRIMARY KEY,
+		codename VARCHAR(255) NOT NULL,
+		last_used DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+		CONSTRAINT unq_car UNIQUE (codename)
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS manufacturer (
+		id INTEGER PRIMARY KEY REFERENCES entity (id),
+		codename VARCHAR(255) NOT NULL,
+		flag VARCHAR(3) NOT NULL DEFAULT '?',
+		last_used DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS driver_wikipedia (
+		wikipedia_id INTEGER NOT NULL,
+		driver_id INTEGER NOT NULL,
+		short_link VARCHAR(255) NOT NULL,
+		long_link VARCHAR(255),
+		FOREIGN KEY (wikipedia_id) REFERENCES wikipedia (id) ON DELETE CASCADE,
+		FOREIGN KEY (driver_id) REFERENCES driver (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS team_wikipedia (
+		wikipedia_id INTEGER NOT NULL,
+		team_id INTEGER NOT NULL,
+		short_link VARCHAR(255) NOT NULL,
+		long_link VARCHAR(255),
+		FOREIGN KEY (wikipedia_id) REFERENCES wikipedia (id) ON DELETE CASCADE,
+		FOREIGN KEY (team_id) REFERENCES team (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS car_wikipedia (
+		wikipedia_id INTEGER NOT NULL,
+		car_id INTEGER NOT NULL,
+		link VARCHAR(255) NOT NULL,
+		FOREIGN KEY (wikipedia_id) REFERENCES wikipedia (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (car_id) REFERENCES car (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS manufacturer_wikipedia (
+		wikipedia_id INTEGER NOT NULL,
+		manufacturer_id INTEGER NOT NULL,
+		link VARCHAR(255) NOT NULL,
+		FOREIGN KEY (wikipedia_id) REFERENCES wikipedia (id) ON DELETE CASCADE,
+		FOREIGN KEY (manufacturer_id) REFERENCES manufacturer (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS country_code (
+		code INTEGER NOT NULL PRIMARY KEY,
+		country CHAR(3) NOT NULL,
+		CONSTRAINT unq_country_code UNIQUE (country)
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS tyre (
+		id INTEGER NOT NULL PRIMARY KEY,
+		codename CHAR(1) NOT NULL,
+		manufacturer_name VARCHAR(100) NOT NULL
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS session (
+		id INTEGER NOT NULL PRIMARY KEY,
+		name VARCHAR(16) NOT NULL
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS result_styling (
+		id INTEGER NOT NULL PRIMARY KEY,
+		status VARCHAR(32) NOT NULL,
+		background_hex CHAR(6),
+		text_colour_hex CHAR(6),
+		bold BOOLEAN
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS localised_status (
+		wikipedia_id INTEGER NOT NULL,
+		style_id INTEGER NOT NULL,
+		code VARCHAR(3) NOT NULL,
+		FOREIGN KEY (wikipedia_id) REFERENCES wikipedia (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (style_id) REFERENCES result_styling (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS points_system (
+		id INTEGER NOT NULL PRIMARY KEY,
+		championship_id INTEGER NOT NULL,
+		points_scale DECIMAL(2) NOT NULL,
+		session_id INTEGER NOT NULL,
+		place INTEGER NOT NULL,
+		points INTEGER NOT NULL,
+		result_style_id INTEGER NOT NULL,
+		CONSTRAINT unq_points_system UNIQUE (championship_id, points_scale, session_id, place, points),
+		FOREIGN KEY (championship_id) REFERENCES championship (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (session_id) REFERENCES session (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (result_style_id) REFERENCES result_styling (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		CHECK (place > 0),
+		CHECK (points > 0),
+		CHECK (points_scale > 0)
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS title (
+		id INTEGER NOT NULL PRIMARY KEY,
+		name VARCHAR(255) NOT NULL,
+		championship_id INTEGER NOT NULL,
+		type_id INTEGER NOT NULL,
+		FOREIGN KEY (championship_id) REFERENCES championship (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (type_id) REFERENCES classification_type (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS classification (
+		id INTEGER NOT NULL PRIMARY KEY,
+		title_id INTEGER NOT NULL,
+		season VARCHAR(9) NOT NULL,
+		races_number INTEGER NOT NULL,
+		active BOOLEAN NOT NULL,
+		FOREIGN KEY (title_id) REFERENCES title (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS manufacturer_classification (
+		manufacturer_classification_id INTEGER NOT NULL,
+		scoring_cars VARCHAR(3) NOT NULL,
+		FOREIGN KEY (manufacturer_classification_id) REFERENCES classification (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS classification_ineligible (
+		classification_id INTEGER NOT NULL,
+		entity_id INTEGER NOT NULL,
+		FOREIGN KEY (entity_id) REFERENCES entity (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (classification_id) REFERENCES classification (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	''',
+	'''
+	CREATE TABLE IF NOT EXISTS score (
+		classification_id INTEGER NOT NULL,
+		round_number INTEGER NOT NULL,
+		session_id INTEGER NOT NULL,
+		entity_id INTEGER NOT NULL,
+		place VARCHAR(32) NOT NULL,
+		points FLOAT NOT NULL,
+		style_id INTEGER NOT NULL,
+		FOREIGN KEY (classification_id) REFERENCES classification (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (session_id) REFERENCES session (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (entity_id) REFERENCES entity (id) ON DELETE CASCADE ON UPDATE CASCADE,
+		FOREIGN KEY (style_id) REFERENCES result_styling (id) ON DELETE CASCADE ON UPDATE CASCADE
+	);
+	'''
+]
+
+# Table keeping summary of every entity's scores in a classification, filled with summaries of existing scores.
+# Backfill is a copy of the query used when the migration was released, later changes of standing_table.py don't affect it.
+standing_table: list[str] = [
+	'''
+	CREATE TABLE IF NOT EXISTS standing (
+		classification_id INTEGER NOT NULL,
+		entity_id INTEGER NOT NULL,
+		total_points FLOAT NOT NULL,
+		rounds_scored INTEGER NOT NULL,
+		best_place INTEGER,
+		last_round INTEGER NOT NULL,
+		PRIMARY KEY (classification_id, entity_id)
+	);
+	''',
+	'DELETE FROM standing;',
+	'''
+	INSERT INTO standing (classification_id, entity_id, total_points, rounds_scored, best_place, last_round)
+	SELECT sc.classification_id, sc.entity_id, SUM(sc.points),
+		COUNT(DISTINCT CASE WHEN sc.points > 0 THEN sc.round_number END),
+		MIN(
+			CASE WHEN ses.name != 'QUALIFYING' AND sc.place != '' AND sc.place NOT GLOB '*[^0-9]*'
+			THEN CAST(sc.place AS INTEGER) END
+		),
+		MAX(sc.round_number)
+	FROM score sc
+	JOIN "session" ses
+	ON ses.id = sc.session_id
+	GROUP BY sc.classification_id, sc.entity_id;
+	'''
+]
+
+# Indexes used by queries executed for every results file and every generated table
+performance_indexes: list[str] = [
+	'''
+	CREATE INDEX IF NOT EXISTS idx_score_classification_entity
+	ON score (classification_id, entity_id, round_number, session_id);
+	''',
+	'''
+	CREATE INDEX IF NOT EXISTS idx_score_classification_round
+	ON score (classification_id, round_number, session_id, entity_id);
+	''',
+	'CREATE INDEX IF NOT EXISTS idx_driver_codename ON driver (codename);',
+	'CREATE INDEX IF NOT EXISTS idx_team_codename ON team (codename, championship_id);',
+	'CREATE INDEX IF NOT EXISTS idx_driver_wikipedia_driver ON driver_wikipedia (driver_id, wikipedia_id);',
+	'CREATE INDEX IF NOT EXISTS idx_team_wikipedia_team ON team_wikipedia (team_id, wikipedia_id);',
+	'CREATE INDEX IF NOT EXISTS idx_car_wikipedia_car ON car_wikipedia (car_id, wikipedia_id);',
+	'''
+	CREATE INDEX IF NOT EXISTS idx_manufacturer_wikipedia_manufacturer
+	ON manufacturer_wikipedia (manufacturer_id, wikipedia_id);
+	''',
+	'''
+	CREATE INDEX IF NOT EXISTS idx_manufacturer_wikipedia_wikipedia
+	ON manufacturer_wikipedia (wikipedia_id, manufacturer_id);
+	''',
+	'''
+	CREATE INDEX IF NOT EXISTS idx_classification_ineligible_classification
+	ON classification_ineligible (classification_id, entity_id);
+	''',
+	'ANALYZE;'
+]
+
+# Schema's migrations, n-th migration upgrades database from version n - 1 to version n.
+# Version of database is kept in its user_version, new migrations are only appended to the list.
+migrations: list[list[str]] = [
+	base_tables,
+	standing_table,
+	performance_indexes
+]
+
+
+# Gets version of database's schema
+def get_schema_version(db: Connection) -> int:
+	return int(db.execute('PRAGMA user_version;').fetchone()[0])
+
+
+# Checks whether database's schema has the newest version, prints how to upgrade it if it doesn't.
+# Connections don't upgrade the schema on their own, so opening the database never changes it.
+def check_schema_version(db: Connection) -> bool:
+	global migrations
+
+	version: int = get_schema_version(db)
+
+	if version < len(migrations):
+		print(
+			f'Database schema is out of date (version {version}, required {len(migrations)}). '
+			'Upgrade it by running "python -m common.schema.migrations" in the project directory.'
+		)
+		return False
+
+	if version > len(migrations):
+		print(f'Database schema (version {version}) is newer than these scripts support ({len(migrations)}).')
+		return False
+
+	return True
+
+
+# Applies migrations missing in the database, each one in its own transaction.
+# Empty database gets whole schema. It has to be called outside of a transaction.
+def upgrade_schema(db: Connection) -> None:
+	global migrations
+
+	version: int = get_schema_version(db)
+
+	for number, statements in enumerate(migrations[version:], start=version + 1):
+		with db:
+			db.execute('BEGIN')
+
+			for statement in statements:
+				db.execute(statement)
+
+			db.execute(f'PRAGMA user_version = {number};')
+
+
+# Refreshes statistics used by query planner, called after many rows were added to given tables
+def analyze_tables(db: Connection, tables: Iterable[str]) -> None:
+	try:
+		with db:
+			for table in tables:
+				db.execute(f'ANALYZE {table};')
+	except sqlite3.Error as e:
+		print(f'An error occurred while analyzing tables - {e.__str__()}')
+
+
+# Upgrades schema of database.db to the newest version, returns False if migration failed
+def upgrade_database() -> bool:
+	from common.db_connect import apply_pragmas, db_absolute
+
+	try:
+		db: Connection = sqlite3.connect(f'file:{db_absolute}?mode=rw', uri=True)
+	except sqlite3.Error as e:
+		print(f"Couldn't open the database - {e.__str__()}")
+		return False
+
+	try:
+		apply_pragmas(db)
+
+		version: int = get_schema_version(db)
+
+		upgrade_schema(db)
+	except sqlite3.Error as e:
+		print(f'Migration failed: {e.__str__()}')
+		return False
+	finally:
+		db.close()
+
+	if version >= len(migrations):
+		print(f'Database schema is up to date (version {version}).')
+	else:
+		print(f'Database schema upgraded from version {version} to {len(migrations)}.')
+
+	return True
+
+
+if __name__ == '__main__':
+	sys.exit(0 if upgrade_database() else 1)
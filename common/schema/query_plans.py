@@ -0,0 +1,160 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	import re
+	from pathlib import Path
+
+	project_path = str(Path(__file__).parent.parent.parent)
+	if project_path not in sys.path:
+		sys.path.append(project_path)
+
+	from sqlite3 import Connection
+	from common.db_connect import db_connection
+	from common.db_queries.classification_tables import standings_query
+	from common.db_queries.standing_table import insert_standing_query
+
+# Small lookup tables with a row per session, style or manufacturer, scanning them is cheaper than using an index.
+# Depending on statistics the planner may read them whole (e.g. manufacturer_wikipedia with only two Wikipedia ids).
+small_tables: frozenset[str] = frozenset({'session', 'result_styling', 'manufacturer', 'manufacturer_wikipedia'})
+
+# Queries executed for every results file and every generated table, none of them may scan a whole table
+hot_queries: dict[str, str] = {
+	'drivers by codenames': '''
+		SELECT d.codename, short_link, long_link, d.flag, driver_id
+		FROM driver_wikipedia dw
+		JOIN driver d
+		ON d.id = dw.driver_id
+		WHERE wikipedia_id = :wiki
+		AND d.codename IN (:codename, :other_codename);
+	''',
+	'teams by codenames': '''
+		SELECT t.codename, short_link, long_link, t.flag, t.car_number, team_id
+		FROM team_wikipedia tw
+		JOIN team t
+		ON t.id = tw.team_id
+		WHERE t.championship_id = :championship
+		AND wikipedia_id = :wiki
+		AND t.codename IN (:codename, :other_codename);
+	''',
+	'teams eligibility by codenames': '''
+		SELECT codename, id, points_eligible
+		FROM team
+		WHERE championship_id = :championship
+		AND codename IN (:codename, :other_codename);
+	''',
+	'car link': '''
+		SELECT link, c.id
+		FROM car_wikipedia cw
+		JOIN car c
+		ON c.id = cw.car_id
+		WHERE c.codename = :codename
+		AND wikipedia_id = :wiki;
+	''',
+	'ineligible entities': '''
+		SELECT classification_id, entity_id
+		FROM classification_ineligible
+		WHERE classification_id IN (:classification, :other_classification);
+	''',
+	'session scores': '''
+		SELECT DISTINCT entity_id
+		FROM score
+		WHERE classification_id = :classification
+		AND round_number = :round
+		AND session_id = :session;
+	''',
+	'standings refresh': insert_standing_query.format(
+		condition='WHERE sc.classification_id = :classification AND sc.entity_id IN (:entity, :other_entity)'
+	),
+	'races held': '''
+		SELECT MAX(last_round)
+		FROM standing
+		WHERE classification_id = :classification;
+	''',
+	'drivers standings': standings_query.format(
+		entity_table='driver',
+		wikipedia_table='driver_wikipedia',
+		link_column='short_link',
+		entity_id='driver_id',
+		car_no=', NULL AS car_number'
+	),
+	'teams standings': standings_query.format(
+		entity_table='team',
+		wikipedia_table='team_wikipedia',
+		link_column='short_link',
+		entity_id='team_id',
+		car_no=', team.car_number'
+	),
+	'manufacturers standings': standings_query.format(
+		entity_table='manufacturer',
+		wikipedia_table='manufacturer_wikipedia',
+		link_column='link',
+		entity_id='manufacturer_id',
+		car_no=', NULL AS car_number'
+	)
+}
+
+
+# Finds steps of query's plan which scan whole table, with or without an index.
+# Scans of subqueries and common table expressions aren't reported, only scans of database's tables.
+def find_full_scans(db: Connection, query: str) -> list[str]:
+	global small_tables
+
+	parameters: list[str] = re.findall(r':(\w+)', query)
+
+	plan = db.execute(f'EXPLAIN QUERY PLAN {query}', {p: None for p in parameters}).fetchall()
+
+	# Scans of small lookup tables aren't reported
+	tables: set[str] = {
+		r[0] for r in db.execute("SELECT name FROM sqlite_master WHERE type = 'table';")
+	} - small_tables
+
+	# Plan refers to tables by aliases given in the query
+	aliases: dict[str, str] = dict()
+
+	for table, alias in re.findall(r'(?:FROM|JOIN)\s+"?(\w+)"?(?:\s+(?!ON\b|WHERE\b|JOIN\b)(\w+))?', query):
+		aliases[table] = table
+
+		if alias != '':
+			aliases[alias] = table
+
+	full_scans: list[str] = list()
+
+	# Scan through an index reads the whole table too, only SEARCH steps use indexes to find rows
+	for step in plan:
+		match = re.match(r'SCAN (\S+)(?: USING (?:COVERING )?INDEX \S+)?$', step[3])
+
+		if match is not None and aliases.get(match.group(1)) in tables:
+			full_scans.append(step[3])
+
+	return full_scans
+
+
+# Checks plans of all hot queries, returns False if any of them scans a whole table
+def check_query_plans() -> bool | None:
+	global hot_queries
+
+	db: Connection | None = db_connection()
+
+	if db is None:
+		print("Couldn't connect to the database.")
+		return None
+
+	correct: bool = True
+
+	for name, query in hot_queries.items():
+		full_scans: list[str] = find_full_scans(db, query)
+
+		if len(full_scans) == 0:
+			print(f'{name} - OK')
+		else:
+			correct = False
+			print(f'{name} - full table scan: {", ".join(full_scans)}')
+
+	return correct
+
+
+if __name__ == '__main__':
+	sys.exit(0 if check_query_plans() else 1)
@@ -16,6 +16,9 @@ if True:  # noqa: E402
 
     from common.db_queries.wikipedia_table import get_wiki_id
     from common.models.car import Car
+    from common.models.entity_import import ImportReport
+    from common.models.alkamel import AlkamelRow
+    from common.io.alkamel_csv import AlkamelCsvReader, find_results_files, read_csv_headers
 
 # Message when script must stop its execution
 script_cannot_continue = "Script cannot continue and it's going to stop its execution."
@@ -46,54 +49,67 @@ def write_cars_csv(cars: list[Car]) -> None:
     print(f'\nNumer of cars saves into {filename}: {len(cars)}')
 
 
-# Reads cars data from results .csv file
-def read_results_csv(path: str, wiki_id: int) -> list[Car]:
-    from common.db_queries.car_tables import check_car_exists
+# Reads cars data from results .csv file into dictionary shared by all read files, returns number of processed lines
+def read_results_cars(path: str, cars: dict[str, Car]) -> int:
+    with AlkamelCsvReader(path) as csv_reader:
+        for row in csv_reader:  # type: AlkamelRow
+            codename: str | None = row.vehicle
 
-    cars: list[Car] = list()
+            if type(codename) is not str:
+                continue
 
-    with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-        csv_reader: DictReader[str] = DictReader(csv_file, delimiter=';')
-        line_count: int = 0
-        checked: set[str] = set()
+            if codename in cars:
+                continue
 
-        print('')
+            cars[codename] = Car(
+                codename=codename,
+                link=f'[[{codename}]]'
+            )
 
-        for row in csv_reader:  # type: dict[str]
-            line_count += 1
+        return csv_reader.line_count
 
-            codename: str | None = row.get('VEHICLE')
 
-            if type(codename) is not str:
-                continue
+# Reads cars data from results .csv files, a car appearing in many rows or files is kept once
+def read_results_csv(files: list[str], wiki_id: int) -> list[Car]:
+    from common.db_queries.car_tables import get_linked_car_codenames
 
-            if codename in checked:
-                continue
+    cars: dict[str, Car] = dict()
+    line_count: int = 0
 
-            checked.add(codename)
+    print('')
 
-            if check_car_exists(codename, wiki_id):
-                print(f'{codename} is already in database')
-                continue
+    for x, file in enumerate(files, start=1):  # type: int, str
+        found_before: int = len(cars)
+        file_lines: int = read_results_cars(file, cars)
+        line_count += file_lines
 
-            cars.append(
-                Car(
-                    codename=codename,
-                    link=f'[[{codename}]]'
-                )
-            )
+        # Progress is shown only when many files are read
+        if len(files) > 1:
+            print(f'[{x}/{len(files)}] {file} - processed lines: {file_lines}, cars not seen before: {len(cars) - found_before}')
 
-        print(f'\nProcessed lines: {line_count}\nNumer of new cars found: {len(cars)}')
+    # Cars already in the database are found with one query
+    linked: set[str] | None = get_linked_car_codenames(cars.keys(), wiki_id)
 
-    return cars
+    if linked is None:
+        return list()
+
+    new_cars: list[Car] = list()
+
+    for car in cars.values():  # type: Car
+        if car.codename in linked:
+            print(f'{car.codename} is already in database')
+        else:
+            new_cars.append(car)
+
+    print(f'\nProcessed lines: {line_count}\nNumer of new cars found: {len(new_cars)}')
+
+    return new_cars
 
 
 # Checks headers of results .csv file
 def verify_results_csv(path: str) -> bool:
-    with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-        csv_reader = csv.DictReader(csv_file, delimiter=';')
-        csv_dict = dict(list(csv_reader)[0])
-        headers = list(csv_dict.keys())
+    with AlkamelCsvReader(path) as csv_reader:
+        headers: list[str] = csv_reader.headers
 
         return 'VEHICLE' in headers
 
@@ -116,8 +132,39 @@ def read_path_to_results_csv() -> str:
             return text
 
 
-# Saves cars data into .csv file
-def dump_cars_data_to_csv() -> None:
+# Reads path to a directory with results .csv files or a glob pattern matching them
+def read_path_to_results_files() -> list[str]:
+    while True:
+        text = input(
+            '\nPlease enter path to a directory with results .csv files downloaded from an Alkamelsystems website '
+            'or a glob pattern matching them, e.g. "2024/*/*.csv":\n'
+        ).strip()
+
+        files: list[str] = find_results_files(text)
+
+        if len(files) == 0:
+            print('\nNo .csv files found under given path, please try again.')
+            continue
+
+        results_files: list[str] = list()
+
+        for f in files:  # type: str
+            if verify_results_csv(f):
+                results_files.append(f)
+            else:
+                print(f"{f} doesn't have VEHICLE in its header and will be skipped")
+
+        if len(results_files) == 0:
+            print('\nNone of found files has VEHICLE in its header, please try again.')
+            continue
+
+        print(f'\nResults files found: {len(results_files)}')
+
+        return results_files
+
+
+# Saves cars data into .csv file, cars are read from one results file or from many of them
+def dump_cars_data_to_csv(many_files: bool = False) -> None:
     global script_cannot_continue
 
     enwiki_id: int | None = get_wiki_id('enwiki')
@@ -130,9 +177,12 @@ def dump_cars_data_to_csv() -> None:
         print(f"\nCouldn't find English Wikipedia in database. {script_cannot_continue}")
         return
 
-    path: str = read_path_to_results_csv()
+    if many_files:
+        files: list[str] = read_path_to_results_files()
+    else:
+        files: list[str] = [read_path_to_results_csv()]
 
-    cars: list[Car] = read_results_csv(path, enwiki_id)
+    cars: list[Car] = read_results_csv(files, enwiki_id)
 
     if len(cars) == 0:
         print("\nNo new cars found. Script's going to stop its execution.")
@@ -143,15 +193,12 @@ def dump_cars_data_to_csv() -> None:
 
 # Checks headers in cars data .csv file
 def verify_cars_csv(path: str) -> bool:
-    with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-        csv_reader = csv.DictReader(csv_file, delimiter=',')
-        csv_dict = dict(list(csv_reader)[0])
-        headers = list(csv_dict.keys())
+    headers: list[str] = read_csv_headers(path)
 
-        return (
-            'codename' in headers and
-            'link' in headers
-        )
+    return (
+        'codename' in headers and
+        'link' in headers
+    )
 
 
 # Searches this directory for cars data .csv files
@@ -289,15 +336,35 @@ def save_cars_data_to_db() -> None:
 
     print()
 
-    add_cars(cars, enwiki_id)
+    report: ImportReport | None = add_cars(cars, enwiki_id)
+
+    if report is None:
+        print(f'\n{script_cannot_continue}')
+        return
+
+    for codename, links in report.existing_links.items():  # type: str, list[str]
+        print(f'{codename} already has a link in database: "{links[0]}"')
+
+    for codename in report.inserted:  # type: str
+        print(f'{codename} - successfully added to the database')
+
+    for codename in report.linked:  # type: str
+        print(f'{codename} - successfully added link')
+
+    print('\nAdded cars: {inserted}, cars with added links: {linked}, skipped cars: {skipped}'.format(
+        inserted=len(report.inserted),
+        linked=len(report.linked),
+        skipped=len(report.skipped)
+    ))
 
 
 # Chooses script's working mode
 def choose_mode() -> None:
     options = {
         1: 'Generate cars data .csv file',
-        2: 'Save cars data into database',
-        3: 'Exit'
+        2: 'Generate cars data .csv file from many results files',
+        3: 'Save cars data into database',
+        4: 'Exit'
     }
 
     while True:
@@ -309,7 +376,7 @@ def choose_mode() -> None:
         try:
             num = int(input(f'Choice (1-{len(options)}): ').strip())
         except ValueError:
-            print('\nPlease enter a natural number between 1 and 3.')
+            print('\nPlease enter a natural number between 1 and 4.')
             continue
 
         if num in options:
@@ -318,12 +385,15 @@ def choose_mode() -> None:
                     dump_cars_data_to_csv()
                     break
                 case 2:
-                    save_cars_data_to_db()
+                    dump_cars_data_to_csv(many_files=True)
                     break
                 case 3:
+                    save_cars_data_to_db()
+                    break
+                case 4:
                     return
         else:
-            print('\nPlease enter a natural number between 1 and 3.')
+            print('\nPlease enter a natural number between 1 and 4.')
             continue
 
 
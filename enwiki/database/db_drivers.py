@@ -15,6 +15,9 @@ if True:  # noqa: E402
 		sys.path.append(project_path)
 
 	from common.models.driver import Driver
+	from common.models.entity_import import ImportReport
+	from common.models.alkamel import AlkamelDriver, AlkamelRow
+	from common.io.alkamel_csv import AlkamelCsvReader, find_results_files, read_csv_headers
 	from common.db_queries.wikipedia_table import get_wiki_id
 
 # Message when script must stop its execution
@@ -46,24 +49,13 @@ def write_drivers_csv(drivers: list[Driver]) -> None:
 	print(f'\nNumer of drivers saved into {filename}: {len(drivers)}')
 
 
-# Reads drivers data from results .csv file
-def read_results_csv(file: str, wiki_id: int) -> list[Driver]:
-	from common.db_queries.driver_tables import check_driver_exists
-
-	drivers: list[Driver] = list()
-
-	with open(file, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader: DictReader[str] = DictReader(csv_file, delimiter=';')
-		line_count: int = 0
-
-		print('')
-
-		for row in csv_reader:  # type: dict[str]
-			line_count += 1
-
-			for x in range(1, 5):  # type: int
-				firstname: str | None = row.get(f'DRIVER{x}_FIRSTNAME')
-				lastname: str | None = row.get(f'DRIVER{x}_SECONDNAME')
+# Reads drivers data from results .csv file into dictionary shared by all read files, returns number of processed lines
+def read_results_drivers(file: str, drivers: dict[str, Driver]) -> int:
+	with AlkamelCsvReader(file) as csv_reader:
+		for row in csv_reader:  # type: AlkamelRow
+			for driver in row.drivers:  # type: AlkamelDriver
+				firstname: str | None = driver.firstname
+				lastname: str | None = driver.lastname
 
 				if (
 					firstname is not None
@@ -76,40 +68,67 @@ def read_results_csv(file: str, wiki_id: int) -> list[Driver]:
 						lastname.lower()
 					)
 
-					driver_nationality = row.get(f'DRIVER{x}_COUNTRY')
-
-					if driver_nationality is not None:
-						if check_driver_exists(
-							codename=driver_codename,
-							wikipedia_id=wiki_id
-						):
-							print(f'{driver_codename} is already in database')
-							continue
+					if driver_codename in drivers:
+						continue
 
 					driver_short_link = '%s %s' % (
 						firstname.capitalize(),
 						lastname.capitalize()
 					)
 
-					driver = Driver(
+					drivers[driver_codename] = Driver(
 						codename=driver_codename,
-						nationality=driver_nationality,
+						nationality=driver.country,
 						short_link=driver_short_link
 					)
 
-					drivers.append(driver)
+		return csv_reader.line_count
 
-		print(f'\nProcessed lines: {line_count}\nNumber of new drivers found: {len(drivers)}')
 
-	return drivers
+# Reads drivers data from results .csv files, a driver appearing in many rows or files is kept once
+def read_results_csv(files: list[str], wiki_id: int) -> list[Driver]:
+	from common.db_queries.driver_tables import get_linked_driver_codenames
+
+	drivers: dict[str, Driver] = dict()
+	line_count: int = 0
+
+	print('')
+
+	for x, file in enumerate(files, start=1):  # type: int, str
+		found_before: int = len(drivers)
+		file_lines: int = read_results_drivers(file, drivers)
+		line_count += file_lines
+
+		# Progress is shown only when many files are read
+		if len(files) > 1:
+			print(f'[{x}/{len(files)}] {file} - processed lines: {file_lines}, drivers not seen before: {len(drivers) - found_before}')
+
+	# Drivers already in the database are found with one query, drivers without nationality are always kept
+	linked: set[str] | None = get_linked_driver_codenames(
+		[d.codename for d in drivers.values() if d.nationality is not None],
+		wiki_id
+	)
+
+	if linked is None:
+		return list()
+
+	new_drivers: list[Driver] = list()
+
+	for driver in drivers.values():  # type: Driver
+		if driver.codename in linked:
+			print(f'{driver.codename} is already in database')
+		else:
+			new_drivers.append(driver)
+
+	print(f'\nProcessed lines: {line_count}\nNumber of new drivers found: {len(new_drivers)}')
+
+	return new_drivers
 
 
 # Checks header of results .csv file
 def verify_results_csv(file) -> bool:
-	with open(file, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=';')
-		csv_dict = dict(list(csv_reader)[0])
-		headers = list(csv_dict.keys())
+	with AlkamelCsvReader(file) as csv_reader:
+		headers: list[str] = csv_reader.headers
 
 		return (
 			'DRIVER1_FIRSTNAME' in headers
@@ -139,8 +158,39 @@ def read_results_csv_path() -> str:
 			return text
 
 
-# Saves drivers data into .csv file
-def dump_drivers_data_to_csv() -> None:
+# Reads path to a directory with results .csv files or a glob pattern matching them
+def read_results_files_path() -> list[str]:
+	while True:
+		text = input(
+			'\nPlease enter path to a directory with results .csv files downloaded from an Alkamelsystems website '
+			'or a glob pattern matching them, e.g. "2024/*/*.csv":\n'
+		).strip()
+
+		files: list[str] = find_results_files(text)
+
+		if len(files) == 0:
+			print('\nNo .csv files found under given path, please try again.')
+			continue
+
+		results_files: list[str] = list()
+
+		for f in files:  # type: str
+			if verify_results_csv(f):
+				results_files.append(f)
+			else:
+				print(f"{f} doesn't have required columns in its header and will be skipped")
+
+		if len(results_files) == 0:
+			print('\nNone of found files has required columns in its header, please try again.')
+			continue
+
+		print(f'\nResults files found: {len(results_files)}')
+
+		return results_files
+
+
+# Saves drivers data into .csv file, drivers are read from one results file or from many of them
+def dump_drivers_data_to_csv(many_files: bool = False) -> None:
 	global script_cannot_continue
 
 	enwiki_id: int | None = get_wiki_id('enwiki')
@@ -153,9 +203,12 @@ def dump_drivers_data_to_csv() -> None:
 		print(f"\nCouldn't find English Wikipedia in database. {script_cannot_continue}")
 		return
 
-	path: str = read_results_csv_path()
+	if many_files:
+		files: list[str] = read_results_files_path()
+	else:
+		files: list[str] = [read_results_csv_path()]
 
-	drivers: list[Driver] = read_results_csv(path, enwiki_id)
+	drivers: list[Driver] = read_results_csv(files, enwiki_id)
 
 	if len(drivers) == 0:
 		print("\nNo new drivers found. Script's going to stop its execution.")
@@ -166,17 +219,14 @@ def dump_drivers_data_to_csv() -> None:
 
 # Checks headers in drivers data .csv file
 def verify_drivers_csv(path: str) -> bool:
-	with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=',')
-		csv_dict = dict(list(csv_reader)[0])
-		headers = list(csv_dict.keys())
+	headers: list[str] = read_csv_headers(path)
 
-		return (
-			'codename' in headers
-			and 'nationality' in headers
-			and 'short_link' in headers
-			and 'long_link' in headers
-		)
+	return (
+		'codename' in headers
+		and 'nationality' in headers
+		and 'short_link' in headers
+		and 'long_link' in headers
+	)
 
 
 # Searches this directory for drivers data .csv files
@@ -334,15 +384,39 @@ def save_drivers_data_to_db() -> None:
 
 	print()
 
-	add_drivers(drivers, enwiki_id, driver_type_id)
+	report: ImportReport | None = add_drivers(drivers, enwiki_id, driver_type_id)
+
+	if report is None:
+		print(f'\n{script_cannot_continue}')
+		return
+
+	for codename, links in report.existing_links.items():  # type: str, list[str]
+		print('{driver} already has links in database: "{short_link}", "{long_link}"'.format(
+			driver=codename,
+			short_link=links[0],
+			long_link=links[1]
+		))
+
+	for codename in report.inserted:  # type: str
+		print(f'{codename} - successfully added data to database')
+
+	for codename in report.linked:  # type: str
+		print(f'{codename} - successfully added links to database')
+
+	print('\nAdded drivers: {inserted}, drivers with added links: {linked}, skipped drivers: {skipped}'.format(
+		inserted=len(report.inserted),
+		linked=len(report.linked),
+		skipped=len(report.skipped)
+	))
 
 
 # Chooses script's working mode
 def choose_mode() -> None:
 	options = {
 		1: 'Generate drivers data .csv file',
-		2: 'Save drivers data into database',
-		3: 'Exit'
+		2: 'Generate drivers data .csv file from many results files',
+		3: 'Save drivers data into database',
+		4: 'Exit'
 	}
 
 	while True:
@@ -354,7 +428,7 @@ def choose_mode() -> None:
 		try:
 			num = int(input(f'Choice (1-{len(options)}): ').strip())
 		except ValueError:
-			print('\nPlease enter a natural number between 1 and 3.')
+			print('\nPlease enter a natural number between 1 and 4.')
 			continue
 
 		if num in options:
@@ -363,12 +437,15 @@ def choose_mode() -> None:
 					dump_drivers_data_to_csv()
 					break
 				case 2:
-					save_drivers_data_to_db()
+					dump_drivers_data_to_csv(many_files=True)
 					break
 				case 3:
+					save_drivers_data_to_db()
+					break
+				case 4:
 					return
 		else:
-			print('\nPlease enter a natural number between 1 and 3.')
+			print('\nPlease enter a natural number between 1 and 4.')
 			continue
 
 
@@ -6,26 +6,42 @@ sys.dont_write_bytecode = True
 if True:  # noqa: E402
 	import os
 	import csv
-	import re
+	import io
+	import time
+	import argparse
+	import contextlib
+	import multiprocessing
+	from concurrent.futures import ProcessPoolExecutor
 	from pathlib import Path
 
 	project_path = str(Path(__file__).parent.parent.parent)
 	if project_path not in sys.path:
 		sys.path.append(project_path)
 
-	from common.models.classifications import Classification, EligibleClassifications, ClassificationScoring
-	from common.models.manufacturer import Manufacturer, ManufacturerScoringCars
-	from common.models.results import ResultRow
+	from common.models.classifications import (
+		Classification, EligibleClassifications, ClassificationScoring, EligibilityIndex
+	)
+	from common.models.manufacturer import Manufacturer, ManufacturerMatcher
+	from common.models.results import EntityResults, ResultRow, Score
+	from common.models.scoring import SessionScoring
 	from common.models.championship import Championship
 	from common.models.sessions import DbSession
 	from common.models.styles import StyledStatus, StyledPosition
 	from common.models.driver import Driver
 	from common.models.teams import Team, TeamEligibility
-	from common.models.points import AwardedPoints
+	from common.models.points import AwardedPoints, PointsImport, SeasonData
+	from common.models.alkamel import AlkamelRow
+	from common.io.alkamel_csv import AlkamelCsvReader
 
 # Message when script must stop its execution
 script_cannot_continue = "Script cannot continue and it's going to stop its execution."
 
+# Values of points awarded in race accepted in command line arguments and manifest
+awarded_points_values: dict[str, AwardedPoints] = {'full': AwardedPoints.FULL, 'half': AwardedPoints.HALF}
+
+# Season's data used for reading results files in batch mode, it's set in every process reading them
+batch_season: SeasonData | None = None
+
 
 # Reads id of championship
 def read_championship() -> int | None:
@@ -202,139 +218,149 @@ def read_csv_path() -> str:
 # Searches for right classifications
 def find_classifications(
 	category: str, team_id: int, driver_ids: list[int],
-	manufacturer_id: int | None, classifications: list[Classification],
+	manufacturer_id: int | None, eligibility: EligibilityIndex,
 ) -> EligibleClassifications:
-	from common.db_queries.classification_tables import check_points_eligibility
-
 	eligible_cl = EligibleClassifications(driver_cl=None, team_cl=None, manufacturer_cl=None)
 
-	for cl in classifications:
-		if re.search(f'{category}', cl.name, re.IGNORECASE):
-			if re.search('driver', cl.name, re.IGNORECASE):
-				checks: list[bool] = list()
-
-				for drv_id in driver_ids:
-					checks.append(check_points_eligibility(cl.db_id, drv_id))
-
-				if all(checks) is True:
-					eligible_cl.driver_cl = cl
-
-			if (
-				manufacturer_id is not None
-				and re.search('manufacturer', cl.name, re.IGNORECASE)
-				and check_points_eligibility(cl.db_id, team_id)
-			):
-				eligible_cl.manufacturer_cl = cl
-			if (
-				re.search('team', cl.name, re.IGNORECASE)
-				and check_points_eligibility(cl.db_id, team_id)
-			):
-				eligible_cl.team_cl = cl
+	eligible_cl.driver_cl = eligibility.find(category, 'driver', driver_ids)
+
+	if manufacturer_id is not None:
+		eligible_cl.manufacturer_cl = eligibility.find(category, 'manufacturer', [team_id])
+
+	eligible_cl.team_cl = eligibility.find(category, 'team', [team_id])
 
 	return eligible_cl
 
 
-# Reads data from results file
+# Gets index of classifications in which teams and drivers can score
+def get_eligibility_index(classifications: list[Classification]) -> EligibilityIndex | None:
+	from common.db_queries.classification_tables import get_ineligible_entities
+
+	# Getting all entities which cannot score in the classifications at once
+	ineligible: dict[int, frozenset[int]] | None = get_ineligible_entities([cl.db_id for cl in classifications])
+
+	if ineligible is None:
+		return None
+
+	return EligibilityIndex(classifications, ineligible)
+
+
+# Gets matcher finding manufacturers of cars
+def get_manufacturer_matcher() -> ManufacturerMatcher | None:
+	from common.db_queries.manufacturer_table import get_manufacturers
+
+	manufacturers: list[Manufacturer] | None = get_manufacturers()
+
+	if manufacturers is None:
+		return None
+
+	return ManufacturerMatcher(manufacturers)
+
+
+# Reads data from results file.
+# Eligibility index and manufacturer matcher are read from database unless they're given,
+# so they can be reused by imports of many files.
 def read_results_csv(
 	path: str, classifications: list[Classification], manufacturer_classifications_num: int,
-	wiki_id: int
+	wiki_id: int, eligibility: EligibilityIndex | None = None,
+	manufacturer_matcher: ManufacturerMatcher | None = None
 ) -> list[ResultRow]:
-	from common.db_queries.team_tables import get_id_and_scoring
-	from common.db_queries.driver_tables import get_driver_data_by_codename
-	from common.db_queries.manufacturer_table import get_manufacturers
+	from common.db_queries.team_tables import get_teams_id_and_scoring
+	from common.db_queries.driver_tables import get_drivers_by_codenames
 
 	rows: list[ResultRow] = list()
 	not_found: dict[str, list[str]] = {'teams': [], 'drivers': []}
-	manufacturers: list[Manufacturer] | None = None
 
-	if manufacturer_classifications_num > 0:
-		manufacturers = get_manufacturers()
+	if manufacturer_classifications_num == 0:
+		manufacturer_matcher = None
+	elif manufacturer_matcher is None:
+		manufacturer_matcher = get_manufacturer_matcher()
+
+	if eligibility is None:
+		eligibility = get_eligibility_index(classifications)
+
+		if eligibility is None:
+			return list()
 
 	championship_id: int = classifications[0].championship_id
 
-	with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=';')
+	with AlkamelCsvReader(path) as csv_reader:
+		if not csv_reader.has_columns('NUMBER', 'TEAM', 'CLASS', 'STATUS', 'VEHICLE'):
+			error_text = [
+				'\nAn error occurred while reading data.',
+				"Given file doesn't have one of these headers:",
+				'NUMBER, TEAM, CLASS, STATUS lub VEHICLE.'
+			]
+			print(*error_text, sep=' ')
+			return list()
+
+		if not csv_reader.has_drivers:
+			msg: list[str] = [
+				'\nAn error occurred while reading data.',
+				"Given file doesn't have columns with drivers' data."
+			]
+			print(*msg, sep=' ')
+			return list()
+
+		csv_rows: list[AlkamelRow] = list(csv_reader)
 		line_count = 0
 
-		for row in csv_reader:  # type: dict
+		# Getting data of all drivers from the file at once
+		drivers_data: dict[str, Driver] | None = get_drivers_by_codenames(
+			codenames=[c.lower() for row in csv_rows for c in row.driver_codenames],
+			wiki_id=wiki_id
+		)
+
+		if drivers_data is None:
+			return list()
+
+		# Getting ids and points eligibility of all teams from the file at once
+		teams_eligibility: dict[str, TeamEligibility] | None = get_teams_id_and_scoring(
+			codenames=[row.team_codename for row in csv_rows],
+			championship_id=championship_id
+		)
+
+		if teams_eligibility is None:
+			return list()
+
+		for row in csv_rows:  # type: AlkamelRow
 			line_count += 1
 			row_drivers: list[Driver] = list()
 
-			try:
-				row_car_no = row['NUMBER']
-				row_team = row['TEAM']
-				row_category = row['CLASS']
-				row_status = row['STATUS']
-				row_vehicle = row['VEHICLE']
-			except KeyError:
-				error_text = [
-					'\nAn error occurred while reading data.',
-					"Given file doesn't have one of these headers:",
-					'NUMBER, TEAM, CLASS, STATUS lub VEHICLE.'
-				]
-				print(*error_text, sep=' ')
-				return list()
-
-			team_codename: str = f'#{row_car_no} {row_team}'
-
-			team_eligibility: TeamEligibility = get_id_and_scoring(
-				team_codename,
-				championship_id
-			)
+			team_codename: str = row.team_codename
 
-			if team_eligibility.team.db_id is None:
+			team_eligibility: TeamEligibility | None = teams_eligibility.get(team_codename)
+
+			if team_eligibility is None:
 				not_found['teams'].append(team_codename)
 				continue
 
 			if team_eligibility.eligibility is None or not team_eligibility.eligibility:
 				continue
 
-			if 'DRIVER_1' in row:
-				driver_columns: list[str] = ['DRIVER_{number}']
-			elif 'DRIVER1_FIRSTNAME' in row and 'DRIVER1_SECONDNAME' in row:
-				driver_columns: list[str] = ['DRIVER{number}_FIRSTNAME', 'DRIVER{number}_SECONDNAME']
-			else:
-				msg: list[str] = [
-					'\nAn error occurred while reading data.',
-					"Given file doesn't have columns with drivers' data."
-				]
-				print(*msg, sep=' ')
-				return list()
-
-			for x in range(1, 5):
-				driver_codename: str = ''
-
-				for column in driver_columns:
-					driver_codename += f' {row[column.format(number=x)]}'
-
-				driver_codename = driver_codename.lstrip()
-
-				if len(driver_codename) > 1:
-					driver_data: Driver | None = get_driver_data_by_codename(driver_codename.lower(), wiki_id)
-					if driver_data is None or driver_data.empty_fields():
-						not_found['drivers'].append(driver_codename)
-					else:
-						row_drivers.append(driver_data)
+			for driver_codename in row.driver_codenames:
+				driver_data: Driver | None = drivers_data.get(driver_codename.lower())
+				if driver_data is None or driver_data.empty_fields():
+					not_found['drivers'].append(driver_codename)
+				else:
+					row_drivers.append(driver_data)
 
 			row_manufacturer: Manufacturer | None = None
 
-			if manufacturers is not None and len(manufacturers) > 0:
-				for m in manufacturers:
-					if re.search(m.codename, row_vehicle, re.IGNORECASE):
-						row_manufacturer = m
-						break
+			if manufacturer_matcher is not None:
+				row_manufacturer = manufacturer_matcher.find(row.vehicle)
 
 			eligible_cls = find_classifications(
-				category=row_category,
+				category=row.category,
 				team_id=team_eligibility.team.db_id,
 				driver_ids=[x.db_id for x in row_drivers],
 				manufacturer_id=row_manufacturer.db_id if row_manufacturer is not None else None,
-				classifications=classifications
+				eligibility=eligibility
 			)
 
 			row_data = ResultRow(
 				drivers=row_drivers,
-				status=row_status,
+				status=row.status,
 				team=Team(codename=team_codename, db_id=team_eligibility.team.db_id),
 				manufacturer=row_manufacturer if eligible_cls.manufacturer_cl is not None else None,
 				eligible_classifications=eligible_cls
@@ -361,57 +387,6 @@ def read_results_csv(
 		return list() if entity_not_found else rows
 
 
-# Finds right colouring for result
-def find_result_style(
-	status: str, position: int, scoring_styles: list[StyledPosition],
-	nonscoring_styles: list[StyledStatus], session: str
-) -> tuple[int | None, float] | None:
-	match status:
-		case 'Classified':
-			style_id: int = next(
-				(v.style.db_id for v in scoring_styles if v.position == position),
-				None
-			)
-			points: float = next(
-				(v.points for v in scoring_styles if v.position == position),
-				None
-			)
-
-			if style_id is None:
-				# Nonscoring positions in qualifying sessions won't get any style
-				if session.upper() != 'QUALIFYING':
-					style_id = next(
-						(v.style.db_id for v in nonscoring_styles if v.status == "Classified, nonscoring")
-					)
-				points = 0.0
-
-			return style_id, points
-		case 'Not classified':
-			style_id: int = next(
-				(v.style.db_id for v in nonscoring_styles if v.status == "Not classified")
-			)
-
-			return style_id, 0.0
-		case 'Retired':
-			style_id = next(
-				(v.style.db_id for v in nonscoring_styles if v.status == "Retired")
-			)
-
-			return style_id, 0.0
-		case 'Disqualified':
-			style_id: int | None = None
-
-			# Entries disqualified from qualifying sessions will be ignored
-			if session.upper() != 'QUALIFYING':
-				style_id: int = next(
-					(v.style.db_id for v in nonscoring_styles if v.status == "Disqualified")
-				)
-
-			return style_id, 0.0
-		case _:
-			return None
-
-
 # Reads whether full points were awarded for race
 def read_full_points() -> AwardedPoints:
 	while True:
@@ -439,123 +414,18 @@ def calculate_classifications_positions(
 	session: str, oem_classifications_scoring: list[ClassificationScoring],
 	awarded_points: AwardedPoints
 ) -> list[ResultRow]:
-	from common.db_queries.manufacturer_table import get_manufacturers
-
-	positions: dict[str, int] = dict()
-	nonscoring_statuses: list[str] = [x.status for x in nonscoring_styles]
-
-	manufacturers_scoring_cars: list[ManufacturerScoringCars] = list()
-
-	if len(oem_classifications_scoring) > 0:
-		manufacturers: list[Manufacturer] | None = get_manufacturers()
-
-		if manufacturers is None:
-			return list()
-
-		if len(manufacturers) == 0:
-			print("\nManufacturers' list is empty")
-			return list()
-
-		for oem in manufacturers:  # type: Manufacturer
-			manufacturers_scoring_cars.append(ManufacturerScoringCars(
-				manufacturer=oem,
-				classifications=oem_classifications_scoring
-			))
-
-	for cl in classifications:
-		positions.update({f'{cl.name}': 1})
+	scoring = SessionScoring(
+		classifications=classifications,
+		scoring_styles=scoring_styles,
+		nonscoring_styles=nonscoring_styles,
+		session=session,
+		oem_classifications_scoring=oem_classifications_scoring,
+		awarded_points=awarded_points
+	)
 
 	for row in rows:  # type: ResultRow
-		if row.eligible_classifications.team_cl is not None:
-			team_position = positions.get(row.eligible_classifications.team_cl.name)
-
-			# Finding styles and points
-			found: tuple[int | None, float] | None = find_result_style(
-				status=row.status,
-				position=team_position,
-				scoring_styles=scoring_styles,
-				nonscoring_styles=nonscoring_styles,
-				session=session
-			)
-
-			if found is not None:
-				if found[0] is not None:
-					row.eligible_classifications.team_style_id = found[0]
-					row.eligible_classifications.team_points = found[1] * awarded_points.multiplier
-
-					if row.status not in nonscoring_statuses:
-						row.eligible_classifications.team_position = team_position
-						positions[f'{row.eligible_classifications.team_cl.name}'] += 1
-					else:
-						row.eligible_classifications.team_position = row.status
-		if row.eligible_classifications.manufacturer_cl is not None:
-			oem_position = positions.get(row.eligible_classifications.manufacturer_cl.name)
-
-			oem_scoring: ManufacturerScoringCars = next(
-				(x for x in manufacturers_scoring_cars if x.manufacturer.db_id == row.manufacturer.db_id)
-			)
-
-			scoring_found: ClassificationScoring = next(
-				(x for x in oem_scoring.classifications if x.name == row.eligible_classifications.manufacturer_cl.name)
-			)
-
-			# If manufacturer's car(s) can still score
-			if scoring_found.scoring_entities > 0:
-				manufacturers_scoring_cars.pop(
-					manufacturers_scoring_cars.index(oem_scoring)
-				)
-
-				oem_scoring.classifications.pop(
-					oem_scoring.classifications.index(scoring_found)
-				)
-
-				scoring_found.scoring_entities -= 1
+		scoring.score_row(row)
 
-				oem_scoring.classifications.append(scoring_found)
-
-				manufacturers_scoring_cars.append(oem_scoring)
-
-				# Finding styles and points
-				found: tuple[int | None, float] | None = find_result_style(
-					status=row.status,
-					position=oem_position,
-					scoring_styles=scoring_styles,
-					nonscoring_styles=nonscoring_styles,
-					session=session
-				)
-
-				if found is not None:
-					if found[0] is not None:
-						row.eligible_classifications.manufacturer_style_id = found[0]
-						row.eligible_classifications.manufacturer_points = found[1] * awarded_points.multiplier
-
-						if row.status not in nonscoring_statuses:
-							row.eligible_classifications.manufacturer_position = oem_position
-						else:
-							row.eligible_classifications.manufacturer_position = row.status
-			positions[f'{row.eligible_classifications.manufacturer_cl.name}'] += 1
-		if row.eligible_classifications.driver_cl is not None:
-			driver_position = positions.get(row.eligible_classifications.driver_cl.name)
-
-			# Finding styles and points
-			found: tuple[int | None, float] | None = find_result_style(
-				status=row.status,
-				position=driver_position,
-				scoring_styles=scoring_styles,
-				nonscoring_styles=nonscoring_styles,
-				session=session
-			)
-
-			if found is not None:
-				if found[0] is not None:
-					row.eligible_classifications.driver_style_id = found[0]
-					row.eligible_classifications.driver_points = found[1] * awarded_points.multiplier
-
-					if row.status not in nonscoring_statuses:
-						row.eligible_classifications.driver_position = driver_position
-						positions[f'{row.eligible_classifications.driver_cl.name}'] += 1
-					else:
-						row.eligible_classifications.driver_position = row.status
 	return rows
 
 
@@ -585,24 +455,8 @@ def read_round_number(classifications: list[Classification], session_id: int) ->
 					continue
 
 				if ans == 1:
-					from common.db_queries.classification_tables import remove_session_scores
-					print('\nDeleting results...')
-
-					results_removed: bool = remove_session_scores(
-						classifications=classifications,
-						round_number=num,
-						session_id=session_id
-					)
-
-					if results_removed is None:
-						return None
-
-					if results_removed:
-						print("\nResults of this round's session were removed from database")
-						return num
-					else:
-						print("\nRemoving results of this round's sessions failed.")
-						return None
+					print("\nResults of this round's session will be replaced with results from the file.")
+					return num
 				elif ans == 2:
 					print("\nScript's going to stop its execution.")
 					return None
@@ -612,11 +466,9 @@ def read_round_number(classifications: list[Classification], session_id: int) ->
 			return num
 
 
-# Adds results to database
-def add_results_to_db(rows: list[ResultRow], round_number: int, session: DbSession) -> None:
-	from common.db_queries.classification_tables import add_score
-
-	print('')
+# Converts results rows into scores which are saved in database
+def get_scores(rows: list[ResultRow], round_number: int, session: DbSession) -> list[Score]:
+	scores: list[Score] = list()
 
 	for row in rows:
 		# Variable needed to prevent adding qualifying results in team's classifications that
@@ -627,35 +479,26 @@ def add_results_to_db(rows: list[ResultRow], round_number: int, session: DbSessi
 			row.eligible_classifications.driver_cl is not None
 			and row.eligible_classifications.driver_style_id is not None
 		):
-			print('{season} {classification_name}'.format(
-				season=row.eligible_classifications.driver_cl.season,
-				classification_name=row.eligible_classifications.driver_cl.name
-			))
-
 			for driver in row.drivers:
-				print(f'{driver.codename}:', end=' ')
-				add_score(
-					classification_id=row.eligible_classifications.driver_cl.db_id,
-					round_number=round_number,
-					session_id=session.db_id,
-					entity_id=driver.db_id,
-					place=row.eligible_classifications.driver_position,
-					points=row.eligible_classifications.driver_points,
-					style_id=row.eligible_classifications.driver_style_id
+				scores.append(
+					Score(
+						classification_id=row.eligible_classifications.driver_cl.db_id,
+						round_number=round_number,
+						session_id=session.db_id,
+						entity_id=driver.db_id,
+						place=row.eligible_classifications.driver_position,
+						points=row.eligible_classifications.driver_points,
+						style_id=row.eligible_classifications.driver_style_id
+					)
 				)
 				drivers_result_added = True
 		if (
 			row.eligible_classifications.manufacturer_cl is not None
 			and row.eligible_classifications.manufacturer_style_id is not None
+			and row.manufacturer is not None
 		):
-			print('{season} {classification_name}'.format(
-				season=row.eligible_classifications.manufacturer_cl.season,
-				classification_name=row.eligible_classifications.manufacturer_cl.name
-			))
-
-			if row.manufacturer is not None:
-				print(f'{row.manufacturer.codename}:', end=' ')
-				add_score(
+			scores.append(
+				Score(
 					classification_id=row.eligible_classifications.manufacturer_cl.db_id,
 					round_number=round_number,
 					session_id=session.db_id,
@@ -664,27 +507,566 @@ def add_results_to_db(rows: list[ResultRow], round_number: int, session: DbSessi
 					points=row.eligible_classifications.manufacturer_points,
 					style_id=row.eligible_classifications.manufacturer_style_id
 				)
+			)
 		if (
 			row.eligible_classifications.team_cl is not None
 			and row.eligible_classifications.team_style_id is not None
 			and drivers_result_added is True
 		):
-			print('{season} {classification_name}'.format(
-				season=row.eligible_classifications.team_cl.season,
-				classification_name=row.eligible_classifications.team_cl.name
-			))
-
-			print(f'{row.team.codename}:', end=' ')
-			add_score(
-				classification_id=row.eligible_classifications.team_cl.db_id,
-				round_number=round_number,
-				session_id=session.db_id,
-				entity_id=row.team.db_id,
-				place=row.eligible_classifications.team_position,
-				points=row.eligible_classifications.team_points,
-				style_id=row.eligible_classifications.team_style_id
+			scores.append(
+				Score(
+					classification_id=row.eligible_classifications.team_cl.db_id,
+					round_number=round_number,
+					session_id=session.db_id,
+					entity_id=row.team.db_id,
+					place=row.eligible_classifications.team_position,
+					points=row.eligible_classifications.team_points,
+					style_id=row.eligible_classifications.team_style_id
+				)
 			)
-		print('-' * 50)
+
+	return scores
+
+
+# Adds results to database, returns number of added scores or None if they weren't saved
+def add_results_to_db(
+	rows: list[ResultRow], classifications: list[Classification], round_number: int, session: DbSession
+) -> int | None:
+	from common.db_queries.classification_tables import replace_session_scores
+
+	summary: dict[int, int] | None = replace_session_scores(
+		classifications=classifications,
+		round_number=round_number,
+		session_id=session.db_id,
+		scores=get_scores(rows, round_number, session)
+	)
+
+	if summary is None:
+		print('\nAn error occurred, no results were added to database.')
+		return None
+
+	# Classifications in which scores were added
+	scored_classifications: dict[int, Classification] = dict()
+
+	for row in rows:
+		for cl in (
+			row.eligible_classifications.driver_cl,
+			row.eligible_classifications.manufacturer_cl,
+			row.eligible_classifications.team_cl
+		):
+			if cl is not None:
+				scored_classifications[cl.db_id] = cl
+
+	print('')
+
+	for cl_id, added in summary.items():
+		classification: Classification = scored_classifications[cl_id]
+		print(f'{classification.season} {classification.name} - added scores: {added}')
+
+	return sum(summary.values())
+
+
+# Reads command line arguments, results are added without any prompts if results file or manifest is given
+def parse_arguments() -> argparse.Namespace:
+	parser = argparse.ArgumentParser(
+		description='Adds points-awarding sessions results into database. Without arguments it asks for all data.'
+	)
+	parser.add_argument('--championship', type=int, help="championship's id in database")
+	parser.add_argument('--season', help='season of classifications, e.g. 2024')
+	parser.add_argument(
+		'--manifest',
+		help='.csv file listing results files, its headers are "round","session","scale","points","csv"'
+	)
+	parser.add_argument('--round', type=int, dest='round_number', help='number of round whose results are in the file')
+	parser.add_argument('--session', help="session's name, e.g. RACE")
+	parser.add_argument('--scale', type=float, help='points scale, required if championship has more than one')
+	parser.add_argument('--points', choices=awarded_points_values.keys(), default='full', help='points awarded in race')
+	parser.add_argument('--csv', help='results .csv file downloaded from an Alkamelsystems website')
+	parser.add_argument('--replace', action='store_true', help='replace results which are already in database')
+	parser.add_argument(
+		'--dry-run', action='store_true',
+		help='show scores and changes of standings without writing anything to database, results already in it'
+		' are shown as replaced'
+	)
+	parser.add_argument(
+		'--jobs', type=int, default=1, help='number of processes reading results files in parallel, 1 by default'
+	)
+
+	arguments: argparse.Namespace = parser.parse_args()
+
+	if arguments.manifest is not None or arguments.csv is not None:
+		if arguments.championship is None or arguments.season is None:
+			parser.error('--championship and --season are required to add results without prompts')
+
+		if arguments.manifest is not None and arguments.csv is not None:
+			parser.error('--manifest and --csv cannot be used together')
+
+		if arguments.csv is not None and (arguments.round_number is None or arguments.session is None):
+			parser.error('--round and --session are required with --csv')
+	elif arguments.dry_run or arguments.replace or arguments.jobs != 1:
+		# Interactive mode always saves results and asks before replacing them
+		parser.error('--dry-run, --replace and --jobs can be used only with --csv or --manifest')
+
+	return arguments
+
+
+# Reads manifest listing results files to add, relative paths are relative to manifest's directory
+def read_manifest(path: str) -> list[PointsImport] | None:
+	imports: list[PointsImport] = list()
+	manifest_dir: str = os.path.dirname(os.path.abspath(path))
+
+	try:
+		with open(path, mode='r', encoding='utf-8-sig') as csv_file:
+			csv_reader = csv.DictReader(csv_file)
+
+			if csv_reader.fieldnames is None or not {'round', 'session', 'csv'}.issubset(csv_reader.fieldnames):
+				print('\nManifest must have "round", "session" and "csv" headers.')
+				return None
+
+			# First line of manifest has headers
+			for line, row in enumerate(csv_reader, start=2):  # type: int, dict
+				try:
+					imports.append(
+						PointsImport(
+							round_number=int(row['round']),
+							session=row['session'].strip().upper(),
+							path=os.path.join(manifest_dir, row['csv'].strip()),
+							scale=float(row['scale']) if row.get('scale') else None,
+							awarded_points=awarded_points_values[(row.get('points') or 'full').strip().lower()]
+						)
+					)
+				except (AttributeError, KeyError, ValueError):
+					print(f'\nManifest has invalid data in line {line}.')
+					return None
+	except OSError as e:
+		print(f'\nAn error occurred while reading manifest - {e.__str__()}')
+		return None
+
+	return imports
+
+
+# Prints scores which would be saved, entities are shown by their codenames
+def print_scores(rows: list[ResultRow], round_number: int, session: DbSession) -> None:
+	# Codenames of entities by classification's type and entity's id
+	codenames: dict[str, dict[int, str]] = {'DRIVERS': dict(), 'TEAMS': dict(), 'MANUFACTURERS': dict()}
+	classifications: dict[int, Classification] = dict()
+
+	for row in rows:  # type: ResultRow
+		for driver in row.drivers:
+			codenames['DRIVERS'][driver.db_id] = driver.codename
+
+		codenames['TEAMS'][row.team.db_id] = row.team.codename
+
+		if row.manufacturer is not None:
+			codenames['MANUFACTURERS'][row.manufacturer.db_id] = row.manufacturer.codename
+
+		for cl in (
+			row.eligible_classifications.driver_cl,
+			row.eligible_classifications.manufacturer_cl,
+			row.eligible_classifications.team_cl
+		):
+			if cl is not None:
+				classifications[cl.db_id] = cl
+
+	# Scores grouped by classification's id, in order of results
+	classifications_scores: dict[int, list[Score]] = dict()
+
+	for score in get_scores(rows, round_number, session):  # type: Score
+		classifications_scores.setdefault(score.classification_id, list()).append(score)
+
+	for cl_id, scores in classifications_scores.items():
+		classification: Classification = classifications[cl_id]
+		entities_codenames: dict[int, str] = codenames.get(classification.cl_type, dict())
+
+		print(f'\n{classification.season} {classification.name}:')
+
+		for score in scores:  # type: Score
+			print(f'{score.place} - {entities_codenames.get(score.entity_id, score.entity_id)} - {score.points:g} pts')
+
+
+# Gets standings of classifications as they're printed in tables, entities are grouped by classification's id
+def get_standings(classifications: list[Classification], wiki_id: int) -> dict[int, list[EntityResults]] | None:
+	from common.db_queries.classification_tables import get_classification_results
+
+	standings: dict[int, list[EntityResults]] = dict()
+
+	for cl in classifications:
+		results: list[EntityResults] | None = get_classification_results(cl, wiki_id)
+
+		if results is None:
+			return None
+
+		standings[cl.db_id] = results
+
+	return standings
+
+
+# Prints changes of entities' positions and points between two standings of classifications
+def print_standings_changes(
+	classifications: list[Classification], before: dict[int, list[EntityResults]],
+	after: dict[int, list[EntityResults]]
+) -> None:
+	changed_classifications: int = 0
+
+	for cl in classifications:
+		previous: dict[int, EntityResults] = {e.db_id: e for e in before.get(cl.db_id, list())}
+		changes: list[str] = list()
+
+		for entity in after.get(cl.db_id, list()):  # type: EntityResults
+			old: EntityResults | None = previous.get(entity.db_id)
+
+			if old is None:
+				changes.append(f'{entity.position} (new) - {entity.link} - {entity.points:g} pts')
+			elif old.position != entity.position or old.points != entity.points:
+				changes.append(
+					f'{entity.position} ({old.position}) - {entity.link} - '
+					f'{entity.points:g} pts ({entity.points - old.points:+g})'
+				)
+
+		if len(changes) > 0:
+			changed_classifications += 1
+			print(f'\n{cl.season} {cl.name}, position (previous position) - entity - points (change):')
+			print(*changes, sep='\n')
+
+	if changed_classifications == 0:
+		print('\nStandings would not change.')
+
+
+# Sets season's data used for reading results files in batch mode
+def set_season_data(season: SeasonData) -> None:
+	global batch_season
+
+	batch_season = season
+
+
+# Prepares process of a pool reading results files, it reads data from its own in-memory copy of database
+# and passes usage of entities to the process saving results instead of saving it itself
+def start_reading_process(season: SeasonData) -> None:
+	from common.db_connect import use_snapshot
+
+	use_snapshot()
+	set_season_data(season)
+
+
+# Reads results file and calculates positions in classifications.
+# Returns results rows, printed messages, ids of used entities and time of reading.
+def read_results_file(
+	job: tuple[PointsImport, DbSession, list[StyledPosition]]
+) -> tuple[list[ResultRow], str, dict[str, set[int]], float]:
+	from common.db_queries.touch_buffer import take_touched
+
+	entry, session, styled_positions = job
+	start: float = time.perf_counter()
+
+	# Messages are printed by the process saving results, so messages about different files don't mix
+	with contextlib.redirect_stdout(io.StringIO()) as output:
+		rows: list[ResultRow] = read_results_csv(
+			path=entry.path,
+			classifications=batch_season.classifications,
+			manufacturer_classifications_num=len(batch_season.oem_scoring_cars),
+			wiki_id=batch_season.wiki_id,
+			eligibility=batch_season.eligibility,
+			manufacturer_matcher=batch_season.manufacturer_matcher
+		)
+
+		if len(rows) > 0:
+			rows = calculate_classifications_positions(
+				rows=rows,
+				classifications=batch_season.classifications,
+				scoring_styles=styled_positions,
+				nonscoring_styles=batch_season.nonscoring_statuses,
+				session=session.name,
+				oem_classifications_scoring=batch_season.oem_scoring_cars,
+				awarded_points=entry.awarded_points if session.name == 'RACE' else AwardedPoints.FULL
+			)
+
+	return rows, output.getvalue(), take_touched(), time.perf_counter() - start
+
+
+# Adds results of many sessions without any prompts.
+# Season's classifications, styles and lookups are read from database once and reused for all files.
+# Files can be read in parallel, but their results are saved by one process in rounds' order.
+def run_batch(arguments: argparse.Namespace) -> None:
+	from common.db_queries.classification_tables import check_round_session, get_champ_classifications_by_season
+	from common.db_queries.wikipedia_table import get_wiki_id
+	from common.db_queries.points_tables import (
+		get_points_scales,
+		get_scoring_sessions,
+		get_styled_nonscoring_statuses,
+		get_styled_points_system
+	)
+	from common.db_queries.manufacturer_table import refresh_manufacturers_timestamps
+	from common.db_queries.reference_data import refresh_reference_tables
+	from common.db_connect import use_snapshot
+	from common.db_queries.touch_buffer import set_touching, touch
+
+	global script_cannot_continue
+
+	# In dry run scores are added only to in-memory copy of database, which is used to work out new standings
+	if arguments.dry_run:
+		set_touching(False)
+
+		if not use_snapshot():
+			print("\nCouldn't make a copy of database." + script_cannot_continue)
+			return
+
+		print('\nDry run, nothing will be saved to database.')
+
+	# Small tables which rarely change are read again if database was changed since they were cached
+	refresh_reference_tables()
+
+	# Getting English Wikipedia's id from database
+	enwiki_id: int | None = get_wiki_id('enwiki')
+
+	if enwiki_id is None:
+		print(f'\n{script_cannot_continue}')
+		return
+
+	if enwiki_id == -1:
+		print("\nCouldn't find English Wikipedia in database." + script_cannot_continue)
+		return
+
+	# Getting classifications of given championship (series)
+	classifications: list[Classification] | None = get_champ_classifications_by_season(
+		arguments.championship,
+		arguments.season
+	)
+
+	if classifications is None or len(classifications) == 0:
+		print("\nNo classification in database for given championship and season." + script_cannot_continue)
+		return
+
+	# Getting data about scoring in manufacturer's classifications (if there are any)
+	oem_scoring_cars: list[ClassificationScoring] | None = get_oem_scoring_cars(classifications)
+
+	if oem_scoring_cars is None:
+		print(script_cannot_continue)
+		return
+
+	# Getting points scales from database
+	points_scales: list[float] | None = get_points_scales(arguments.championship)
+
+	if points_scales is None:
+		print(script_cannot_continue)
+		return
+
+	if len(points_scales) == 0:
+		print("\nThis championship doesn't have any points scales in database")
+		return
+
+	# Reading list of files to add
+	if arguments.manifest is not None:
+		imports: list[PointsImport] | None = read_manifest(arguments.manifest)
+
+		if imports is None:
+			print(script_cannot_continue)
+			return
+	else:
+		imports: list[PointsImport] | None = [
+			PointsImport(
+				round_number=arguments.round_number,
+				session=arguments.session.upper(),
+				path=arguments.csv,
+				scale=arguments.scale,
+				awarded_points=awarded_points_values[arguments.points]
+			)
+		]
+
+	# Gets nonscoring statuses (not classified etc.) with their styles in Wikipedia tables
+	nonscoring_statuses: list[StyledStatus] | None = get_styled_nonscoring_statuses()
+
+	if nonscoring_statuses is None:
+		print(script_cannot_continue)
+		return
+
+	# Getting lookups used by all files
+	eligibility: EligibilityIndex | None = get_eligibility_index(classifications)
+	manufacturer_matcher: ManufacturerMatcher | None = None
+
+	if len(oem_scoring_cars) > 0:
+		manufacturer_matcher = get_manufacturer_matcher()
+
+	if eligibility is None or (len(oem_scoring_cars) > 0 and manufacturer_matcher is None):
+		print(script_cannot_continue)
+		return
+
+	# Sessions and points systems are read once for each points scale
+	scales_sessions: dict[float, list[DbSession]] = dict()
+	points_systems: dict[tuple[float, int], list[StyledPosition] | None] = dict()
+
+	# Files which can be added with their sessions and points systems
+	jobs: list[tuple[PointsImport, DbSession, list[StyledPosition]]] = list()
+
+	for entry in imports:  # type: PointsImport
+		header: str = f'\nRound {entry.round_number}, {entry.session}: {entry.path}'
+
+		scale: float | None = entry.scale
+
+		if scale is None and len(points_scales) == 1:
+			scale = points_scales[0]
+
+		if scale not in points_scales:
+			print(header)
+			print(f'Points scale must be one of: {", ".join(str(x) for x in points_scales)}. File is skipped.')
+			continue
+
+		if scale not in scales_sessions:
+			sessions: list[DbSession] | None = get_scoring_sessions(arguments.championship, scale)
+
+			if sessions is None:
+				print(script_cannot_continue)
+				return
+
+			scales_sessions[scale] = sessions
+
+		session: DbSession | None = next((x for x in scales_sessions[scale] if x.name == entry.session), None)
+
+		if session is None:
+			print(header)
+			print(f"{entry.session} session doesn't award points. File is skipped.")
+			continue
+
+		if not os.path.isfile(entry.path) or not entry.path.lower().endswith('.csv'):
+			print(header)
+			print("There's no .csv file under given path. File is skipped.")
+			continue
+
+		if not (arguments.replace or arguments.dry_run) and check_round_session(
+			classification_id=classifications[0].db_id,
+			round_number=entry.round_number,
+			session_id=session.db_id
+		):
+			print(header)
+			print('This round-session pairing already has results in database, use --replace to replace them.')
+			print('File is skipped.')
+			continue
+
+		if len(nonscoring_statuses) == 0 and session.name == 'RACE':
+			print(header)
+			print('No styling of race results found. File is skipped.')
+			continue
+
+		if (scale, session.db_id) not in points_systems:
+			points_systems[(scale, session.db_id)] = get_styled_points_system(
+				championship_id=arguments.championship,
+				scale=scale,
+				session_id=session.db_id
+			)
+
+		styled_positions: list[StyledPosition] | None = points_systems[(scale, session.db_id)]
+
+		if styled_positions is None or len(styled_positions) == 0:
+			print(header)
+			print('No results styles found. File is skipped.')
+			continue
+
+		jobs.append((entry, session, styled_positions))
+
+	# Files are saved in rounds' order, files of the same round in manifest's order
+	jobs.sort(key=lambda job: job[0].round_number)
+
+	season = SeasonData(
+		wiki_id=enwiki_id,
+		classifications=classifications,
+		oem_scoring_cars=oem_scoring_cars,
+		nonscoring_statuses=nonscoring_statuses,
+		eligibility=eligibility,
+		manufacturer_matcher=manufacturer_matcher
+	)
+
+	# Files are read by a pool of processes, while this one saves their results one by one as they're ready
+	executor: ProcessPoolExecutor | None = None
+
+	if arguments.jobs > 1 and len(jobs) > 1:
+		executor = ProcessPoolExecutor(
+			max_workers=min(arguments.jobs, len(jobs)),
+			mp_context=multiprocessing.get_context('spawn'),
+			initializer=start_reading_process,
+			initargs=(season,)
+		)
+		processed = executor.map(read_results_file, jobs)
+	else:
+		set_season_data(season)
+		processed = map(read_results_file, jobs)
+
+	standings_before: dict[int, list[EntityResults]] | None = None
+
+	if arguments.dry_run:
+		standings_before = get_standings(classifications, enwiki_id)
+
+		if standings_before is None:
+			print(script_cannot_continue)
+			return
+
+	manufacturers_ids: set[int] = set()
+	added_files: int = 0
+	read_rows: int = 0
+	reading_time: float = 0.0
+	saved_scores: int = 0
+	saving_time: float = 0.0
+	start: float = time.perf_counter()
+
+	try:
+		for job, (rows, output, touched, file_reading_time) in zip(jobs, processed):
+			entry, session, _ = job
+
+			print(f'\nRound {entry.round_number}, {entry.session}: {entry.path}')
+			print(output, end='')
+
+			read_rows += len(rows)
+			reading_time += file_reading_time
+
+			if len(rows) == 0:
+				print('File is skipped.')
+				continue
+
+			# Usage of entities found while reading the file is saved by this process
+			for table, ids in touched.items():
+				touch(table, ids)
+
+			saving_start: float = time.perf_counter()
+
+			added: int | None = add_results_to_db(rows, classifications, entry.round_number, session)
+
+			saving_time += time.perf_counter() - saving_start
+
+			if added is None:
+				continue
+
+			added_files += 1
+			saved_scores += added
+
+			if arguments.dry_run:
+				print_scores(rows, entry.round_number, session)
+
+			for row in rows:  # type: ResultRow
+				if row.manufacturer is not None:
+					manufacturers_ids.add(row.manufacturer.db_id)
+	finally:
+		if executor is not None:
+			executor.shutdown(cancel_futures=True)
+
+	# Refreshing timestamps of manufacturers that took part in the race meetings
+	if not arguments.dry_run:
+		refresh_manufacturers_timestamps(list(manufacturers_ids))
+
+	total_time: float = time.perf_counter() - start
+
+	print(f'\nAdded results from {added_files} of {len(imports)} files in {total_time:.2f} s.')
+	print(
+		f'Reading files: {read_rows} rows in {reading_time:.2f} s of processes\' time'
+		f' ({read_rows / reading_time if reading_time > 0 else 0:.0f} rows/s)'
+	)
+	print(
+		f'Saving scores: {saved_scores} scores in {saving_time:.2f} s'
+		f' ({saved_scores / saving_time if saving_time > 0 else 0:.0f} scores/s)'
+	)
+
+	if arguments.dry_run:
+		standings_after: dict[int, list[EntityResults]] | None = get_standings(classifications, enwiki_id)
+
+		if standings_after is not None:
+			print_standings_changes(classifications, standings_before, standings_after)
 
 
 # Script's main function
@@ -698,9 +1080,13 @@ def main() -> None:
 		get_styled_points_system
 	)
 	from common.db_queries.manufacturer_table import refresh_manufacturers_timestamps
+	from common.db_queries.reference_data import refresh_reference_tables
 
 	global script_cannot_continue
 
+	# Small tables which rarely change are read again if database was changed since they were cached
+	refresh_reference_tables()
+
 	# Getting English Wikipedia's id from database
 	enwiki_id: int | None = get_wiki_id('enwiki')
 
@@ -834,7 +1220,7 @@ def main() -> None:
 		return
 
 	# Adding results to database
-	add_results_to_db(rows, round_num, session)
+	add_results_to_db(rows, classifications, round_num, session)
 
 	# Refreshing timestamps of manufacturers that took part in the race meeting
 	manufacturers_ids: list[int] = list()
@@ -847,4 +1233,9 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-	main()
+	script_arguments: argparse.Namespace = parse_arguments()
+
+	if script_arguments.manifest is None and script_arguments.csv is None:
+		main()
+	else:
+		run_batch(script_arguments)
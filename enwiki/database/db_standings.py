@@ -0,0 +1,44 @@
+import sys
+
+# Prevents creating __pycache__ directory
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	from pathlib import Path
+
+	project_path = str(Path(__file__).parent.parent.parent)
+	if project_path not in sys.path:
+		sys.path.append(project_path)
+
+
+# Script's main function
+def main() -> None:
+	from common.db_queries.standing_table import rebuild_standings
+
+	while True:
+		print('\nStandings of all classifications will be recalculated from scores saved in database. Continue?')
+		print('1. Yes\n2. No')
+		try:
+			ans = int(input('Choice (1-2): ').strip())
+		except ValueError:
+			print('\nPlease enter 1 or 2.')
+			continue
+
+		if ans == 1:
+			break
+		elif ans == 2:
+			print("\nScript's going to stop its execution.")
+			return
+		else:
+			print('\nPlease enter 1 or 2.')
+
+	standings: int | None = rebuild_standings()
+
+	if standings is None:
+		return
+
+	print(f'\nStandings rebuilt: {standings}')
+
+
+if __name__ == '__main__':
+	main()
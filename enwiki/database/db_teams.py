@@ -15,6 +15,9 @@ if True:  # noqa: E402
 		sys.path.append(project_path)
 
 	from common.models.teams import Team
+	from common.models.entity_import import ImportReport
+	from common.models.alkamel import AlkamelRow
+	from common.io.alkamel_csv import AlkamelCsvReader, find_results_files, read_csv_headers
 	from common.db_queries.wikipedia_table import get_wiki_id
 
 # Message when script must stop its execution
@@ -46,22 +49,13 @@ def write_teams_csv(teams: list[Team]) -> None:
 	print(f'\nNumer of team saved into {filename}: {len(teams)}')
 
 
-# Reads teams data from results .csv file
-def read_results_csv(file: str, wiki_id: int, championship_id: int) -> list[Team]:
+# Reads teams data from results .csv file into dictionary shared by all read files, returns number of processed lines.
+# Teams are keyed by codename, flag and car number.
+def read_results_teams(file: str, teams: dict[tuple[str, str, str], Team]) -> int:
 	from common.db_queries.country_code_table import get_country_iso_alpha3
-	from common.db_queries.team_tables import check_team_exists
-
-	teams: list[Team] = list()
-
-	with open(file, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader: DictReader[str] = DictReader(csv_file, delimiter=';')
-		line_count: int = 0
-
-		print('')
-
-		for row in csv_reader:  # type: dict[str]
-			line_count += 1
 
+	with AlkamelCsvReader(file) as csv_reader:
+		for row in csv_reader:  # type: AlkamelRow
 			country_id: int = row.get('ECM Country Id')
 			team_country: str | None = None
 
@@ -71,43 +65,70 @@ def read_results_csv(file: str, wiki_id: int, championship_id: int) -> list[Team
 			if team_country is None:
 				team_country = '?'
 
-			team_codename: str = f'#{row.get("NUMBER")} {row.get("TEAM")}'
-			team_car_no: str = row.get('NUMBER')
-			team_short_link: str = f'[[{row.get("TEAM")}]]'
-
-			if team_country != '?':
-				check_team_db: bool = check_team_exists(
-					codename=team_codename,
-					championship_id=championship_id,
-					flag=team_country,
-					car_number=team_car_no,
-					wikipedia_id=wiki_id
-				)
+			team_codename: str = row.team_codename
+			team_car_no: str = row.number
+			team_short_link: str = f'[[{row.team}]]'
+
+			key: tuple[str, str, str] = (team_codename, team_country, team_car_no)
 
-				if check_team_db:
-					print(f'{team_codename} ({team_country}) is already in database')
-					continue
+			if key in teams:
+				continue
 
-			team = Team(
+			teams[key] = Team(
 				codename=team_codename,
 				nationality=team_country,
 				car_number=team_car_no,
 				short_link=team_short_link
 			)
 
-			teams.append(team)
+		return csv_reader.line_count
 
-		print(f'\nProcessed lines: {line_count}\nNumber of new teams found: {len(teams)}')
 
-	return teams
+# Reads teams data from results .csv files, a team appearing in many rows or files is kept once
+def read_results_csv(files: list[str], wiki_id: int, championship_id: int) -> list[Team]:
+	from common.db_queries.team_tables import get_linked_team_keys
+
+	teams: dict[tuple[str, str, str], Team] = dict()
+	line_count: int = 0
+
+	print('')
+
+	for x, file in enumerate(files, start=1):  # type: int, str
+		found_before: int = len(teams)
+		file_lines: int = read_results_teams(file, teams)
+		line_count += file_lines
+
+		# Progress is shown only when many files are read
+		if len(files) > 1:
+			print(f'[{x}/{len(files)}] {file} - processed lines: {file_lines}, teams not seen before: {len(teams) - found_before}')
+
+	# Teams already in the database are found with one query, teams without known nationality are always kept
+	linked: set[tuple[str, str, str]] | None = get_linked_team_keys(
+		[k for k in teams if k[1] != '?'],
+		championship_id,
+		wiki_id
+	)
+
+	if linked is None:
+		return list()
+
+	new_teams: list[Team] = list()
+
+	for key, team in teams.items():  # type: tuple[str, str, str], Team
+		if key in linked:
+			print(f'{team.codename} ({team.nationality}) is already in database')
+		else:
+			new_teams.append(team)
+
+	print(f'\nProcessed lines: {line_count}\nNumber of new teams found: {len(new_teams)}')
+
+	return new_teams
 
 
 # Checks header of results .csv file
 def verify_results_csv(file: str) -> bool:
-	with open(file, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=';')
-		csv_dict = dict(list(csv_reader)[0])
-		headers = list(csv_dict.keys())
+	with AlkamelCsvReader(file) as csv_reader:
+		headers: list[str] = csv_reader.headers
 
 		return (
 			'NUMBER' in headers and
@@ -133,8 +154,39 @@ def read_results_csv_path() -> str:
 			return text
 
 
-# Saves teams data into .csv file
-def dump_teams_data_to_csv() -> None:
+# Reads path to a directory with results .csv files or a glob pattern matching them
+def read_results_files_path() -> list[str]:
+	while True:
+		text = input(
+			'\nPlease enter path to a directory with results .csv files downloaded from an Alkamelsystems website '
+			'or a glob pattern matching them, e.g. "2024/*/*.csv":\n'
+		).strip()
+
+		files: list[str] = find_results_files(text)
+
+		if len(files) == 0:
+			print('\nNo .csv files found under given path, please try again.')
+			continue
+
+		results_files: list[str] = list()
+
+		for f in files:  # type: str
+			if verify_results_csv(f):
+				results_files.append(f)
+			else:
+				print(f"{f} doesn't have required columns in its header and will be skipped")
+
+		if len(results_files) == 0:
+			print('\nNone of found files has required columns in its header, please try again.')
+			continue
+
+		print(f'\nResults files found: {len(results_files)}')
+
+		return results_files
+
+
+# Saves teams data into .csv file, teams are read from one results file or from many of them
+def dump_teams_data_to_csv(many_files: bool = False) -> None:
 	global script_cannot_continue
 
 	enwiki_id: int | None = get_wiki_id('enwiki')
@@ -147,11 +199,14 @@ def dump_teams_data_to_csv() -> None:
 		print(f"\nCouldn't find English Wikipedia in database. {script_cannot_continue}")
 		return
 
-	path: str = read_results_csv_path()
+	if many_files:
+		files: list[str] = read_results_files_path()
+	else:
+		files: list[str] = [read_results_csv_path()]
 
 	champ_id: int = read_championship()
 
-	teams: list[Team] = read_results_csv(path, enwiki_id, champ_id)
+	teams: list[Team] = read_results_csv(files, enwiki_id, champ_id)
 
 	if len(teams) == 0:
 		print("\nNo new teams found. Script's going to stop its execution.")
@@ -162,18 +217,15 @@ def dump_teams_data_to_csv() -> None:
 
 # Checks headers in teams data .csv file
 def verify_teams_csv(path: str) -> bool:
-	with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=',')
-		csv_dict = dict(list(csv_reader)[0])
-		headers = list(csv_dict.keys())
+	headers: list[str] = read_csv_headers(path)
 
-		return (
-			'codename' in headers
-			and 'nationality' in headers
-			and 'car_number' in headers
-			and 'short_link' in headers
-			and 'long_link' in headers
-		)
+	return (
+		'codename' in headers
+		and 'nationality' in headers
+		and 'car_number' in headers
+		and 'short_link' in headers
+		and 'long_link' in headers
+	)
 
 
 # Searches this directory for drivers data .csv files
@@ -361,15 +413,42 @@ def save_teams_data_to_db() -> None:
 
 	print()
 
-	add_teams(teams, championship_id, enwiki_id, team_type_id)
+	report: ImportReport | None = add_teams(teams, championship_id, enwiki_id, team_type_id)
+
+	if report is None:
+		print(f'\n{script_cannot_continue}')
+		return
+
+	for codename, links in report.existing_links.items():  # type: str, list[str]
+		print('{team} already has links in database: "{short_link}", "{long_link}"'.format(
+			team=codename,
+			short_link=links[0],
+			long_link=links[1]
+		))
+
+	for codename in report.inserted:  # type: str
+		print(f'{codename} - successfully added data to database')
+
+	for codename in report.linked:  # type: str
+		print(f'{codename} - successfully added links to database')
+
+	for codename, flags in report.changed_flags.items():  # type: str, list[str]
+		print(f'{codename} was already in database with other flag: {", ".join(flags)}')
+
+	print('\nAdded teams: {inserted}, teams with added links: {linked}, skipped teams: {skipped}'.format(
+		inserted=len(report.inserted),
+		linked=len(report.linked),
+		skipped=len(report.skipped)
+	))
 
 
 # Chooses script's working mode
 def choose_mode() -> None:
 	options = {
 		1: 'Generate teams data .csv file',
-		2: 'Save teams data into database',
-		3: 'Exit'
+		2: 'Generate teams data .csv file from many results files',
+		3: 'Save teams data into database',
+		4: 'Exit'
 	}
 
 	while True:
@@ -381,7 +460,7 @@ def choose_mode() -> None:
 		try:
 			num = int(input(f'Choice (1-{len(options)}): ').strip())
 		except ValueError:
-			print('\nPlease enter a natural number between 1 and 3.')
+			print('\nPlease enter a natural number between 1 and 4.')
 			continue
 
 		if num in options:
@@ -390,12 +469,15 @@ def choose_mode() -> None:
 					dump_teams_data_to_csv()
 					break
 				case 2:
-					save_teams_data_to_db()
+					dump_teams_data_to_csv(many_files=True)
 					break
 				case 3:
+					save_teams_data_to_db()
+					break
+				case 4:
 					return
 		else:
-			print('\nPlease enter a natural number between 1 and 3.')
+			print('\nPlease enter a natural number between 1 and 4.')
 			continue
 
 
@@ -5,7 +5,6 @@ sys.dont_write_bytecode = True
 
 if True:  # noqa: E402
 	import os
-	from csv import DictReader
 	from pathlib import Path
 
 	project_path = str(Path(__file__).parent.parent.parent.parent)
@@ -16,9 +15,12 @@ if True:  # noqa: E402
 	from common.models.championship import Championship
 	from common.models.driver import Driver
 	from common.models.teams import Team
+	from common.models.alkamel import AlkamelDriver, AlkamelRow
+	from common.io.alkamel_csv import AlkamelCsvReader
+	from common.db_connect import use_snapshot
 	from common.db_queries.wikipedia_table import get_wiki_id
-	from common.db_queries.team_tables import get_team_data
-	from common.db_queries.driver_tables import get_driver_data_by_codename
+	from common.db_queries.team_tables import get_teams_data
+	from common.db_queries.driver_tables import get_drivers_by_codenames
 	from common.db_queries.car_tables import get_car_link
 	from common.db_queries.championship_table import get_championships
 	from common.db_queries.tyre_table import get_tyre_manufacturer_name
@@ -43,13 +45,26 @@ def print_race_table(championship: Championship, filepath: str, wiki_id: int) ->
 	print("\nTable's code:\n")
 	print(*table_header, sep='\n')
 
-	with open(filepath, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader: DictReader[str] = DictReader(csv_file, delimiter=';')
+	with AlkamelCsvReader(filepath) as csv_reader:
+		csv_rows: list[AlkamelRow] = list(csv_reader)
 		line_count: int = 0
 		class_winners: set[str] = set()
 		statuses: set[str] = set()
 
-		for row in csv_reader:  # type: dict[str]
+		# Obtaining data of all teams from the file at once
+		teams_data: dict[str, Team] = get_teams_data(
+			codenames=[row.team_codename for row in csv_rows],
+			championship_id=championship.db_id,
+			wiki_id=wiki_id
+		) or dict()
+
+		# Obtaining data of all drivers from the file at once
+		drivers_data: dict[str, Driver] = get_drivers_by_codenames(
+			codenames=[c.lower() for row in csv_rows for c in row.driver_codenames],
+			wiki_id=wiki_id
+		) or dict()
+
+		for row in csv_rows:  # type: AlkamelRow
 			status: str = row['STATUS']
 
 			# Dividing table into parts with "Not classified" and other statuses
@@ -69,7 +84,7 @@ def print_race_table(championship: Championship, filepath: str, wiki_id: int) ->
 
 			# Printing overall position
 			if status == 'Classified':
-				print(f'! {row['POSITION']}')
+				print(f'! {row.position}')
 			else:
 				print('!')
 
@@ -80,11 +95,7 @@ def print_race_table(championship: Championship, filepath: str, wiki_id: int) ->
 				print(f'| align="center" | {category}')
 
 			# Obtaining and printing team's data
-			team_data: Team | None = get_team_data(
-				codename=f'#{row["NUMBER"]} {row["TEAM"]}',
-				championship_id=championship.db_id,
-				wiki_id=wiki_id
-			)
+			team_data: Team | None = teams_data.get(row.team_codename)
 
 			if team_data is not None and not team_data.empty_fields():
 				print(f'| align="center" | {team_data.car_number}')
@@ -99,40 +110,27 @@ def print_race_table(championship: Championship, filepath: str, wiki_id: int) ->
 			# Obtaining and printing team's drivers with their data
 			drivers: list[Driver] = list()
 
-			# Finding correct header(s) with drivers' data
-			if 'DRIVER_1' in row:
-				driver_columns: list[str] = ['DRIVER_{number}']
-			elif 'DRIVER1_FIRSTNAME' in row and 'DRIVER1_SECONDNAME' in row:
-				driver_columns: list[str] = ['DRIVER{number}_FIRSTNAME', 'DRIVER{number}_SECONDNAME']
-			else:
+			# Checking whether drivers' names are in expected header(s)
+			if not csv_reader.has_drivers:
 				print("| Drivers' names aren't in columns expected by this script.")
 
-			# Up to 4 driver per car at maximum
-			for x in range(1, 5):  # type: int
-				driver_codename: str = ''
-
-				for column in driver_columns:  # type: str
-					driver_codename += f' {row[column.format(number=x)]}'
-
-				driver_codename = driver_codename.lstrip()
-
-				if len(driver_codename) > 1:
-					driver_data: Driver | None = get_driver_data_by_codename(driver_codename.lower(), wiki_id)
+			for driver_codename in row.driver_codenames:  # type: str
+				driver_data: Driver | None = drivers_data.get(driver_codename.lower())
 
-					if driver_data is None or driver_data.empty_fields():
-						driver_name = driver_codename.split(' ', 1)
+				if driver_data is None or driver_data.empty_fields():
+					driver_name = driver_codename.split(' ', 1)
 
-						driver_short_link = driver_name[0]
+					driver_short_link = driver_name[0]
 
-						if len(driver_name) > 1:
-							driver_short_link += f' {driver_name[1].capitalize()}'
+					if len(driver_name) > 1:
+						driver_short_link += f' {driver_name[1].capitalize()}'
 
-						driver_data = Driver(
-							nationality='?',
-							short_link=driver_short_link
-						)
+					driver_data = Driver(
+						nationality='?',
+						short_link=driver_short_link
+					)
 
-					drivers.append(driver_data)
+				drivers.append(driver_data)
 
 			for x in range(0, len(drivers)):  # type: int
 				if x == 0:
@@ -160,7 +158,7 @@ def print_race_table(championship: Championship, filepath: str, wiki_id: int) ->
 			print(f'| {car}')
 
 			# Printing tyres' manufacturer
-			tyre_oem_letter: str = row['TYRES'] if 'TYRES' in row else row['TIRES']
+			tyre_oem_letter: str = row.tyres
 
 			tyre_oem_name: str | None = get_tyre_manufacturer_name(tyre_oem_letter)
 
@@ -214,12 +212,25 @@ def print_qualifying_table(championship: Championship, filepath: str, wiki_id: i
 	print("\nTable's code:\n")
 	print(*table_header, sep='\n')
 
-	with open(filepath, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader: DictReader[str] = DictReader(csv_file, delimiter=';')
+	with AlkamelCsvReader(filepath) as csv_reader:
+		csv_rows: list[AlkamelRow] = list(csv_reader)
 		line_count: int = 0
 		class_polesitters: set[str] = set()
 
-		for row in csv_reader:  # type: dict[str]
+		# Obtaining data of all teams from the file at once
+		teams_data: dict[str, Team] = get_teams_data(
+			codenames=[row.team_codename for row in csv_rows],
+			championship_id=championship.db_id,
+			wiki_id=wiki_id
+		) or dict()
+
+		# Obtaining data of all drivers from the file at once
+		drivers_data: dict[str, Driver] = get_drivers_by_codenames(
+			codenames=[c.lower() for row in csv_rows for c in row.driver_codenames],
+			wiki_id=wiki_id
+		) or dict()
+
+		for row in csv_rows:  # type: AlkamelRow
 			category: str = row['CLASS']
 
 			# Bolding rows of class pole-sitters
@@ -229,19 +240,15 @@ def print_qualifying_table(championship: Championship, filepath: str, wiki_id: i
 			else:
 				print('|-')
 
-			# Printing overall position, organisers use different headers for this value
-			position: str = row['POSITION'] if 'POSITION' in row else row['POS']
+			# Printing overall position
+			position: str = row.position
 			print(f'! {position}')
 
 			# Printing class
 			print(f'| align="center" | {category}')
 
 			# Obtaining and printing team's data
-			team_data: Team | None = get_team_data(
-				codename=f'#{row["NUMBER"]} {row["TEAM"]}',
-				championship_id=championship.db_id,
-				wiki_id=wiki_id
-			)
+			team_data: Team | None = teams_data.get(row.team_codename)
 
 			print(f'| align="center" | {row["NUMBER"]}')
 
@@ -258,25 +265,18 @@ def print_qualifying_table(championship: Championship, filepath: str, wiki_id: i
 			# Obtaining and printing team's drivers with their data
 			drivers: list[Driver] = list()
 
-			# Up to 4 driver per car at maximum
-			for x in range(1, 5):  # type: int
-				if (
-					row[f'DRIVER{x}_FIRSTNAME'] is None
-					or row[f'DRIVER{x}_FIRSTNAME'] == '' and row[f'DRIVER{x}_SECONDNAME'] == ''
-				):
-					continue
-
+			for driver in row.drivers:  # type: AlkamelDriver
 				driver_name = '{name} {lastname}'.format(
-					name=row[f'DRIVER{x}_FIRSTNAME'].capitalize(),
-					lastname=row[f'DRIVER{x}_SECONDNAME'].capitalize()
+					name=driver.firstname.capitalize(),
+					lastname=(driver.lastname or '').capitalize()
 				)
 
-				driver_data: Driver | None = get_driver_data_by_codename(driver_name.lower(), wiki_id)
+				driver_data: Driver | None = drivers_data.get(driver.codename.lower())
 
 				if driver_data is None or driver_data.empty_fields():
 					driver_data = Driver(
 						short_link=driver_name.strip(),
-						nationality=row[f'DRIVER{x}_COUNTRY']
+						nationality=driver.country if driver.country is not None else '?'
 					)
 
 				drivers.append(driver_data)
@@ -346,32 +346,35 @@ def print_qualifying_post_hp_table(championship: Championship, filepath: str, wi
 	print("\nTable's code:\n")
 	print(*table_header, sep='\n')
 
-	# Reading headers that contain qualifying sessions results
-	session_headers: dict[str, list[str]] = dict()
-
-	with open(filepath, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_header_reader: DictReader[str] = DictReader(csv_file, delimiter=';')
-		csv_headers: list[str] = list(dict(list(csv_header_reader)[0]).keys())
-		q1_headers: list[str] = [x for x in csv_headers if x.startswith('QP')]
-		hp_headers: list[str] = [x for x in csv_headers if x.startswith('HP')]
+	with AlkamelCsvReader(filepath) as csv_reader:
+		# Reading headers that contain qualifying sessions results
+		session_headers: dict[str, list[str]] = dict()
+		q1_headers: list[str] = [x for x in csv_reader.headers if x.startswith('QP')]
+		hp_headers: list[str] = [x for x in csv_reader.headers if x.startswith('HP')]
 
-	if len(q1_headers) > 0:
-		session_headers.update({'QP': q1_headers})
+		if len(q1_headers) > 0:
+			session_headers.update({'QP': q1_headers})
 
-	if len(hp_headers) > 0:
-		session_headers.update({'HP': hp_headers})
+		if len(hp_headers) > 0:
+			session_headers.update({'HP': hp_headers})
 
-	with open(filepath, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader: DictReader[str] = DictReader(csv_file, delimiter=';')
+		csv_rows: list[AlkamelRow] = list(csv_reader)
 		line_count: int = 0
 
 		class_polesitters: set[str] = set()
 
-		for row in csv_reader:  # type: dict[str]
+		# Obtaining data of all teams from the file at once
+		teams_data: dict[str, Team] = get_teams_data(
+			codenames=[row.team_codename for row in csv_rows],
+			championship_id=championship.db_id,
+			wiki_id=wiki_id
+		) or dict()
+
+		for row in csv_rows:  # type: AlkamelRow
 			print('|-')
 
-			# Printing overall position, organisers use different headers for this value
-			position: str = row['POSITION'] if 'POSITION' in row else row['POS']
+			# Printing overall position
+			position: str = row.position
 			print(f'! {position}')
 
 			category: str = row['CLASS']
@@ -383,11 +386,7 @@ def print_qualifying_post_hp_table(championship: Championship, filepath: str, wi
 				print(f'| align="center" | {category}')
 
 			# Obtaining and printing team's data
-			team_data: Team | None = get_team_data(
-				codename=f'#{row["NUMBER"]} {row["TEAM"]}',
-				championship_id=championship.db_id,
-				wiki_id=wiki_id
-			)
+			team_data: Team | None = teams_data.get(row.team_codename)
 
 			if team_data is not None and not team_data.empty_fields():
 				row_team: str = '{{{{flagicon|{country}}}}} {team_link}'.format(
@@ -468,27 +467,30 @@ def print_qualifying_pre_hp_table(championship: Championship, filepath: str, wik
 	print("\nTable's code:\n")
 	print(*table_header, sep='\n')
 
-	with open(filepath, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader: DictReader = DictReader(csv_file, delimiter=';')
+	with AlkamelCsvReader(filepath) as csv_reader:
+		csv_rows: list[AlkamelRow] = list(csv_reader)
 		line_count: int = 0
 		class_fastest: set[str] = set()
 
-		for row in csv_reader:  # type: dict[str]
+		# Obtaining data of all teams from the file at once
+		teams_data: dict[str, Team] = get_teams_data(
+			codenames=[row.team_codename for row in csv_rows],
+			championship_id=championship.db_id,
+			wiki_id=wiki_id
+		) or dict()
+
+		for row in csv_rows:  # type: AlkamelRow
 			print('|-')
 
-			# Printing overall position, organisers use different headers for this value
-			position = row['POSITION'] if 'POSITION' in row else row['POS']
+			# Printing overall position
+			position = row.position
 			print(f'! {position}')
 
 			# Printing class
 			print(f'| align="center" | {row["CLASS"]}')
 
 			# Obtaining and printing team's data
-			team_data: Team | None = get_team_data(
-				codename=f'#{row["NUMBER"]} {row["TEAM"]}',
-				championship_id=championship.db_id,
-				wiki_id=wiki_id
-			)
+			team_data: Team | None = teams_data.get(row.team_codename)
 
 			print(f'| align="center" | {row["NUMBER"]}')
 
@@ -546,12 +548,19 @@ def print_fp_table(championship: Championship, filepath: str, wiki_id: int) -> N
 	print("\nTable's code:\n")
 	print(*table_header, sep='\n')
 
-	with open(filepath, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader: DictReader = DictReader(csv_file, delimiter=';')
+	with AlkamelCsvReader(filepath) as csv_reader:
+		csv_rows: list[AlkamelRow] = list(csv_reader)
 		line_count: int = 0
 		classes: set[str] = set()
 
-		for row in csv_reader:  # type: dict[str]
+		# Obtaining data of all teams from the file at once
+		teams_data: dict[str, Team] = get_teams_data(
+			codenames=[row.team_codename for row in csv_rows],
+			championship_id=championship.db_id,
+			wiki_id=wiki_id
+		) or dict()
+
+		for row in csv_rows:  # type: AlkamelRow
 			if row['CLASS'] not in classes:
 				classes.add(row['CLASS'])
 
@@ -560,11 +569,7 @@ def print_fp_table(championship: Championship, filepath: str, wiki_id: int) -> N
 				print(f'! {row['CLASS']}')
 
 				# Obtaining and printing team's data
-				team_data: Team | None = get_team_data(
-					codename=f'#{row["NUMBER"]} {row["TEAM"]}',
-					championship_id=championship.db_id,
-					wiki_id=wiki_id
-				)
+				team_data: Team | None = teams_data.get(row.team_codename)
 
 				print(f'| align="center" | {row['NUMBER']}')
 
@@ -684,6 +689,9 @@ def read_series(championships: list[Championship]) -> Championship | None:
 def main() -> None:
 	script_cannot_continue: str = "Script can't continue and is going to end its execution."
 
+	# Data is only read, so queries are served from an in-memory copy of the database
+	use_snapshot()
+
 	championship_list: list[Championship] | None = get_championships()
 
 	if championship_list is None:
@@ -15,6 +15,9 @@ if True:  # noqa: E402
 
     from common.db_queries.wikipedia_table import get_wiki_id
     from common.models.car import Car
+    from common.models.entity_import import ImportReport
+    from common.models.alkamel import AlkamelRow
+    from common.io.alkamel_csv import AlkamelCsvReader, find_results_files, read_csv_headers
 
 
 # Zapisanie nazw samochodów do pliku .csv
@@ -42,54 +45,68 @@ def write_cars_csv(cars: list[Car]) -> None:
     print(f'\nAuta zapisane w pliku {filename}: {len(cars)}')
 
 
-# Odczytanie samochodów z pliku zawierającego wyniki
-def read_results_csv(path: str, wiki_id: int) -> list[Car]:
-    from common.db_queries.car_tables import check_car_exists
+# Odczytanie samochodów z pliku zawierającego wyniki do słownika wspólnego dla wszystkich plików,
+# zwracana jest liczba przetworzonych linii
+def read_results_cars(path: str, cars: dict[str, Car]) -> int:
+    with AlkamelCsvReader(path) as csv_reader:
+        for row in csv_reader:  # type: AlkamelRow
+            codename = row.vehicle
 
-    cars: list[Car] = list()
+            if type(codename) is not str:
+                continue
 
-    with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-        csv_reader = csv.DictReader(csv_file, delimiter=';')
-        line_count = 0
-        checked: set[str] = set()
+            if codename in cars:
+                continue
 
-        print('')
+            cars[codename] = Car(
+                codename=codename,
+                link=f'[[{codename}]]'
+            )
 
-        for row in csv_reader:  # type: dict
-            line_count += 1
+        return csv_reader.line_count
 
-            codename = row.get('VEHICLE')
 
-            if type(codename) is not str:
-                continue
+# Odczytanie samochodów z plików zawierających wyniki, auto występujące wielokrotnie jest zapisywane raz
+def read_results_csv(files: list[str], wiki_id: int) -> list[Car]:
+    from common.db_queries.car_tables import get_linked_car_codenames
 
-            if codename in checked:
-                continue
+    cars: dict[str, Car] = dict()
+    line_count = 0
 
-            checked.add(codename)
+    print('')
 
-            if check_car_exists(codename, wiki_id):
-                print(f'{codename} jest już w bazie.')
-                continue
+    for x, file in enumerate(files, start=1):  # type: int, str
+        found_before = len(cars)
+        file_lines = read_results_cars(file, cars)
+        line_count += file_lines
 
-            cars.append(
-                Car(
-                    codename=codename,
-                    link=f'[[{codename}]]'
-                )
-            )
+        # Postęp jest wyświetlany tylko przy odczycie wielu plików
+        if len(files) > 1:
+            print(f'[{x}/{len(files)}] {file} - przetworzone linie: {file_lines}, auta wcześniej nieznalezione: {len(cars) - found_before}')
 
-        print(f'\nPrzetworzone linie: {line_count}\nZnalezione auta: {len(cars)}')
+    # Auta, które są już w bazie, są wyszukiwane jednym zapytaniem
+    linked: set[str] | None = get_linked_car_codenames(cars.keys(), wiki_id)
 
-    return cars
+    if linked is None:
+        return list()
+
+    new_cars: list[Car] = list()
+
+    for car in cars.values():  # type: Car
+        if car.codename in linked:
+            print(f'{car.codename} jest już w bazie.')
+        else:
+            new_cars.append(car)
+
+    print(f'\nPrzetworzone linie: {line_count}\nZnalezione auta: {len(new_cars)}')
+
+    return new_cars
 
 
 # Sprawdzenie podanego pliku z wynikami pod kątem wymaganych kolumn
 def verify_results_csv(path: str) -> bool:
-    with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-        csv_reader = csv.DictReader(csv_file, delimiter=';')
-        csv_dict = dict(list(csv_reader)[0])
-        headers = list(csv_dict.keys())
+    with AlkamelCsvReader(path) as csv_reader:
+        headers: list[str] = csv_reader.headers
 
         return 'VEHICLE' in headers
 
@@ -112,8 +129,39 @@ def read_path_to_results_csv() -> str:
             return text
 
 
-# Tworzenie pliku .csv z danymi aut
-def dump_cars_data_to_csv() -> None:
+# Odczytanie ścieżki do katalogu z plikami csv zawierającymi wyniki lub wzorca pasującego do tych plików
+def read_path_to_results_files() -> list[str]:
+    while True:
+        text = input(
+            '\nPodaj ścieżkę do katalogu z plikami .CSV pobranymi ze strony Alkamelsystems '
+            'lub wzorzec pasujący do tych plików, np. "2024/*/*.csv":\n'
+        ).strip()
+
+        files: list[str] = find_results_files(text)
+
+        if len(files) == 0:
+            print('\nNie znaleziono plików .csv, spróbuj ponownie.')
+            continue
+
+        results_files: list[str] = list()
+
+        for f in files:  # type: str
+            if verify_results_csv(f):
+                results_files.append(f)
+            else:
+                print(f'{f} nie posiada kolumny VEHICLE i zostanie pominięty.')
+
+        if len(results_files) == 0:
+            print('\nŻaden ze znalezionych plików nie posiada kolumny VEHICLE, spróbuj ponownie.')
+            continue
+
+        print(f'\nZnalezione pliki z wynikami: {len(results_files)}')
+
+        return results_files
+
+
+# Tworzenie pliku .csv z danymi aut odczytanymi z jednego lub wielu plików z wynikami
+def dump_cars_data_to_csv(many_files: bool = False) -> None:
     plwiki_id: int | None = get_wiki_id('plwiki')
 
     if plwiki_id is None:
@@ -123,9 +171,12 @@ def dump_cars_data_to_csv() -> None:
         print('Nie znaleziono w bazie danych polskiej wersji Wikipedii')
         return
 
-    path: str = read_path_to_results_csv()
+    if many_files:
+        files: list[str] = read_path_to_results_files()
+    else:
+        files: list[str] = [read_path_to_results_csv()]
 
-    cars: list[Car] = read_results_csv(path, plwiki_id)
+    cars: list[Car] = read_results_csv(files, plwiki_id)
 
     if len(cars) == 0:
         print('\nNie znaleziono nowych aut. Skrypt zakończy pracę.')
@@ -136,15 +187,12 @@ def dump_cars_data_to_csv() -> None:
 
 # Sprawdzenie podanego pliku z danymi aut pod kątem wymaganych kolumn
 def verify_cars_csv(path: str) -> bool:
-    with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-        csv_reader = csv.DictReader(csv_file, delimiter=',')
-        csv_dict = dict(list(csv_reader)[0])
-        headers = list(csv_dict.keys())
+    headers: list[str] = read_csv_headers(path)
 
-        return (
-            'codename' in headers and
-            'link' in headers
-        )
+    return (
+        'codename' in headers and
+        'link' in headers
+    )
 
 
 # Sprawdzenie, czy bieżący katalog zawiera pliki z danymi aut
@@ -285,15 +333,34 @@ def save_cars_data_to_db() -> None:
 
     print()
 
-    add_cars(cars, plwiki_id)
+    report: ImportReport | None = add_cars(cars, plwiki_id)
+
+    if report is None:
+        return
+
+    for codename, links in report.existing_links.items():  # type: str, list[str]
+        print(f'{codename} ma już link w bazie: "{links[0]}"')
+
+    for codename in report.inserted:  # type: str
+        print(f'{codename} - dodano dane do bazy')
+
+    for codename in report.linked:  # type: str
+        print(f'{codename} - dodano link do bazy')
+
+    print('\nDodane auta: {inserted}, auta z dodanymi linkami: {linked}, pominięte auta: {skipped}'.format(
+        inserted=len(report.inserted),
+        linked=len(report.linked),
+        skipped=len(report.skipped)
+    ))
 
 
 # Wybór trybu pracy skryptu
 def choose_mode() -> None:
     options = {
         1: 'Wygenerować plik .csv z danymi o autach',
-        2: 'Zapisać dane o autach w bazie',
-        3: 'Zakończyć działanie'
+        2: 'Wygenerować plik .csv z danymi o autach z wielu plików z wynikami',
+        3: 'Zapisać dane o autach w bazie',
+        4: 'Zakończyć działanie'
     }
 
     while True:
@@ -305,7 +372,7 @@ def choose_mode() -> None:
         try:
             num = int(input(f'Wybór (1-{len(options)}): ').strip())
         except ValueError:
-            print('\nPodaj liczbę między 1 a 3.')
+            print('\nPodaj liczbę między 1 a 4.')
             continue
 
         if num in options:
@@ -314,9 +381,12 @@ def choose_mode() -> None:
                     dump_cars_data_to_csv()
                     break
                 case 2:
-                    save_cars_data_to_db()
+                    dump_cars_data_to_csv(many_files=True)
                     break
                 case 3:
+                    save_cars_data_to_db()
+                    break
+                case 4:
                     return
         else:
             print('\nWybór spoza listy opcji, spróbuj ponownie.')
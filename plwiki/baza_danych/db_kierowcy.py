@@ -14,6 +14,9 @@ if True:  # noqa: E402
 		sys.path.append(project_path)
 
 	from common.models.driver import Driver
+	from common.models.entity_import import ImportReport
+	from common.models.alkamel import AlkamelDriver, AlkamelRow
+	from common.io.alkamel_csv import AlkamelCsvReader, find_results_files, read_csv_headers
 	from common.db_queries.wikipedia_table import get_wiki_id
 
 
@@ -42,24 +45,14 @@ def write_drivers_csv(drivers: list[Driver]) -> None:
 	print(f'\nKierowcy zapisani w pliku {filename}: {len(drivers)}')
 
 
-# Odczytanie danych o kierowcach kierowców z pliku zawierającego wyniki
-def read_results_csv(file: str, wiki_id: int) -> list[Driver]:
-	from common.db_queries.driver_tables import check_driver_exists
-
-	drivers: list[Driver] = list()
-
-	with open(file, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=';')
-		line_count = 0
-
-		print('')
-
-		for row in csv_reader:  # type: dict
-			line_count += 1
-
-			for x in range(1, 5):  # type: int
-				firstname = row.get(f'DRIVER{x}_FIRSTNAME')
-				lastname = row.get(f'DRIVER{x}_SECONDNAME')
+# Odczytanie danych o kierowcach z pliku zawierającego wyniki do słownika wspólnego dla wszystkich plików,
+# zwracana jest liczba przetworzonych linii
+def read_results_drivers(file: str, drivers: dict[str, Driver]) -> int:
+	with AlkamelCsvReader(file) as csv_reader:
+		for row in csv_reader:  # type: AlkamelRow
+			for driver in row.drivers:  # type: AlkamelDriver
+				firstname = driver.firstname
+				lastname = driver.lastname
 
 				if (
 					firstname is not None
@@ -72,40 +65,67 @@ def read_results_csv(file: str, wiki_id: int) -> list[Driver]:
 						lastname.lower()
 					)
 
-					driver_nationality = row.get(f'DRIVER{x}_COUNTRY')
-
-					if driver_nationality is not None:
-						if check_driver_exists(
-							codename=driver_codename,
-							wikipedia_id=wiki_id
-						):
-							print(f'{driver_codename} jest już w bazie.')
-							continue
+					if driver_codename in drivers:
+						continue
 
 					driver_short_link = '[[%s %s]]' % (
 						firstname.capitalize(),
 						lastname.capitalize()
 					)
 
-					driver = Driver(
+					drivers[driver_codename] = Driver(
 						codename=driver_codename,
-						nationality=driver_nationality,
+						nationality=driver.country,
 						short_link=driver_short_link
 					)
 
-					drivers.append(driver)
+		return csv_reader.line_count
 
-		print(f'\nPrzetworzone linie: {line_count}\nZnalezieni kierowcy: {len(drivers)}')
 
-	return drivers
+# Odczytanie danych o kierowcach z plików zawierających wyniki, kierowca występujący wielokrotnie jest zapisywany raz
+def read_results_csv(files: list[str], wiki_id: int) -> list[Driver]:
+	from common.db_queries.driver_tables import get_linked_driver_codenames
+
+	drivers: dict[str, Driver] = dict()
+	line_count = 0
+
+	print('')
+
+	for x, file in enumerate(files, start=1):  # type: int, str
+		found_before = len(drivers)
+		file_lines = read_results_drivers(file, drivers)
+		line_count += file_lines
+
+		# Postęp jest wyświetlany tylko przy odczycie wielu plików
+		if len(files) > 1:
+			print(f'[{x}/{len(files)}] {file} - przetworzone linie: {file_lines}, kierowcy wcześniej nieznalezieni: {len(drivers) - found_before}')
+
+	# Kierowcy, którzy są już w bazie, są wyszukiwani jednym zapytaniem, kierowcy bez narodowości są zawsze zachowywani
+	linked: set[str] | None = get_linked_driver_codenames(
+		[d.codename for d in drivers.values() if d.nationality is not None],
+		wiki_id
+	)
+
+	if linked is None:
+		return list()
+
+	new_drivers: list[Driver] = list()
+
+	for driver in drivers.values():  # type: Driver
+		if driver.codename in linked:
+			print(f'{driver.codename} jest już w bazie.')
+		else:
+			new_drivers.append(driver)
+
+	print(f'\nPrzetworzone linie: {line_count}\nZnalezieni kierowcy: {len(new_drivers)}')
+
+	return new_drivers
 
 
 # Sprawdzenie kolumn w podanym pliku z wynikami
 def verify_results_csv(file) -> bool:
-	with open(file, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=';')
-		csv_dict = dict(list(csv_reader)[0])
-		headers = list(csv_dict.keys())
+	with AlkamelCsvReader(file) as csv_reader:
+		headers: list[str] = csv_reader.headers
 
 		return (
 			'DRIVER1_FIRSTNAME' in headers
@@ -135,8 +155,39 @@ def read_results_csv_path() -> str:
 			return text
 
 
-# Tworzenie pliku .csv z danymi kierowców
-def dump_drivers_data_to_csv() -> None:
+# Odczytanie ścieżki do katalogu z plikami z wynikami lub wzorca pasującego do tych plików
+def read_results_files_path() -> list[str]:
+	while True:
+		text = input(
+			'\nPodaj ścieżkę do katalogu z plikami .CSV pobranymi ze strony Alkamelsystems '
+			'lub wzorzec pasujący do tych plików, np. "2024/*/*.csv":\n'
+		).strip()
+
+		files: list[str] = find_results_files(text)
+
+		if len(files) == 0:
+			print('\nNie znaleziono plików .csv, spróbuj ponownie.')
+			continue
+
+		results_files: list[str] = list()
+
+		for f in files:  # type: str
+			if verify_results_csv(f):
+				results_files.append(f)
+			else:
+				print(f'{f} nie posiada wymaganych kolumn i zostanie pominięty.')
+
+		if len(results_files) == 0:
+			print('\nŻaden ze znalezionych plików nie posiada wymaganych kolumn, spróbuj ponownie.')
+			continue
+
+		print(f'\nZnalezione pliki z wynikami: {len(results_files)}')
+
+		return results_files
+
+
+# Tworzenie pliku .csv z danymi kierowców odczytanymi z jednego lub wielu plików z wynikami
+def dump_drivers_data_to_csv(many_files: bool = False) -> None:
 	plwiki_id: int | None = get_wiki_id('plwiki')
 
 	if plwiki_id is None:
@@ -146,9 +197,12 @@ def dump_drivers_data_to_csv() -> None:
 		print('\nNie znaleziono w bazie danych polskiej wersji Wikipedii')
 		return
 
-	path: str = read_results_csv_path()
+	if many_files:
+		files: list[str] = read_results_files_path()
+	else:
+		files: list[str] = [read_results_csv_path()]
 
-	drivers: list[Driver] = read_results_csv(path, plwiki_id)
+	drivers: list[Driver] = read_results_csv(files, plwiki_id)
 
 	if len(drivers) == 0:
 		print('\nNie znaleziono nowych kierowców. Skrypt zakończy działanie.')
@@ -159,17 +213,14 @@ def dump_drivers_data_to_csv() -> None:
 
 # Sprawdzenie kolumn w podanym pliku z danymi kierowców
 def verify_drivers_csv(path: str) -> bool:
-	with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=',')
-		csv_dict = dict(list(csv_reader)[0])
-		headers = list(csv_dict.keys())
+	headers: list[str] = read_csv_headers(path)
 
-		return (
-			'codename' in headers
-			and 'nationality' in headers
-			and 'short_link' in headers
-			and 'long_link' in headers
-		)
+	return (
+		'codename' in headers
+		and 'nationality' in headers
+		and 'short_link' in headers
+		and 'long_link' in headers
+	)
 
 
 # Sprawdzenie, czy bieżący katalog zawiera pliki z danymi kierowców
@@ -323,15 +374,38 @@ def save_drivers_data_to_db() -> None:
 
 	print()
 
-	add_drivers(drivers, plwiki_id, driver_type_id)
+	report: ImportReport | None = add_drivers(drivers, plwiki_id, driver_type_id)
+
+	if report is None:
+		return
+
+	for codename, links in report.existing_links.items():  # type: str, list[str]
+		print('{driver} ma już linki w bazie: "{short_link}", "{long_link}"'.format(
+			driver=codename,
+			short_link=links[0],
+			long_link=links[1]
+		))
+
+	for codename in report.inserted:  # type: str
+		print(f'{codename} - dodano dane do bazy')
+
+	for codename in report.linked:  # type: str
+		print(f'{codename} - dodano linki do bazy')
+
+	print('\nDodani kierowcy: {inserted}, kierowcy z dodanymi linkami: {linked}, pominięci kierowcy: {skipped}'.format(
+		inserted=len(report.inserted),
+		linked=len(report.linked),
+		skipped=len(report.skipped)
+	))
 
 
 # Wybór trybu pracy skryptu
 def choose_mode() -> None:
 	options = {
 		1: 'Wygenerować plik .csv z danymi o kierowcach',
-		2: 'Zapisać dane o kierowcach w bazie',
-		3: 'Zakończyć działanie'
+		2: 'Wygenerować plik .csv z danymi o kierowcach z wielu plików z wynikami',
+		3: 'Zapisać dane o kierowcach w bazie',
+		4: 'Zakończyć działanie'
 	}
 
 	while True:
@@ -353,9 +427,12 @@ def choose_mode() -> None:
 			dump_drivers_data_to_csv()
 			break
 		elif num == 2:
-			save_drivers_data_to_db()
+			dump_drivers_data_to_csv(many_files=True)
 			break
 		elif num == 3:
+			save_drivers_data_to_db()
+			break
+		elif num == 4:
 			return
 
 
@@ -0,0 +1,44 @@
+import sys
+
+# Powstrzymanie Pythona od tworzenia dodatkowych plików i katalogów przy wykonywaniu skryptu
+sys.dont_write_bytecode = True
+
+if True:  # noqa: E402
+	from pathlib import Path
+
+	project_path = str(Path(__file__).parent.parent.parent)
+	if project_path not in sys.path:
+		sys.path.append(project_path)
+
+
+# Główna funkcja skryptu
+def main() -> None:
+	from common.db_queries.standing_table import rebuild_standings
+
+	while True:
+		print('\nKlasyfikacje wszystkich sezonów zostaną przeliczone na podstawie wyników zapisanych w bazie. Kontynuować?')
+		print('1. Tak\n2. Nie')
+		try:
+			ans = int(input('Wybór (1-2): ').strip())
+		except ValueError:
+			print('\nPodaj liczbę 1 lub 2.')
+			continue
+
+		if ans == 1:
+			break
+		elif ans == 2:
+			print('\nSkrypt zakończy działanie.')
+			return
+		else:
+			print('\nPodaj liczbę 1 lub 2.')
+
+	standings: int | None = rebuild_standings()
+
+	if standings is None:
+		return
+
+	print(f'\nPrzeliczone pozycje w klasyfikacjach: {standings}')
+
+
+if __name__ == '__main__':
+	main()
@@ -6,22 +6,38 @@ sys.dont_write_bytecode = True
 if True:  # noqa: E402
 	import os
 	import csv
-	import re
+	import io
+	import time
+	import argparse
+	import contextlib
+	import multiprocessing
+	from concurrent.futures import ProcessPoolExecutor
 	from pathlib import Path
 
 	project_path = str(Path(__file__).parent.parent.parent)
 	if project_path not in sys.path:
 		sys.path.append(project_path)
 
-	from common.models.classifications import Classification, EligibleClassifications, ClassificationScoring
-	from common.models.manufacturer import Manufacturer, ManufacturerScoringCars
-	from common.models.results import ResultRow
+	from common.models.classifications import (
+		Classification, EligibleClassifications, ClassificationScoring, EligibilityIndex
+	)
+	from common.models.manufacturer import Manufacturer, ManufacturerMatcher
+	from common.models.results import EntityResults, ResultRow, Score
+	from common.models.scoring import SessionScoring
 	from common.models.championship import Championship
 	from common.models.sessions import DbSession
 	from common.models.styles import StyledStatus, StyledPosition
 	from common.models.driver import Driver
 	from common.models.teams import Team, TeamEligibility
-	from common.models.points import AwardedPoints
+	from common.models.points import AwardedPoints, PointsImport, SeasonData
+	from common.models.alkamel import AlkamelRow
+	from common.io.alkamel_csv import AlkamelCsvReader
+
+# Wartości przyznanej puli punktów akceptowane w argumentach wywołania i w manifeście
+awarded_points_values: dict[str, AwardedPoints] = {'full': AwardedPoints.FULL, 'half': AwardedPoints.HALF}
+
+# Dane sezonu używane przy odczycie plików z wynikami w trybie wsadowym, ustawiane w każdym procesie odczytu
+batch_season: SeasonData | None = None
 
 
 # Odczytanie id serii, której klasyfikacje mają zostać wygenerowane
@@ -199,139 +215,149 @@ def read_csv_path() -> str:
 # Wyszukiwanie odpowiednich klasyfikacji
 def find_classifications(
 	category: str, team_id: int, driver_ids: list[int],
-	manufacturer_id: int | None, classifications: list[Classification],
+	manufacturer_id: int | None, eligibility: EligibilityIndex,
 ) -> EligibleClassifications:
-	from common.db_queries.classification_tables import check_points_eligibility
-
 	eligible_cl = EligibleClassifications(driver_cl=None, team_cl=None, manufacturer_cl=None)
 
-	for cl in classifications:
-		if re.search(f'{category}', cl.name, re.IGNORECASE):
-			if re.search('driver', cl.name, re.IGNORECASE):
-				checks: list[bool] = list()
-
-				for drv_id in driver_ids:
-					checks.append(check_points_eligibility(cl.db_id, drv_id))
-
-				if all(checks) is True:
-					eligible_cl.driver_cl = cl
-
-			if (
-				manufacturer_id is not None
-				and re.search('manufacturer', cl.name, re.IGNORECASE)
-				and check_points_eligibility(cl.db_id, team_id)
-			):
-				eligible_cl.manufacturer_cl = cl
-			if (
-				re.search('team', cl.name, re.IGNORECASE)
-				and check_points_eligibility(cl.db_id, team_id)
-			):
-				eligible_cl.team_cl = cl
+	eligible_cl.driver_cl = eligibility.find(category, 'driver', driver_ids)
+
+	if manufacturer_id is not None:
+		eligible_cl.manufacturer_cl = eligibility.find(category, 'manufacturer', [team_id])
+
+	eligible_cl.team_cl = eligibility.find(category, 'team', [team_id])
 
 	return eligible_cl
 
 
-# Odczytanie danych z pliku csv zawierającego wyniki
+# Pobranie indeksu klasyfikacji, w których mogą punktować zespoły i kierowcy
+def get_eligibility_index(classifications: list[Classification]) -> EligibilityIndex | None:
+	from common.db_queries.classification_tables import get_ineligible_entities
+
+	# Pobranie jednym zapytaniem wszystkich zgłoszeń, które nie mogą punktować w klasyfikacjach
+	ineligible: dict[int, frozenset[int]] | None = get_ineligible_entities([cl.db_id for cl in classifications])
+
+	if ineligible is None:
+		return None
+
+	return EligibilityIndex(classifications, ineligible)
+
+
+# Pobranie wyszukiwarki producentów aut
+def get_manufacturer_matcher() -> ManufacturerMatcher | None:
+	from common.db_queries.manufacturer_table import get_manufacturers
+
+	manufacturers: list[Manufacturer] | None = get_manufacturers()
+
+	if manufacturers is None:
+		return None
+
+	return ManufacturerMatcher(manufacturers)
+
+
+# Odczytanie danych z pliku csv zawierającego wyniki.
+# Indeks klasyfikacji i wyszukiwarka producentów są pobierane z bazy, o ile nie zostały podane,
+# dzięki czemu można ich używać przy dodawaniu wielu plików.
 def read_results_csv(
 	path: str, classifications: list[Classification], manufacturer_classifications_num: int,
-	wiki_id: int
+	wiki_id: int, eligibility: EligibilityIndex | None = None,
+	manufacturer_matcher: ManufacturerMatcher | None = None
 ) -> list[ResultRow]:
-	from common.db_queries.team_tables import get_id_and_scoring
-	from common.db_queries.driver_tables import get_driver_data_by_codename
-	from common.db_queries.manufacturer_table import get_manufacturers
+	from common.db_queries.team_tables import get_teams_id_and_scoring
+	from common.db_queries.driver_tables import get_drivers_by_codenames
 
 	rows: list[ResultRow] = list()
 	not_found: dict[str, list[str]] = {'teams': [], 'drivers': []}
-	manufacturers: list[Manufacturer] | None = None
 
-	if manufacturer_classifications_num > 0:
-		manufacturers = get_manufacturers()
+	if manufacturer_classifications_num == 0:
+		manufacturer_matcher = None
+	elif manufacturer_matcher is None:
+		manufacturer_matcher = get_manufacturer_matcher()
+
+	if eligibility is None:
+		eligibility = get_eligibility_index(classifications)
+
+		if eligibility is None:
+			return list()
 
 	championship_id: int = classifications[0].championship_id
 
-	with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=';')
+	with AlkamelCsvReader(path) as csv_reader:
+		if not csv_reader.has_columns('NUMBER', 'TEAM', 'CLASS', 'STATUS', 'VEHICLE'):
+			error_text = [
+				'\nBłąd podczas czytania danych.',
+				'W podanym pliku brakuje któregoś z nagłówków:',
+				'NUMBER, TEAM, CLASS, STATUS lub VEHICLE.'
+			]
+			print(*error_text, sep=' ')
+			return list()
+
+		if not csv_reader.has_drivers:
+			msg: list[str] = [
+				'\nBłąd podczas czytania danych.',
+				'W podanym pliku brakuje kolumny z danymi kierowców.'
+			]
+			print(*msg, sep=' ')
+			return list()
+
+		csv_rows: list[AlkamelRow] = list(csv_reader)
 		line_count = 0
 
-		for row in csv_reader:  # type: dict
+		# Pobranie danych wszystkich kierowców z pliku jednym zapytaniem
+		drivers_data: dict[str, Driver] | None = get_drivers_by_codenames(
+			codenames=[c.lower() for row in csv_rows for c in row.driver_codenames],
+			wiki_id=wiki_id
+		)
+
+		if drivers_data is None:
+			return list()
+
+		# Pobranie id i możliwości punktowania wszystkich zespołów z pliku jednym zapytaniem
+		teams_eligibility: dict[str, TeamEligibility] | None = get_teams_id_and_scoring(
+			codenames=[row.team_codename for row in csv_rows],
+			championship_id=championship_id
+		)
+
+		if teams_eligibility is None:
+			return list()
+
+		for row in csv_rows:  # type: AlkamelRow
 			line_count += 1
 			row_drivers: list[Driver] = list()
 
-			try:
-				row_car_no = row['NUMBER']
-				row_team = row['TEAM']
-				row_category = row['CLASS']
-				row_status = row['STATUS']
-				row_vehicle = row['VEHICLE']
-			except KeyError:
-				error_text = [
-					'\nBłąd podczas czytania danych.',
-					'W podanym pliku brakuje któregoś z nagłówków:',
-					'NUMBER, TEAM, CLASS, STATUS lub VEHICLE.'
-				]
-				print(*error_text, sep=' ')
-				return []
-
-			team_codename: str = f'#{row_car_no} {row_team}'
-
-			team_eligibility: TeamEligibility = get_id_and_scoring(
-				team_codename,
-				championship_id
-			)
+			team_codename: str = row.team_codename
 
-			if team_eligibility.team.db_id is None:
+			team_eligibility: TeamEligibility | None = teams_eligibility.get(team_codename)
+
+			if team_eligibility is None:
 				not_found['teams'].append(team_codename)
 				continue
 
 			if team_eligibility.eligibility is None or not team_eligibility.eligibility:
 				continue
 
-			if 'DRIVER_1' in row:
-				driver_columns: list[str] = ['DRIVER_{number}']
-			elif 'DRIVER1_FIRSTNAME' in row and 'DRIVER1_SECONDNAME' in row:
-				driver_columns: list[str] = ['DRIVER{number}_FIRSTNAME', 'DRIVER{number}_SECONDNAME']
-			else:
-				msg: list[str] = [
-					'\nBłąd podczas czytania danych.',
-					'W podanym pliku brakuje kolumny z danymi kierowców.'
-				]
-				print(*msg, sep=' ')
-				return list()
-
-			for x in range(1, 5):
-				driver_codename: str = ''
-
-				for column in driver_columns:
-					driver_codename += f' {row[column.format(number=x)]}'
-
-				driver_codename = driver_codename.lstrip()
-
-				if len(driver_codename) > 1:
-					driver_data: Driver | None = get_driver_data_by_codename(driver_codename.lower(), wiki_id)
-					if driver_data is None or driver_data.empty_fields():
-						not_found['drivers'].append(driver_codename)
-					else:
-						row_drivers.append(driver_data)
+			for driver_codename in row.driver_codenames:
+				driver_data: Driver | None = drivers_data.get(driver_codename.lower())
+				if driver_data is None or driver_data.empty_fields():
+					not_found['drivers'].append(driver_codename)
+				else:
+					row_drivers.append(driver_data)
 
 			row_manufacturer: Manufacturer | None = None
 
-			if manufacturers is not None and len(manufacturers) > 0:
-				for m in manufacturers:
-					if re.search(m.codename, row_vehicle, re.IGNORECASE):
-						row_manufacturer = m
-						break
+			if manufacturer_matcher is not None:
+				row_manufacturer = manufacturer_matcher.find(row.vehicle)
 
 			eligible_cls = find_classifications(
-				category=row_category,
+				category=row.category,
 				team_id=team_eligibility.team.db_id,
 				driver_ids=[x.db_id for x in row_drivers],
 				manufacturer_id=row_manufacturer.db_id if row_manufacturer is not None else None,
-				classifications=classifications
+				eligibility=eligibility
 			)
 
 			row_data = ResultRow(
 				drivers=row_drivers,
-				status=row_status,
+				status=row.status,
 				team=Team(codename=team_codename, db_id=team_eligibility.team.db_id),
 				manufacturer=row_manufacturer if eligible_cls.manufacturer_cl is not None else None,
 				eligible_classifications=eligible_cls
@@ -358,57 +384,6 @@ def read_results_csv(
 		return list() if entity_not_found else rows
 
 
-# Wyszukanie stylu kolorowania dla wyniku
-def find_result_style(
-	status: str, position: int, scoring_styles: list[StyledPosition],
-	nonscoring_styles: list[StyledStatus], session: str
-) -> tuple[int | None, float] | None:
-	match status:
-		case 'Classified':
-			style_id: int = next(
-				(v.style.db_id for v in scoring_styles if v.position == position),
-				None
-			)
-			points: float = next(
-				(v.points for v in scoring_styles if v.position == position),
-				None
-			)
-
-			if style_id is None:
-				# Niepunktowane pozycje w kwalifikacjach pozostaną bez stylu
-				if session.upper() != 'QUALIFYING':
-					style_id = next(
-						(v.style.db_id for v in nonscoring_styles if v.status == "Classified, nonscoring")
-					)
-				points = 0.0
-
-			return style_id, points
-		case 'Not classified':
-			style_id: int = next(
-				(v.style.db_id for v in nonscoring_styles if v.status == "Not classified")
-			)
-
-			return style_id, 0.0
-		case 'Retired':
-			style_id = next(
-				(v.style.db_id for v in nonscoring_styles if v.status == "Retired")
-			)
-
-			return style_id, 0.0
-		case 'Disqualified':
-			style_id: int | None = None
-
-			# Zdyskwalifikowani z kwalifikacji nie zostaną wzięci pod uwagę
-			if session.upper() != 'QUALIFYING':
-				style_id: int = next(
-					(v.style.db_id for v in nonscoring_styles if v.status == "Disqualified")
-				)
-
-			return style_id, 0.0
-		case _:
-			return None
-
-
 # Odczytanie przyznanej puli punktowej w wyścigu
 def read_full_points() -> AwardedPoints:
 	while True:
@@ -436,123 +411,18 @@ def calculate_classifications_positions(
 	session: str, oem_classifications_scoring: list[ClassificationScoring],
 	awarded_points: AwardedPoints
 ) -> list[ResultRow]:
-	from common.db_queries.manufacturer_table import get_manufacturers
-
-	positions: dict[str, int] = dict()
-	nonscoring_statuses: list[str] = [x.status for x in nonscoring_styles]
-
-	manufacturers_scoring_cars: list[ManufacturerScoringCars] = list()
-
-	if len(oem_classifications_scoring) > 0:
-		manufacturers: list[Manufacturer] | None = get_manufacturers()
-
-		if manufacturers is None:
-			return list()
-
-		if len(manufacturers) == 0:
-			print('\nLista producentów jest pusta.')
-			return list()
-
-		for oem in manufacturers:  # type: Manufacturer
-			manufacturers_scoring_cars.append(ManufacturerScoringCars(
-				manufacturer=oem,
-				classifications=oem_classifications_scoring
-			))
-
-	for cl in classifications:
-		positions.update({f'{cl.name}': 1})
+	scoring = SessionScoring(
+		classifications=classifications,
+		scoring_styles=scoring_styles,
+		nonscoring_styles=nonscoring_styles,
+		session=session,
+		oem_classifications_scoring=oem_classifications_scoring,
+		awarded_points=awarded_points
+	)
 
 	for row in rows:  # type: ResultRow
-		if row.eligible_classifications.team_cl is not None:
-			team_position = positions.get(row.eligible_classifications.team_cl.name)
-
-			# Dobieranie stylów i punktów
-			found: tuple[int | None, float] | None = find_result_style(
-				status=row.status,
-				position=team_position,
-				scoring_styles=scoring_styles,
-				nonscoring_styles=nonscoring_styles,
-				session=session
-			)
+		scoring.score_row(row)
 
-			if found is not None:
-				if found[0] is not None:
-					row.eligible_classifications.team_style_id = found[0]
-					row.eligible_classifications.team_points = found[1] * awarded_points.multiplier
-
-					if row.status not in nonscoring_statuses:
-						row.eligible_classifications.team_position = team_position
-						positions[f'{row.eligible_classifications.team_cl.name}'] += 1
-					else:
-						row.eligible_classifications.team_position = row.status
-		if row.eligible_classifications.manufacturer_cl is not None:
-			oem_position = positions.get(row.eligible_classifications.manufacturer_cl.name)
-
-			oem_scoring: ManufacturerScoringCars = next(
-				(x for x in manufacturers_scoring_cars if x.manufacturer.db_id == row.manufacturer.db_id)
-			)
-
-			scoring_found: ClassificationScoring = next(
-				(x for x in oem_scoring.classifications if x.name == row.eligible_classifications.manufacturer_cl.name)
-			)
-
-			# Jeśli auto(-a) producenta może(-gą) jeszcze punktować
-			if scoring_found.scoring_entities > 0:
-				manufacturers_scoring_cars.pop(
-					manufacturers_scoring_cars.index(oem_scoring)
-				)
-
-				oem_scoring.classifications.pop(
-					oem_scoring.classifications.index(scoring_found)
-				)
-
-				scoring_found.scoring_entities -= 1
-
-				oem_scoring.classifications.append(scoring_found)
-
-				manufacturers_scoring_cars.append(oem_scoring)
-
-				# Dobieranie stylów i punktów
-				found: tuple[int | None, float] | None = find_result_style(
-					status=row.status,
-					position=oem_position,
-					scoring_styles=scoring_styles,
-					nonscoring_styles=nonscoring_styles,
-					session=session
-				)
-
-				if found is not None:
-					if found[0] is not None:
-						row.eligible_classifications.manufacturer_style_id = found[0]
-						row.eligible_classifications.manufacturer_points = found[1] * awarded_points.multiplier
-
-						if row.status not in nonscoring_statuses:
-							row.eligible_classifications.manufacturer_position = oem_position
-						else:
-							row.eligible_classifications.manufacturer_position = row.status
-			positions[f'{row.eligible_classifications.manufacturer_cl.name}'] += 1
-		if row.eligible_classifications.driver_cl is not None:
-			driver_position = positions.get(row.eligible_classifications.driver_cl.name)
-
-			# Dobieranie stylów i punktów
-			found: tuple[int | None, float] | None = find_result_style(
-				status=row.status,
-				position=driver_position,
-				scoring_styles=scoring_styles,
-				nonscoring_styles=nonscoring_styles,
-				session=session
-			)
-
-			if found is not None:
-				if found[0] is not None:
-					row.eligible_classifications.driver_style_id = found[0]
-					row.eligible_classifications.driver_points = found[1] * awarded_points.multiplier
-
-					if row.status not in nonscoring_statuses:
-						row.eligible_classifications.driver_position = driver_position
-						positions[f'{row.eligible_classifications.driver_cl.name}'] += 1
-					else:
-						row.eligible_classifications.driver_position = row.status
 	return rows
 
 
@@ -582,24 +452,8 @@ def read_round_number(classifications: list[Classification], session_id: int) ->
 					continue
 
 				if ans == 1:
-					from common.db_queries.classification_tables import remove_session_scores
-					print('\nUsuwanie wyników...')
-
-					results_removed: bool = remove_session_scores(
-						classifications=classifications,
-						round_number=num,
-						session_id=session_id
-					)
-
-					if results_removed is None:
-						return None
-
-					if results_removed:
-						print('\nWyniki tej sesji zostały usunięte z bazy danych.')
-						return num
-					else:
-						print('\nUsuwanie wyników z bazy danych nie powiodło się.')
-						return None
+					print('\nWyniki tej sesji zostaną zastąpione wynikami z pliku.')
+					return num
 				elif ans == 2:
 					print('\nSkrypt zakończy działanie.')
 					return None
@@ -609,11 +463,9 @@ def read_round_number(classifications: list[Classification], session_id: int) ->
 			return num
 
 
-# Dodanie wyników do bazy
-def add_results_to_db(rows: list[ResultRow], round_number: int, session: DbSession) -> None:
-	from common.db_queries.classification_tables import add_score
-
-	print('')
+# Zamiana wierszy z wynikami na punkty zapisywane w bazie
+def get_scores(rows: list[ResultRow], round_number: int, session: DbSession) -> list[Score]:
+	scores: list[Score] = list()
 
 	for row in rows:
 		# Zmienna potrzebna do niedodawania wyników kwalifikacji w klasyfikacjach zespołowych
@@ -624,35 +476,26 @@ def add_results_to_db(rows: list[ResultRow], round_number: int, session: DbSessi
 			row.eligible_classifications.driver_cl is not None
 			and row.eligible_classifications.driver_style_id is not None
 		):
-			print('{season} {classification_name}'.format(
-				season=row.eligible_classifications.driver_cl.season,
-				classification_name=row.eligible_classifications.driver_cl.name
-			))
-
 			for driver in row.drivers:
-				print(f'{driver.codename}:', end=' ')
-				add_score(
-					classification_id=row.eligible_classifications.driver_cl.db_id,
-					round_number=round_number,
-					session_id=session.db_id,
-					entity_id=driver.db_id,
-					place=row.eligible_classifications.driver_position,
-					points=row.eligible_classifications.driver_points,
-					style_id=row.eligible_classifications.driver_style_id
+				scores.append(
+					Score(
+						classification_id=row.eligible_classifications.driver_cl.db_id,
+						round_number=round_number,
+						session_id=session.db_id,
+						entity_id=driver.db_id,
+						place=row.eligible_classifications.driver_position,
+						points=row.eligible_classifications.driver_points,
+						style_id=row.eligible_classifications.driver_style_id
+					)
 				)
 				drivers_result_added = True
 		if (
 			row.eligible_classifications.manufacturer_cl is not None
 			and row.eligible_classifications.manufacturer_style_id is not None
+			and row.manufacturer is not None
 		):
-			print('{season} {classification_name}'.format(
-				season=row.eligible_classifications.manufacturer_cl.season,
-				classification_name=row.eligible_classifications.manufacturer_cl.name
-			))
-
-			if row.manufacturer is not None:
-				print(f'{row.manufacturer.codename}:', end=' ')
-				add_score(
+			scores.append(
+				Score(
 					classification_id=row.eligible_classifications.manufacturer_cl.db_id,
 					round_number=round_number,
 					session_id=session.db_id,
@@ -661,27 +504,569 @@ def add_results_to_db(rows: list[ResultRow], round_number: int, session: DbSessi
 					points=row.eligible_classifications.manufacturer_points,
 					style_id=row.eligible_classifications.manufacturer_style_id
 				)
+			)
 		if (
 			row.eligible_classifications.team_cl is not None
 			and row.eligible_classifications.team_style_id is not None
 			and drivers_result_added is True
 		):
-			print('{season} {classification_name}'.format(
-				season=row.eligible_classifications.team_cl.season,
-				classification_name=row.eligible_classifications.team_cl.name
-			))
-
-			print(f'{row.team.codename}:', end=' ')
-			add_score(
-				classification_id=row.eligible_classifications.team_cl.db_id,
-				round_number=round_number,
-				session_id=session.db_id,
-				entity_id=row.team.db_id,
-				place=row.eligible_classifications.team_position,
-				points=row.eligible_classifications.team_points,
-				style_id=row.eligible_classifications.team_style_id
+			scores.append(
+				Score(
+					classification_id=row.eligible_classifications.team_cl.db_id,
+					round_number=round_number,
+					session_id=session.db_id,
+					entity_id=row.team.db_id,
+					place=row.eligible_classifications.team_position,
+					points=row.eligible_classifications.team_points,
+					style_id=row.eligible_classifications.team_style_id
+				)
 			)
-		print('-' * 50)
+
+	return scores
+
+
+# Dodanie wyników do bazy, zwraca liczbę dodanych wyników lub None, jeśli nie zostały zapisane
+def add_results_to_db(
+	rows: list[ResultRow], classifications: list[Classification], round_number: int, session: DbSession
+) -> int | None:
+	from common.db_queries.classification_tables import replace_session_scores
+
+	summary: dict[int, int] | None = replace_session_scores(
+		classifications=classifications,
+		round_number=round_number,
+		session_id=session.db_id,
+		scores=get_scores(rows, round_number, session)
+	)
+
+	if summary is None:
+		print('\nWystąpił błąd, do bazy nie dodano żadnych wyników.')
+		return None
+
+	# Klasyfikacje, w których dodano wyniki
+	scored_classifications: dict[int, Classification] = dict()
+
+	for row in rows:
+		for cl in (
+			row.eligible_classifications.driver_cl,
+			row.eligible_classifications.manufacturer_cl,
+			row.eligible_classifications.team_cl
+		):
+			if cl is not None:
+				scored_classifications[cl.db_id] = cl
+
+	print('')
+
+	for cl_id, added in summary.items():
+		classification: Classification = scored_classifications[cl_id]
+		print(f'{classification.season} {classification.name} - dodane wyniki: {added}')
+
+	return sum(summary.values())
+
+
+# Odczytanie argumentów wywołania, wyniki są dodawane bez pytań, jeśli podano plik z wynikami lub manifest
+def parse_arguments() -> argparse.Namespace:
+	parser = argparse.ArgumentParser(
+		description='Dodaje do bazy wyniki punktowanych sesji. Bez argumentów pyta o wszystkie dane.'
+	)
+	parser.add_argument('--championship', type=int, help='id serii w bazie danych')
+	parser.add_argument('--season', help='sezon klasyfikacji, np. 2024')
+	parser.add_argument(
+		'--manifest',
+		help='plik .csv z listą plików z wynikami, jego nagłówki to "round","session","scale","points","csv"'
+	)
+	parser.add_argument('--round', type=int, dest='round_number', help='numer rundy, której wyniki są w pliku')
+	parser.add_argument('--session', help='nazwa sesji, np. RACE')
+	parser.add_argument('--scale', type=float, help='skala punktowa, wymagana, jeśli seria ma ich więcej niż jedną')
+	parser.add_argument(
+		'--points', choices=awarded_points_values.keys(), default='full', help='przyznana pula punktów w wyścigu'
+	)
+	parser.add_argument('--csv', help='plik .csv z wynikami pobrany ze strony Alkamelsystems')
+	parser.add_argument('--replace', action='store_true', help='zastąpienie wyników, które już są w bazie')
+	parser.add_argument(
+		'--dry-run', action='store_true',
+		help='wyświetlenie wyników i zmian w klasyfikacjach bez zapisywania czegokolwiek w bazie, wyniki już w niej obecne'
+		' są pokazywane jako zastąpione'
+	)
+	parser.add_argument(
+		'--jobs', type=int, default=1, help='liczba procesów równolegle odczytujących pliki z wynikami, domyślnie 1'
+	)
+
+	arguments: argparse.Namespace = parser.parse_args()
+
+	if arguments.manifest is not None or arguments.csv is not None:
+		if arguments.championship is None or arguments.season is None:
+			parser.error('dodanie wyników bez pytań wymaga podania --championship i --season')
+
+		if arguments.manifest is not None and arguments.csv is not None:
+			parser.error('nie można jednocześnie podać --manifest i --csv')
+
+		if arguments.csv is not None and (arguments.round_number is None or arguments.session is None):
+			parser.error('podanie --csv wymaga podania --round i --session')
+	elif arguments.dry_run or arguments.replace or arguments.jobs != 1:
+		# W trybie interaktywnym wyniki są zawsze zapisywane, a przed ich zastąpieniem skrypt pyta o zgodę
+		parser.error('--dry-run, --replace i --jobs można podać tylko razem z --csv lub --manifest')
+
+	return arguments
+
+
+# Odczytanie manifestu z listą plików z wynikami, ścieżki względne są liczone od katalogu manifestu
+def read_manifest(path: str) -> list[PointsImport] | None:
+	imports: list[PointsImport] = list()
+	manifest_dir: str = os.path.dirname(os.path.abspath(path))
+
+	try:
+		with open(path, mode='r', encoding='utf-8-sig') as csv_file:
+			csv_reader = csv.DictReader(csv_file)
+
+			if csv_reader.fieldnames is None or not {'round', 'session', 'csv'}.issubset(csv_reader.fieldnames):
+				print('\nManifest musi mieć nagłówki "round", "session" i "csv".')
+				return None
+
+			# W pierwszej linii manifestu są nagłówki
+			for line, row in enumerate(csv_reader, start=2):  # type: int, dict
+				try:
+					imports.append(
+						PointsImport(
+							round_number=int(row['round']),
+							session=row['session'].strip().upper(),
+							path=os.path.join(manifest_dir, row['csv'].strip()),
+							scale=float(row['scale']) if row.get('scale') else None,
+							awarded_points=awarded_points_values[(row.get('points') or 'full').strip().lower()]
+						)
+					)
+				except (AttributeError, KeyError, ValueError):
+					print(f'\nNieprawidłowe dane w linii {line} manifestu.')
+					return None
+	except OSError as e:
+		print(f'\nWystąpił błąd podczas odczytu manifestu - {e.__str__()}')
+		return None
+
+	return imports
+
+
+# Wypisanie wyników, które zostałyby zapisane, zgłoszenia są pokazywane za pomocą nazw kodowych
+def print_scores(rows: list[ResultRow], round_number: int, session: DbSession) -> None:
+	# Nazwy kodowe zgłoszeń według typu klasyfikacji i id zgłoszenia
+	codenames: dict[str, dict[int, str]] = {'DRIVERS': dict(), 'TEAMS': dict(), 'MANUFACTURERS': dict()}
+	classifications: dict[int, Classification] = dict()
+
+	for row in rows:  # type: ResultRow
+		for driver in row.drivers:
+			codenames['DRIVERS'][driver.db_id] = driver.codename
+
+		codenames['TEAMS'][row.team.db_id] = row.team.codename
+
+		if row.manufacturer is not None:
+			codenames['MANUFACTURERS'][row.manufacturer.db_id] = row.manufacturer.codename
+
+		for cl in (
+			row.eligible_classifications.driver_cl,
+			row.eligible_classifications.manufacturer_cl,
+			row.eligible_classifications.team_cl
+		):
+			if cl is not None:
+				classifications[cl.db_id] = cl
+
+	# Wyniki pogrupowane według id klasyfikacji, w kolejności z pliku
+	classifications_scores: dict[int, list[Score]] = dict()
+
+	for score in get_scores(rows, round_number, session):  # type: Score
+		classifications_scores.setdefault(score.classification_id, list()).append(score)
+
+	for cl_id, scores in classifications_scores.items():
+		classification: Classification = classifications[cl_id]
+		entities_codenames: dict[int, str] = codenames.get(classification.cl_type, dict())
+
+		print(f'\n{classification.season} {classification.name}:')
+
+		for score in scores:  # type: Score
+			print(f'{score.place} - {entities_codenames.get(score.entity_id, score.entity_id)} - {score.points:g} pkt')
+
+
+# Pobranie klasyfikacji w postaci takiej jak w tabelach, zgłoszenia są pogrupowane według id klasyfikacji
+def get_standings(classifications: list[Classification], wiki_id: int) -> dict[int, list[EntityResults]] | None:
+	from common.db_queries.classification_tables import get_classification_results
+
+	standings: dict[int, list[EntityResults]] = dict()
+
+	for cl in classifications:
+		results: list[EntityResults] | None = get_classification_results(cl, wiki_id)
+
+		if results is None:
+			return None
+
+		standings[cl.db_id] = results
+
+	return standings
+
+
+# Wypisanie zmian pozycji i punktów zgłoszeń pomiędzy dwoma stanami klasyfikacji
+def print_standings_changes(
+	classifications: list[Classification], before: dict[int, list[EntityResults]],
+	after: dict[int, list[EntityResults]]
+) -> None:
+	changed_classifications: int = 0
+
+	for cl in classifications:
+		previous: dict[int, EntityResults] = {e.db_id: e for e in before.get(cl.db_id, list())}
+		changes: list[str] = list()
+
+		for entity in after.get(cl.db_id, list()):  # type: EntityResults
+			old: EntityResults | None = previous.get(entity.db_id)
+
+			if old is None:
+				changes.append(f'{entity.position} (nowy) - {entity.link} - {entity.points:g} pkt')
+			elif old.position != entity.position or old.points != entity.points:
+				changes.append(
+					f'{entity.position} ({old.position}) - {entity.link} - '
+					f'{entity.points:g} pkt ({entity.points - old.points:+g})'
+				)
+
+		if len(changes) > 0:
+			changed_classifications += 1
+			print(f'\n{cl.season} {cl.name}, pozycja (poprzednia pozycja) - zgłoszenie - punkty (zmiana):')
+			print(*changes, sep='\n')
+
+	if changed_classifications == 0:
+		print('\nKlasyfikacje nie zmieniłyby się.')
+
+
+# Ustawienie danych sezonu używanych przy odczycie plików z wynikami w trybie wsadowym
+def set_season_data(season: SeasonData) -> None:
+	global batch_season
+
+	batch_season = season
+
+
+# Przygotowanie procesu z puli odczytującej pliki z wynikami, korzysta on z własnej kopii bazy w pamięci,
+# a użycie zgłoszeń przekazuje procesowi zapisującemu wyniki zamiast zapisywać je samemu
+def start_reading_process(season: SeasonData) -> None:
+	from common.db_connect import use_snapshot
+
+	use_snapshot()
+	set_season_data(season)
+
+
+# Odczytanie pliku z wynikami i wyliczenie pozycji w klasyfikacjach.
+# Zwraca wiersze z wynikami, wypisane komunikaty, id użytych zgłoszeń i czas odczytu.
+def read_results_file(
+	job: tuple[PointsImport, DbSession, list[StyledPosition]]
+) -> tuple[list[ResultRow], str, dict[str, set[int]], float]:
+	from common.db_queries.touch_buffer import take_touched
+
+	entry, session, styled_positions = job
+	start: float = time.perf_counter()
+
+	# Komunikaty wypisuje proces zapisujący wyniki, dzięki czemu komunikaty o różnych plikach się nie mieszają
+	with contextlib.redirect_stdout(io.StringIO()) as output:
+		rows: list[ResultRow] = read_results_csv(
+			path=entry.path,
+			classifications=batch_season.classifications,
+			manufacturer_classifications_num=len(batch_season.oem_scoring_cars),
+			wiki_id=batch_season.wiki_id,
+			eligibility=batch_season.eligibility,
+			manufacturer_matcher=batch_season.manufacturer_matcher
+		)
+
+		if len(rows) > 0:
+			rows = calculate_classifications_positions(
+				rows=rows,
+				classifications=batch_season.classifications,
+				scoring_styles=styled_positions,
+				nonscoring_styles=batch_season.nonscoring_statuses,
+				session=session.name,
+				oem_classifications_scoring=batch_season.oem_scoring_cars,
+				awarded_points=entry.awarded_points if session.name == 'RACE' else AwardedPoints.FULL
+			)
+
+	return rows, output.getvalue(), take_touched(), time.perf_counter() - start
+
+
+# Dodanie wyników wielu sesji bez zadawania pytań.
+# Klasyfikacje sezonu, style i dane do wyszukiwania są pobierane z bazy raz dla wszystkich plików.
+# Pliki mogą być odczytywane równolegle, ale ich wyniki zapisuje jeden proces w kolejności rund.
+def run_batch(arguments: argparse.Namespace) -> None:
+	from common.db_queries.classification_tables import check_round_session, get_champ_classifications_by_season
+	from common.db_queries.wikipedia_table import get_wiki_id
+	from common.db_queries.points_tables import (
+		get_points_scales,
+		get_scoring_sessions,
+		get_styled_nonscoring_statuses,
+		get_styled_points_system
+	)
+	from common.db_queries.manufacturer_table import refresh_manufacturers_timestamps
+	from common.db_queries.reference_data import refresh_reference_tables
+	from common.db_connect import use_snapshot
+	from common.db_queries.touch_buffer import set_touching, touch
+
+	cannot_continue_error: str = '\nSkrypt nie może kontynuować działania.'
+
+	# Przy próbnym uruchomieniu wyniki trafiają tylko do kopii bazy w pamięci, z której wyliczane są nowe klasyfikacje
+	if arguments.dry_run:
+		set_touching(False)
+
+		if not use_snapshot():
+			print('\nNie udało się utworzyć kopii bazy danych.' + cannot_continue_error)
+			return
+
+		print('\nPróbne uruchomienie, nic nie zostanie zapisane w bazie.')
+
+	# Małe, rzadko zmieniane tabele są odczytywane ponownie, jeśli baza zmieniła się od ich zapamiętania
+	refresh_reference_tables()
+
+	# Pobranie id polskiej wersji Wikipedii z bazy danych
+	plwiki_id: int | None = get_wiki_id('plwiki')
+
+	if plwiki_id is None:
+		print(cannot_continue_error)
+		return
+
+	if plwiki_id == -1:
+		print('\nNie znaleziono polskiej wersji Wikipedii w bazie danych.' + cannot_continue_error)
+		return
+
+	# Pobranie klasyfikacji punktowych z bazy danych
+	classifications: list[Classification] | None = get_champ_classifications_by_season(
+		arguments.championship,
+		arguments.season
+	)
+
+	if classifications is None or len(classifications) == 0:
+		print('\nBrak zdefiniowanych klasyfikacji w bazie dla podanej serii i sezonu.' + cannot_continue_error)
+		return
+
+	# Pobranie danych o punktujących autach w klasyfikacjach producentów (o ile takowe istnieją)
+	oem_scoring_cars: list[ClassificationScoring] | None = get_oem_scoring_cars(classifications)
+
+	if oem_scoring_cars is None:
+		print(cannot_continue_error)
+		return
+
+	# Pobranie skali punktowych z bazy danych
+	points_scales: list[float] | None = get_points_scales(arguments.championship)
+
+	if points_scales is None:
+		print(cannot_continue_error)
+		return
+
+	if len(points_scales) == 0:
+		print('\nNie znaleziono skali punktowych tych mistrzostw.')
+		return
+
+	# Odczytanie listy plików do dodania
+	if arguments.manifest is not None:
+		imports: list[PointsImport] | None = read_manifest(arguments.manifest)
+
+		if imports is None:
+			print(cannot_continue_error)
+			return
+	else:
+		imports: list[PointsImport] | None = [
+			PointsImport(
+				round_number=arguments.round_number,
+				session=arguments.session.upper(),
+				path=arguments.csv,
+				scale=arguments.scale,
+				awarded_points=awarded_points_values[arguments.points]
+			)
+		]
+
+	# Pobranie niepunktowanych statusów, takich jak niesklasyfikowany itp., razem ze stylami kolorowania tabeli
+	nonscoring_statuses: list[StyledStatus] | None = get_styled_nonscoring_statuses()
+
+	if nonscoring_statuses is None:
+		print(cannot_continue_error)
+		return
+
+	# Pobranie danych do wyszukiwania używanych przez wszystkie pliki
+	eligibility: EligibilityIndex | None = get_eligibility_index(classifications)
+	manufacturer_matcher: ManufacturerMatcher | None = None
+
+	if len(oem_scoring_cars) > 0:
+		manufacturer_matcher = get_manufacturer_matcher()
+
+	if eligibility is None or (len(oem_scoring_cars) > 0 and manufacturer_matcher is None):
+		print(cannot_continue_error)
+		return
+
+	# Sesje i systemy punktowe są pobierane raz dla każdej skali punktowej
+	scales_sessions: dict[float, list[DbSession]] = dict()
+	points_systems: dict[tuple[float, int], list[StyledPosition] | None] = dict()
+
+	# Pliki, które można dodać, razem z ich sesjami i systemami punktowymi
+	jobs: list[tuple[PointsImport, DbSession, list[StyledPosition]]] = list()
+
+	for entry in imports:  # type: PointsImport
+		header: str = f'\nRunda {entry.round_number}, {entry.session}: {entry.path}'
+
+		scale: float | None = entry.scale
+
+		if scale is None and len(points_scales) == 1:
+			scale = points_scales[0]
+
+		if scale not in points_scales:
+			print(header)
+			print(f'Skala punktowa musi mieć jedną z wartości: {", ".join(str(x) for x in points_scales)}.')
+			print('Plik zostaje pominięty.')
+			continue
+
+		if scale not in scales_sessions:
+			sessions: list[DbSession] | None = get_scoring_sessions(arguments.championship, scale)
+
+			if sessions is None:
+				print(cannot_continue_error)
+				return
+
+			scales_sessions[scale] = sessions
+
+		session: DbSession | None = next((x for x in scales_sessions[scale] if x.name == entry.session), None)
+
+		if session is None:
+			print(header)
+			print(f'W sesji {entry.session} nie są przyznawane punkty. Plik zostaje pominięty.')
+			continue
+
+		if not os.path.isfile(entry.path) or not entry.path.lower().endswith('.csv'):
+			print(header)
+			print('Pod podaną ścieżką nie ma pliku .csv. Plik zostaje pominięty.')
+			continue
+
+		if not (arguments.replace or arguments.dry_run) and check_round_session(
+			classification_id=classifications[0].db_id,
+			round_number=entry.round_number,
+			session_id=session.db_id
+		):
+			print(header)
+			print('Ta runda ma już wyniki tej sesji w bazie, aby je zastąpić użyj --replace.')
+			print('Plik zostaje pominięty.')
+			continue
+
+		if len(nonscoring_statuses) == 0 and session.name == 'RACE':
+			print(header)
+			print('Nie znaleziono styli wyników wyścigu. Plik zostaje pominięty.')
+			continue
+
+		if (scale, session.db_id) not in points_systems:
+			points_systems[(scale, session.db_id)] = get_styled_points_system(
+				championship_id=arguments.championship,
+				scale=scale,
+				session_id=session.db_id
+			)
+
+		styled_positions: list[StyledPosition] | None = points_systems[(scale, session.db_id)]
+
+		if styled_positions is None or len(styled_positions) == 0:
+			print(header)
+			print('Nie znaleziono styli wyników. Plik zostaje pominięty.')
+			continue
+
+		jobs.append((entry, session, styled_positions))
+
+	# Pliki są zapisywane w kolejności rund, pliki tej samej rundy w kolejności z manifestu
+	jobs.sort(key=lambda job: job[0].round_number)
+
+	season = SeasonData(
+		wiki_id=plwiki_id,
+		classifications=classifications,
+		oem_scoring_cars=oem_scoring_cars,
+		nonscoring_statuses=nonscoring_statuses,
+		eligibility=eligibility,
+		manufacturer_matcher=manufacturer_matcher
+	)
+
+	# Pliki są odczytywane przez pulę procesów, a ten proces zapisuje ich wyniki po kolei, gdy tylko są gotowe
+	executor: ProcessPoolExecutor | None = None
+
+	if arguments.jobs > 1 and len(jobs) > 1:
+		executor = ProcessPoolExecutor(
+			max_workers=min(arguments.jobs, len(jobs)),
+			mp_context=multiprocessing.get_context('spawn'),
+			initializer=start_reading_process,
+			initargs=(season,)
+		)
+		processed = executor.map(read_results_file, jobs)
+	else:
+		set_season_data(season)
+		processed = map(read_results_file, jobs)
+
+	standings_before: dict[int, list[EntityResults]] | None = None
+
+	if arguments.dry_run:
+		standings_before = get_standings(classifications, plwiki_id)
+
+		if standings_before is None:
+			print(cannot_continue_error)
+			return
+
+	manufacturers_ids: set[int] = set()
+	added_files: int = 0
+	read_rows: int = 0
+	reading_time: float = 0.0
+	saved_scores: int = 0
+	saving_time: float = 0.0
+	start: float = time.perf_counter()
+
+	try:
+		for job, (rows, output, touched, file_reading_time) in zip(jobs, processed):
+			entry, session, _ = job
+
+			print(f'\nRunda {entry.round_number}, {entry.session}: {entry.path}')
+			print(output, end='')
+
+			read_rows += len(rows)
+			reading_time += file_reading_time
+
+			if len(rows) == 0:
+				print('Plik zostaje pominięty.')
+				continue
+
+			# Użycie zgłoszeń znalezionych podczas odczytu pliku jest zapisywane przez ten proces
+			for table, ids in touched.items():
+				touch(table, ids)
+
+			saving_start: float = time.perf_counter()
+
+			added: int | None = add_results_to_db(rows, classifications, entry.round_number, session)
+
+			saving_time += time.perf_counter() - saving_start
+
+			if added is None:
+				continue
+
+			added_files += 1
+			saved_scores += added
+
+			if arguments.dry_run:
+				print_scores(rows, entry.round_number, session)
+
+			for row in rows:  # type: ResultRow
+				if row.manufacturer is not None:
+					manufacturers_ids.add(row.manufacturer.db_id)
+	finally:
+		if executor is not None:
+			executor.shutdown(cancel_futures=True)
+
+	# Odświeżenie stempli czasowych producentów
+	if not arguments.dry_run:
+		refresh_manufacturers_timestamps(list(manufacturers_ids))
+
+	total_time: float = time.perf_counter() - start
+
+	print(f'\nDodano wyniki z {added_files} z {len(imports)} plików w {total_time:.2f} s.')
+	print(
+		f'Odczyt plików: {read_rows} wierszy w {reading_time:.2f} s czasu procesów'
+		f' ({read_rows / reading_time if reading_time > 0 else 0:.0f} wierszy/s)'
+	)
+	print(
+		f'Zapis wyników: {saved_scores} wyników w {saving_time:.2f} s'
+		f' ({saved_scores / saving_time if saving_time > 0 else 0:.0f} wyników/s)'
+	)
+
+	if arguments.dry_run:
+		standings_after: dict[int, list[EntityResults]] | None = get_standings(classifications, plwiki_id)
+
+		if standings_after is not None:
+			print_standings_changes(classifications, standings_before, standings_after)
 
 
 # Główna funkcja skryptu
@@ -695,9 +1080,13 @@ def main() -> None:
 		get_styled_points_system
 	)
 	from common.db_queries.manufacturer_table import refresh_manufacturers_timestamps
+	from common.db_queries.reference_data import refresh_reference_tables
 
 	cannot_continue_error: str = '\nSkrypt nie może kontynuować działania.'
 
+	# Małe, rzadko zmieniane tabele są odczytywane ponownie, jeśli baza zmieniła się od ich zapamiętania
+	refresh_reference_tables()
+
 	# Pobranie id polskiej wersji Wikipedii z bazy danych
 	plwiki_id: int | None = get_wiki_id('plwiki')
 
@@ -832,7 +1221,7 @@ def main() -> None:
 		return
 
 	# Dodanie wyników do bazy danych
-	add_results_to_db(rows, round_num, session)
+	add_results_to_db(rows, classifications, round_num, session)
 
 	# Odświeżenie stempli czasowych producentów
 	manufacturers_ids: list[int] = list()
@@ -845,4 +1234,9 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-	main()
+	script_arguments: argparse.Namespace = parse_arguments()
+
+	if script_arguments.manifest is None and script_arguments.csv is None:
+		main()
+	else:
+		run_batch(script_arguments)
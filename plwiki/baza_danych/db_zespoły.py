@@ -14,6 +14,9 @@ if True:  # noqa: E402
 		sys.path.append(project_path)
 
 	from common.models.teams import Team
+	from common.models.entity_import import ImportReport
+	from common.models.alkamel import AlkamelRow
+	from common.io.alkamel_csv import AlkamelCsvReader, find_results_files, read_csv_headers
 	from common.db_queries.wikipedia_table import get_wiki_id
 
 
@@ -42,22 +45,13 @@ def write_teams_csv(teams: list[Team]) -> None:
 	print(f'\nZespoły zapisane w pliku {filename}: {len(teams)}')
 
 
-# Odczytanie danych o zespołach z pliku zawierającego wyniki
-def read_results_csv(file: str, wiki_id: int, championship_id: int) -> list[Team]:
+# Odczytanie danych o zespołach z pliku zawierającego wyniki do słownika wspólnego dla wszystkich plików,
+# zwracana jest liczba przetworzonych linii. Kluczem zespołu jest jego nazwa, flaga i numer auta.
+def read_results_teams(file: str, teams: dict[tuple[str, str, str], Team]) -> int:
 	from common.db_queries.country_code_table import get_country_iso_alpha3
-	from common.db_queries.team_tables import check_team_exists
-
-	teams: list[Team] = list()
-
-	with open(file, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=';')
-		line_count = 0
-
-		print('')
-
-		for row in csv_reader:  # type: dict
-			line_count += 1
 
+	with AlkamelCsvReader(file) as csv_reader:
+		for row in csv_reader:  # type: AlkamelRow
 			country_id: int = row.get('ECM Country Id')
 			team_country: str | None = None
 
@@ -67,43 +61,70 @@ def read_results_csv(file: str, wiki_id: int, championship_id: int) -> list[Team
 			if team_country is None:
 				team_country = '?'
 
-			team_codename = f'#{row.get("NUMBER")} {row.get("TEAM")}'
-			team_car_no = row.get('NUMBER')
-			team_short_link = f'[[{row.get("TEAM")}]]'
-
-			if team_country != '?':
-				check_team_db: bool = check_team_exists(
-					codename=team_codename,
-					championship_id=championship_id,
-					flag=team_country,
-					car_number=team_car_no,
-					wikipedia_id=wiki_id
-				)
+			team_codename = row.team_codename
+			team_car_no = row.number
+			team_short_link = f'[[{row.team}]]'
+
+			key: tuple[str, str, str] = (team_codename, team_country, team_car_no)
 
-				if check_team_db:
-					print(f'{team_codename} ({team_country}) jest już w bazie.')
-					continue
+			if key in teams:
+				continue
 
-			team = Team(
+			teams[key] = Team(
 				codename=team_codename,
 				nationality=team_country,
 				car_number=team_car_no,
 				short_link=team_short_link
 			)
 
-			teams.append(team)
+		return csv_reader.line_count
 
-		print(f'\nPrzetworzone linie: {line_count}\nZnalezione zespoły: {len(teams)}')
 
-	return teams
+# Odczytanie danych o zespołach z plików zawierających wyniki, zespół występujący wielokrotnie jest zapisywany raz
+def read_results_csv(files: list[str], wiki_id: int, championship_id: int) -> list[Team]:
+	from common.db_queries.team_tables import get_linked_team_keys
+
+	teams: dict[tuple[str, str, str], Team] = dict()
+	line_count = 0
+
+	print('')
+
+	for x, file in enumerate(files, start=1):  # type: int, str
+		found_before = len(teams)
+		file_lines = read_results_teams(file, teams)
+		line_count += file_lines
+
+		# Postęp jest wyświetlany tylko przy odczycie wielu plików
+		if len(files) > 1:
+			print(f'[{x}/{len(files)}] {file} - przetworzone linie: {file_lines}, zespoły wcześniej nieznalezione: {len(teams) - found_before}')
+
+	# Zespoły, które są już w bazie, są wyszukiwane jednym zapytaniem, zespoły bez znanej narodowości są zawsze zachowywane
+	linked: set[tuple[str, str, str]] | None = get_linked_team_keys(
+		[k for k in teams if k[1] != '?'],
+		championship_id,
+		wiki_id
+	)
+
+	if linked is None:
+		return list()
+
+	new_teams: list[Team] = list()
+
+	for key, team in teams.items():  # type: tuple[str, str, str], Team
+		if key in linked:
+			print(f'{team.codename} ({team.nationality}) jest już w bazie.')
+		else:
+			new_teams.append(team)
+
+	print(f'\nPrzetworzone linie: {line_count}\nZnalezione zespoły: {len(new_teams)}')
+
+	return new_teams
 
 
 # Sprawdzenie kolumn w podanym pliku z wynikami
 def verify_results_csv(file: str) -> bool:
-	with open(file, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=';')
-		csv_dict = dict(list(csv_reader)[0])
-		headers = list(csv_dict.keys())
+	with AlkamelCsvReader(file) as csv_reader:
+		headers: list[str] = csv_reader.headers
 
 		return (
 			'NUMBER' in headers and
@@ -129,8 +150,39 @@ def read_results_csv_path() -> str:
 			return text
 
 
-# Tworzenie pliku .csv z danymi zespołów
-def dump_teams_data_to_csv() -> None:
+# Odczytanie ścieżki do katalogu z plikami z wynikami lub wzorca pasującego do tych plików
+def read_results_files_path() -> list[str]:
+	while True:
+		text = input(
+			'\nPodaj ścieżkę do katalogu z plikami .CSV pobranymi ze strony Alkamelsystems '
+			'lub wzorzec pasujący do tych plików, np. "2024/*/*.csv":\n'
+		).strip()
+
+		files: list[str] = find_results_files(text)
+
+		if len(files) == 0:
+			print('\nNie znaleziono plików .csv, spróbuj ponownie.')
+			continue
+
+		results_files: list[str] = list()
+
+		for f in files:  # type: str
+			if verify_results_csv(f):
+				results_files.append(f)
+			else:
+				print(f'{f} nie posiada wymaganych kolumn i zostanie pominięty.')
+
+		if len(results_files) == 0:
+			print('\nŻaden ze znalezionych plików nie posiada wymaganych kolumn, spróbuj ponownie.')
+			continue
+
+		print(f'\nZnalezione pliki z wynikami: {len(results_files)}')
+
+		return results_files
+
+
+# Tworzenie pliku .csv z danymi zespołów odczytanymi z jednego lub wielu plików z wynikami
+def dump_teams_data_to_csv(many_files: bool = False) -> None:
 	plwiki_id: int | None = get_wiki_id('plwiki')
 
 	if plwiki_id is None:
@@ -140,11 +192,14 @@ def dump_teams_data_to_csv() -> None:
 		print('Nie znaleziono w bazie danych polskiej wersji Wikipedii.')
 		return
 
-	path: str = read_results_csv_path()
+	if many_files:
+		files: list[str] = read_results_files_path()
+	else:
+		files: list[str] = [read_results_csv_path()]
 
 	champ_id: int = read_championship()
 
-	teams: list[Team] = read_results_csv(path, plwiki_id, champ_id)
+	teams: list[Team] = read_results_csv(files, plwiki_id, champ_id)
 
 	if len(teams) == 0:
 		return
@@ -154,18 +209,15 @@ def dump_teams_data_to_csv() -> None:
 
 # Sprawdzenie kolumn w podanym pliku z danymi zespołów
 def verify_teams_csv(path: str) -> bool:
-	with open(path, mode='r', encoding='utf-8-sig') as csv_file:
-		csv_reader = csv.DictReader(csv_file, delimiter=',')
-		csv_dict = dict(list(csv_reader)[0])
-		headers = list(csv_dict.keys())
+	headers: list[str] = read_csv_headers(path)
 
-		return (
-			'codename' in headers
-			and 'nationality' in headers
-			and 'car_number' in headers
-			and 'short_link' in headers
-			and 'long_link' in headers
-		)
+	return (
+		'codename' in headers
+		and 'nationality' in headers
+		and 'car_number' in headers
+		and 'short_link' in headers
+		and 'long_link' in headers
+	)
 
 
 # Sprawdzenie, czy w bieżący katalog zawiera pliki z danymi zespołów
@@ -349,15 +401,41 @@ def save_teams_data_to_db() -> None:
 
 	print()
 
-	add_teams(teams, championship_id, plwiki_id, team_type_id)
+	report: ImportReport | None = add_teams(teams, championship_id, plwiki_id, team_type_id)
+
+	if report is None:
+		return
+
+	for codename, links in report.existing_links.items():  # type: str, list[str]
+		print('{team} ma już linki w bazie: "{short_link}", "{long_link}"'.format(
+			team=codename,
+			short_link=links[0],
+			long_link=links[1]
+		))
+
+	for codename in report.inserted:  # type: str
+		print(f'{codename} - dodano dane do bazy')
+
+	for codename in report.linked:  # type: str
+		print(f'{codename} - dodano linki do bazy')
+
+	for codename, flags in report.changed_flags.items():  # type: str, list[str]
+		print(f'{codename} był już w bazie z inną flagą: {", ".join(flags)}')
+
+	print('\nDodane zespoły: {inserted}, zespoły z dodanymi linkami: {linked}, pominięte zespoły: {skipped}'.format(
+		inserted=len(report.inserted),
+		linked=len(report.linked),
+		skipped=len(report.skipped)
+	))
 
 
 # Wybór trybu pracy skryptu
 def choose_mode() -> None:
 	options = {
 		1: 'Wygenerować plik .csv z danymi o zespołach',
-		2: 'Zapisać dane o zespołach w bazie',
-		3: 'Zakończyć działanie'
+		2: 'Wygenerować plik .csv z danymi o zespołach z wielu plików z wynikami',
+		3: 'Zapisać dane o zespołach w bazie',
+		4: 'Zakończyć działanie'
 	}
 
 	while True:
@@ -379,9 +457,12 @@ def choose_mode() -> None:
 			dump_teams_data_to_csv()
 			break
 		elif num == 2:
-			save_teams_data_to_db()
+			dump_teams_data_to_csv(many_files=True)
 			break
 		elif num == 3:
+			save_teams_data_to_db()
+			break
+		elif num == 4:
 			return
 
 
@@ -154,25 +154,23 @@ def print_classification(
 
 	abbr_list: list[LocalisedAbbreviation] = get_nonscoring_abbreviations(wiki_id)
 
-	print('\n|-')
+	# Skróty według statusu, używany jest pierwszy skrót danego statusu
+	abbreviations: dict[str, str] = dict()
 
-	position: int = 1
+	for abbr in abbr_list:
+		abbreviations.setdefault(abbr.status, abbr.abbreviation)
 
-	prev_entity: EntityResults | None = None
+	print('\n|-')
 
+	# Pozycje oblicza baza danych, tę samą pozycję zajmują kolejne podmioty z równymi punktami i wynikami
 	for entity in entities:
-		if prev_entity is not None and prev_entity.points != entity.points:
-			position += 1
-		elif prev_entity is not None and prev_entity.results != entity.results:
-			position += 1
-
 		name_cell: list[str] = list()
 
 		if rowspan == 1:
-			print(f'! {position}')
+			print(f'! {entity.position}')
 			name_cell.append('| align="left"')
 		else:
-			print(f'! rowspan="{rowspan}" | {position}')
+			print(f'! rowspan="{rowspan}" | {entity.position}')
 			name_cell.append(f'| align="left" rowspan="{rowspan}"')
 
 		if entity.car_no is not None:
@@ -217,10 +215,7 @@ def print_classification(
 						try:
 							place: int | None = int(result.place)
 						except (ValueError, TypeError):
-							place = next(
-								(abbr.abbreviation for abbr in abbr_list if abbr.status == result.place),
-								None
-							)
+							place = abbreviations.get(result.place)
 
 						if result.style.bold is not None and result.style.bold is not False:
 							cell: str = f'| style="{style}" | \'\'\'{place}\'\'\''
@@ -255,11 +250,10 @@ def print_classification(
 					print(f'! rowspan="{rowspan}" | {formatted_points}')
 				print('|-')
 
-		prev_entity = entity
-
 
 # Główna funkcja skryptu
 def main() -> None:
+	from common.db_connect import use_snapshot
 	from common.db_queries.wikipedia_table import get_wiki_id
 	from common.db_queries.classification_tables import (
 		get_classification_results,
@@ -267,6 +261,9 @@ def main() -> None:
 		check_classification_entities
 	)
 
+	# Skrypt tylko odczytuje dane, więc zapytania obsługuje kopia bazy danych w pamięci
+	use_snapshot()
+
 	# Znalezienie id polskiej wersji Wikipedii
 	plwiki_id: int | None = get_wiki_id('plwiki')
 